@@ -1,8 +1,10 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from datetime import datetime
 from typing import Optional
 
+from app.database import get_db
 from app.services.database_service import AccessRequestService, UserService
 
 router = APIRouter()
@@ -36,13 +38,13 @@ async def submit_access_request(request: AccessRequestPayload):
         raise HTTPException(status_code=500, detail=f"Failed to submit access request: {str(e)}")
 
 @router.get("/access-requests")
-async def get_access_requests(status: Optional[str] = None):
-    """Get access requests from SQL (optionally filtered by status)"""
+async def get_access_requests(status: Optional[str] = None, limit: int = 100, offset: int = 0):
+    """Get access requests from SQL (optionally filtered by status; unfiltered listing is paged)"""
     try:
         if status:
             items = AccessRequestService.get_requests_by_status(status)
         else:
-            items = AccessRequestService.get_all_requests()
+            items = AccessRequestService.get_all_requests(limit=limit, offset=offset)
         return {
             "requests": [
                 {
@@ -66,17 +68,10 @@ async def get_access_requests(status: Optional[str] = None):
         raise HTTPException(status_code=500, detail=f"Failed to retrieve access requests: {str(e)}")
 
 @router.put("/access-request/{request_id}/approve")
-async def approve_access_request(request_id: str):
+async def approve_access_request(request_id: str, db: Session = Depends(get_db)):
     """Approve an access request (SQL only)"""
     try:
-        # Get the request first to retrieve email
-        all_requests = AccessRequestService.get_all_requests()
-        current_request = next((r for r in all_requests if r["id"] == request_id), None)
-        
-        if not current_request:
-            raise HTTPException(status_code=404, detail="Request not found")
-        
-        # Update status
+        # Update status; the updated request comes back with its email and name
         request = AccessRequestService.update_request_status(
             request_id=request_id,
             status="approved",
@@ -87,15 +82,15 @@ async def approve_access_request(request_id: str):
             raise HTTPException(status_code=404, detail="Request not found")
         
         # Create user if they don't exist, or update status if they do
-        user = UserService.get_user_by_email(current_request["email"])
+        user = UserService.get_user_by_email(request["email"])
         if user:
             # User exists, just update status to active
-            UserService.update_user_status(user["id"], "active")
+            UserService.update_user_status(user["id"], "active", db=db)
         else:
             # User doesn't exist, create them
             UserService.create_user(
-                email=current_request["email"],
-                name=current_request["name"],
+                email=request["email"],
+                name=request["name"],
                 provider="credentials",  # Default provider for access requests
                 profile_pic=None
             )
@@ -23,10 +23,11 @@ from app.core.enhanced_auction import (
     calculate_enhanced_cvr,
     calculate_enhanced_quality_score
 )
+from app.core.quality_score_engine import warm_keyword_cache
 from app.core.bidding import apply_bidding_strategy
 from app.core.pacing import distribute_budget_by_hour, calculate_budget_utilization
 from app.core.constants import SIM_VERSION
-from app.core.volume_estimation import volume_engine
+from app.core.volume_estimation import get_volume_engine
 
 # Import utilities
 from app.utils.cache import generate_cache_key, get_cached_result, set_cached_result
@@ -163,6 +164,9 @@ async def run_enhanced_simulation(request: EnhancedSimulationRequest):
     keywords_data = []
     campaign_context_dict = request.campaign_context.dict() if request.campaign_context else {}
     
+    # Embed keywords needing a Quality Score in one batch before scoring them
+    warm_keyword_cache([kw.text for kw in request.keywords if kw.quality_score is None])
+    
     for kw in request.keywords:
         # Calculate enhanced Quality Score if not provided
         if kw.quality_score is None:
@@ -216,8 +220,8 @@ async def run_enhanced_simulation(request: EnhancedSimulationRequest):
         
         if kw_text not in keyword_stats:
             # Get volume data for this keyword
-            volume_data = volume_engine.get_volume_data(kw_text)
-            competition_level = volume_engine.get_competition_level(kw_text)
+            volume_data = get_volume_engine().get_volume_data(kw_text)
+            competition_level = get_volume_engine().get_competition_level(kw_text)
             
             keyword_stats[kw_text] = {
                 'text': kw_text,
@@ -198,7 +198,7 @@ async def keywords_ideas(req: KeywordIdeasRequest) -> KeywordIdeasResponse:
         if req.url and req.product_description:
             # Both URL and product description provided - use keyword_and_url_seed
             logger.info("Using keyword_and_url_seed feature")
-            keyword_data = google_ads_service.generate_keywords_from_url(
+            keyword_data = await google_ads_service.agenerate_keywords_from_url(
                 url=req.url,
                 product_description=req.product_description,
                 language=req.language,
@@ -208,7 +208,7 @@ async def keywords_ideas(req: KeywordIdeasRequest) -> KeywordIdeasResponse:
         elif req.url:
             # Only URL provided - use url_seed
             logger.info("Using url_seed feature")
-            keyword_data = google_ads_service.generate_keywords_from_url(
+            keyword_data = await google_ads_service.agenerate_keywords_from_url(
                 url=req.url,
                 product_description="",  # Empty to trigger url_seed
                 language=req.language,
@@ -218,7 +218,7 @@ async def keywords_ideas(req: KeywordIdeasRequest) -> KeywordIdeasResponse:
         elif req.product_description:
             # Only product description provided - use keyword_seed
             logger.info("Using keyword_seed feature")
-            keyword_data = google_ads_service.generate_keywords_from_url(
+            keyword_data = await google_ads_service.agenerate_keywords_from_url(
                 url="",  # Empty to trigger keyword_seed
                 product_description=req.product_description,
                 language=req.language,
@@ -321,7 +321,7 @@ async def get_historical_metrics(req: HistoricalMetricsRequest) -> HistoricalMet
             logger.info("Using Google Ads API for historical metrics")
             
             # Get historical metrics using Google Ads API
-            metrics_data = google_ads_service.get_historical_metrics(
+            metrics_data = await google_ads_service.aget_historical_metrics(
                 keywords=req.keywords,
                 language=req.language,
                 location=_get_geo_target_id(req.geo),
@@ -400,7 +400,7 @@ async def get_forecast_metrics(req: ForecastMetricsRequest) -> ForecastMetricsRe
             logger.info("Using Google Ads API for forecast metrics")
             
             # Get forecast metrics using Google Ads API
-            forecast_data = google_ads_service.get_forecast_metrics(
+            forecast_data = await google_ads_service.aget_forecast_metrics(
                 keywords=req.keywords,
                 campaign_budget=req.campaign_budget,
                 language=req.language,
@@ -511,7 +511,7 @@ async def test_keywords_api():
             }
         
         # Test with a simple keyword generation
-        test_keywords = google_ads_service.generate_keywords_from_url(
+        test_keywords = await google_ads_service.agenerate_keywords_from_url(
             url="https://example.com",
             product_description="digital marketing services",
             language="en",
@@ -6,7 +6,6 @@ from sqlalchemy.orm import Session
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
-import uuid
 
 from app.database import get_db
 from app.services.database_service import UserService, UserActivityService
@@ -197,13 +196,13 @@ async def get_users(limit: int = 100, offset: int = 0):
         )
 
 @router.get("/get-user-activities")
-async def get_user_activities(user_id: Optional[str] = None, limit: int = 50):
+async def get_user_activities(user_id: Optional[str] = None, limit: int = 50, db: Session = Depends(get_db)):
     """Get user activities from SQL Server database"""
     try:
         if user_id:
-            activities = UserActivityService.get_user_activities(user_id, limit=limit)
+            activities = UserActivityService.get_user_activities(user_id, limit=limit, db=db)
         else:
-            activities = UserActivityService.get_active_sessions()
+            activities = UserActivityService.get_active_sessions(db=db)
         
         activity_list = []
         for activity in activities:
@@ -329,10 +328,20 @@ async def debug_activities_list():
         )
 
 @router.get("/debug-user-list-sql")
-async def debug_user_list_sql(limit: int = 100, offset: int = 0):
-    """Debug endpoint to list users from SQL for frontend viewer"""
+async def debug_user_list_sql(
+    limit: int = 100,
+    offset: int = 0,
+    after_signup_timestamp: Optional[datetime] = None,
+    after_id: Optional[str] = None
+):
+    """Debug endpoint to list users from SQL for frontend viewer (pass the last row's signup_timestamp and id to page by key)"""
     try:
-        users = UserService.get_all_users(limit=limit, offset=offset)
+        users = UserService.get_all_users(
+            limit=limit,
+            offset=offset,
+            after_signup_timestamp=after_signup_timestamp,
+            after_id=after_id
+        )
         return {
             "total_users": len(users),
             "users": [
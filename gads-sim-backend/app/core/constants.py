@@ -22,6 +22,9 @@ BIDDING_STRATEGIES = {
 # Match types
 MATCH_TYPES = ["exact", "phrase", "broad"]
 
+# Keyword competition levels (index = stored competition code)
+COMPETITION_LEVELS = ("Low", "Medium", "High")
+
 # CTR base rates by position (deterministic model)
 CTR_BY_POSITION = {
     1: 0.35,
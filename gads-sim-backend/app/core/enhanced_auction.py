@@ -12,7 +12,7 @@ This module implements deterministic ad auction simulation using:
 import numpy as np
 from typing import List, Dict, Tuple, Optional
 from app.core.constants import MIN_AD_RANK, MAX_POSITION
-from app.core.volume_estimation import volume_engine, AuctionEstimate, VolumeData
+from app.core.volume_estimation import get_volume_engine, AuctionEstimate, VolumeData
 from app.core.quality_score_engine import QualityScoreEngine, AdData, KeywordData, calculate_quality_score
 
 
@@ -209,25 +209,18 @@ def simulate_volume_based_auctions(
     np.random.seed(seed)
     results = []
     
-    # Calculate total daily auctions across all keywords
-    total_daily_auctions = 0
-    keyword_auction_data = {}
-    
-    for kw in keywords:
-        # Estimate daily auctions for this keyword
-        auction_estimate = volume_engine.estimate_daily_auctions(
-            keyword=kw['text'],
-            match_type=kw.get('match_type', 'phrase'),
-            geo=geo
-        )
-        
-        keyword_auction_data[kw['text']] = auction_estimate
-        total_daily_auctions += auction_estimate.daily_auctions
+    # Estimate daily auctions for all keywords in one vectorized pass
+    daily_auctions = get_volume_engine().estimate_daily_auctions_batch(
+        [kw['text'] for kw in keywords],
+        [kw.get('match_type', 'phrase') for kw in keywords],
+        geo
+    )
+    total_daily_auctions = int(daily_auctions.sum())
+    keyword_auction_data = dict(zip((kw['text'] for kw in keywords), daily_auctions.tolist()))
     
     # Distribute auctions across keywords based on their volume
     for kw in keywords:
-        auction_estimate = keyword_auction_data[kw['text']]
-        keyword_auctions = auction_estimate.daily_auctions
+        keyword_auctions = keyword_auction_data[kw['text']]
         
         # Create ads for this keyword's auctions
         for auction_id in range(keyword_auctions):
@@ -280,7 +273,7 @@ def _generate_competitor_ads(
     competitors = []
     
     # Get competition level for this keyword
-    competition_level = volume_engine.get_competition_level(keyword)
+    competition_level = get_volume_engine().get_competition_level(keyword)
     
     # Determine number of competitors based on competition level
     competitor_counts = {
@@ -293,7 +286,7 @@ def _generate_competitor_ads(
     num_competitors = np.random.randint(min_competitors, max_competitors + 1)
     
     # Get estimated CPC range for this keyword
-    low_cpc, avg_cpc, high_cpc = volume_engine.get_estimated_cpc(keyword, match_type)
+    low_cpc, avg_cpc, high_cpc = get_volume_engine().get_estimated_cpc(keyword, match_type)
     
     for i in range(num_competitors):
         # Generate competitor bid (typically 70-130% of average CPC)
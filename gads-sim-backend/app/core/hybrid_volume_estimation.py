@@ -23,7 +23,7 @@ except ImportError:
     GOOGLE_ADS_AVAILABLE = False
 
 # Import static volume engine as fallback
-from app.core.volume_estimation import VolumeEstimationEngine, VolumeData, AuctionEstimate
+from app.core.volume_estimation import VolumeEstimationEngine, VolumeData, AuctionEstimate, get_volume_engine
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +41,6 @@ class HybridVolumeEstimationEngine:
             use_google_ads_api: Whether to use Google Ads API when available
         """
         self.use_google_ads_api = use_google_ads_api and GOOGLE_ADS_AVAILABLE
-        self.static_engine = VolumeEstimationEngine()
         
         if self.use_google_ads_api:
             try:
@@ -55,6 +54,11 @@ class HybridVolumeEstimationEngine:
             self.google_ads_service = None
             logger.info("Hybrid volume engine initialized with static data only")
     
+    @property
+    def static_engine(self) -> VolumeEstimationEngine:
+        """Shared static engine, built on first use rather than at import"""
+        return get_volume_engine()
+    
     def estimate_daily_auctions(self, keyword: str, match_type: str, geo: str) -> AuctionEstimate:
         """
         Estimate daily auctions for a keyword using the best available data source
@@ -8,9 +8,11 @@ CPC impact, and CTR boost as specified in Phase 3.
 from typing import Dict, Tuple
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True)
 class MatchTypeModifiers:
     """Match type modifiers for volume, CPC, and CTR"""
+    __slots__ = ('volume_modifier', 'cpc_impact', 'ctr_boost')
+    
     volume_modifier: float
     cpc_impact: float  # Percentage change
     ctr_boost: float   # Percentage change
@@ -5,15 +5,26 @@ This module provides comprehensive metrics breakdown by keyword, ad group,
 device, and match type for detailed analysis and visualization.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from dataclasses import dataclass
-from collections import defaultdict
+import heapq
 import pandas as pd
 import numpy as np
 
+# Preformatted position bucket labels for the common position range
+_POS_STR = tuple(f"position_{i}" for i in range(32))
+
+
+def _position_key(result: Dict[str, Any]) -> str:
+    """Position bucket label for a result, e.g. 'position_3'"""
+    position = int(result.get('position', 1))
+    return _POS_STR[position] if 0 <= position < len(_POS_STR) else f"position_{position}"
+
 @dataclass
 class MetricBreakdown:
     """Breakdown of metrics by dimension"""
+    __slots__ = ('dimension', 'values', 'totals', 'percentages')
+    
     dimension: str  # e.g., 'match_type', 'device', 'keyword'
     values: Dict[str, Dict[str, float]]  # e.g., {'exact': {'impressions': 1000, 'ctr': 0.05}}
     totals: Dict[str, float]  # Overall totals
@@ -22,6 +33,12 @@ class MetricBreakdown:
 @dataclass
 class KeywordMetrics:
     """Metrics for a single keyword"""
+    __slots__ = (
+        'keyword', 'match_type', 'impressions', 'clicks', 'conversions', 'cost',
+        'revenue', 'ctr', 'cvr', 'cpc', 'cpa', 'roas', 'position', 'quality_score',
+        'ad_rank'
+    )
+    
     keyword: str
     match_type: str
     impressions: int
@@ -55,45 +72,108 @@ class MetricsBreakdownEngine:
             'impressions', 'clicks', 'conversions', 'cost', 'revenue',
             'ctr', 'cvr', 'cpc', 'cpa', 'roas', 'position', 'quality_score'
         ]
+        # Last match type breakdown, keyed by the identity of its results list
+        # (the list is held so its id cannot be reused while cached)
+        self._mt_cache: Optional[Tuple[List[Dict[str, Any]], MetricBreakdown]] = None
     
-    def breakdown_by_match_type(self, results: List[Dict[str, Any]]) -> MetricBreakdown:
+    def _accumulate(
+        self,
+        results: List[Dict[str, Any]],
+        key_func: Callable[[Dict[str, Any]], str]
+    ) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
         """
-        Break down metrics by match type
+        Sum metric vectors per dimension value
         
         Args:
             results: List of simulation results
+            key_func: Maps a result to its dimension value
             
         Returns:
-            MetricBreakdown by match type
+            Tuple of (dimension value -> metric vector, totals vector), with
+            vectors ordered as self.metric_names
         """
-        breakdown = defaultdict(lambda: defaultdict(float))
-        totals = defaultdict(float)
+        n_metrics = len(self.metric_names)
+        breakdown: Dict[str, np.ndarray] = {}
+        totals_arr = np.zeros(n_metrics)
         
         for result in results:
-            match_type = result.get('match_type', 'unknown')
+            key = key_func(result)
+            row = np.fromiter(
+                (result.get(metric, 0) for metric in self.metric_names),
+                dtype=np.float64,
+                count=n_metrics
+            )
             
-            for metric in self.metric_names:
-                value = result.get(metric, 0)
-                breakdown[match_type][metric] += value
-                totals[metric] += value
+            acc = breakdown.get(key)
+            if acc is None:
+                acc = breakdown[key] = np.zeros(n_metrics)
+            acc += row
+            totals_arr += row
         
-        # Calculate percentages
-        percentages = {}
-        for match_type, metrics in breakdown.items():
-            percentages[match_type] = {}
-            for metric, value in metrics.items():
-                if totals[metric] > 0:
-                    percentages[match_type][metric] = (value / totals[metric]) * 100
-                else:
-                    percentages[match_type][metric] = 0
+        return breakdown, totals_arr
+    
+    def _build_breakdown(
+        self,
+        dimension: str,
+        breakdown: Dict[str, np.ndarray],
+        totals_arr: np.ndarray
+    ) -> MetricBreakdown:
+        """
+        Convert accumulated metric vectors into a MetricBreakdown
+        
+        Args:
+            dimension: Dimension name
+            breakdown: Dimension value -> metric vector
+            totals_arr: Totals vector
+            
+        Returns:
+            MetricBreakdown with values, totals and percentages
+        """
+        keys = list(breakdown.keys())
+        values = {
+            key: dict(zip(self.metric_names, vec.tolist()))
+            for key, vec in breakdown.items()
+        }
+        totals = dict(zip(self.metric_names, totals_arr.tolist()))
+        
+        # Calculate percentages in one broadcast over the (keys x metrics) matrix
+        pct = np.zeros((len(keys), len(self.metric_names)))
+        if keys:
+            arr = np.vstack([breakdown[key] for key in keys])
+            positive = totals_arr > 0
+            pct[:, positive] = arr[:, positive] / totals_arr[positive] * 100
+        percentages = {
+            key: dict(zip(self.metric_names, pct[i].tolist()))
+            for i, key in enumerate(keys)
+        }
         
         return MetricBreakdown(
-            dimension='match_type',
-            values=dict(breakdown),
-            totals=dict(totals),
+            dimension=dimension,
+            values=values,
+            totals=totals,
             percentages=percentages
         )
     
+    def breakdown_by_match_type(self, results: List[Dict[str, Any]]) -> MetricBreakdown:
+        """
+        Break down metrics by match type
+        
+        Args:
+            results: List of simulation results
+            
+        Returns:
+            MetricBreakdown by match type
+        """
+        if self._mt_cache is not None and self._mt_cache[0] is results:
+            return self._mt_cache[1]
+        
+        breakdown, totals_arr = self._accumulate(
+            results, lambda result: result.get('match_type', 'unknown')
+        )
+        match_type_breakdown = self._build_breakdown('match_type', breakdown, totals_arr)
+        self._mt_cache = (results, match_type_breakdown)
+        return match_type_breakdown
+    
     def breakdown_by_keyword(self, results: List[Dict[str, Any]]) -> MetricBreakdown:
         """
         Break down metrics by keyword
@@ -104,33 +184,10 @@ class MetricsBreakdownEngine:
         Returns:
             MetricBreakdown by keyword
         """
-        breakdown = defaultdict(lambda: defaultdict(float))
-        totals = defaultdict(float)
-        
-        for result in results:
-            keyword = result.get('keyword', 'unknown')
-            
-            for metric in self.metric_names:
-                value = result.get(metric, 0)
-                breakdown[keyword][metric] += value
-                totals[metric] += value
-        
-        # Calculate percentages
-        percentages = {}
-        for keyword, metrics in breakdown.items():
-            percentages[keyword] = {}
-            for metric, value in metrics.items():
-                if totals[metric] > 0:
-                    percentages[keyword][metric] = (value / totals[metric]) * 100
-                else:
-                    percentages[keyword][metric] = 0
-        
-        return MetricBreakdown(
-            dimension='keyword',
-            values=dict(breakdown),
-            totals=dict(totals),
-            percentages=percentages
+        breakdown, totals_arr = self._accumulate(
+            results, lambda result: result.get('keyword', 'unknown')
         )
+        return self._build_breakdown('keyword', breakdown, totals_arr)
     
     def breakdown_by_device(self, results: List[Dict[str, Any]]) -> MetricBreakdown:
         """
@@ -142,33 +199,10 @@ class MetricsBreakdownEngine:
         Returns:
             MetricBreakdown by device
         """
-        breakdown = defaultdict(lambda: defaultdict(float))
-        totals = defaultdict(float)
-        
-        for result in results:
-            device = result.get('device_type', 'desktop')
-            
-            for metric in self.metric_names:
-                value = result.get(metric, 0)
-                breakdown[device][metric] += value
-                totals[metric] += value
-        
-        # Calculate percentages
-        percentages = {}
-        for device, metrics in breakdown.items():
-            percentages[device] = {}
-            for metric, value in metrics.items():
-                if totals[metric] > 0:
-                    percentages[device][metric] = (value / totals[metric]) * 100
-                else:
-                    percentages[device][metric] = 0
-        
-        return MetricBreakdown(
-            dimension='device',
-            values=dict(breakdown),
-            totals=dict(totals),
-            percentages=percentages
+        breakdown, totals_arr = self._accumulate(
+            results, lambda result: result.get('device_type', 'desktop')
         )
+        return self._build_breakdown('device', breakdown, totals_arr)
     
     def breakdown_by_position(self, results: List[Dict[str, Any]]) -> MetricBreakdown:
         """
@@ -180,33 +214,8 @@ class MetricsBreakdownEngine:
         Returns:
             MetricBreakdown by position
         """
-        breakdown = defaultdict(lambda: defaultdict(float))
-        totals = defaultdict(float)
-        
-        for result in results:
-            position = f"position_{int(result.get('position', 1))}"
-            
-            for metric in self.metric_names:
-                value = result.get(metric, 0)
-                breakdown[position][metric] += value
-                totals[metric] += value
-        
-        # Calculate percentages
-        percentages = {}
-        for position, metrics in breakdown.items():
-            percentages[position] = {}
-            for metric, value in metrics.items():
-                if totals[metric] > 0:
-                    percentages[position][metric] = (value / totals[metric]) * 100
-                else:
-                    percentages[position][metric] = 0
-        
-        return MetricBreakdown(
-            dimension='position',
-            values=dict(breakdown),
-            totals=dict(totals),
-            percentages=percentages
-        )
+        breakdown, totals_arr = self._accumulate(results, _position_key)
+        return self._build_breakdown('position', breakdown, totals_arr)
     
     def create_comprehensive_breakdown(self, results: List[Dict[str, Any]]) -> Dict[str, MetricBreakdown]:
         """
@@ -235,6 +244,7 @@ class MetricsBreakdownEngine:
         Returns:
             Summary table data
         """
+        # Reuses the cached breakdown when create_comprehensive_breakdown ran first
         match_type_breakdown = self.breakdown_by_match_type(results)
         
         # Create table format
@@ -266,12 +276,12 @@ class MetricsBreakdownEngine:
         Returns:
             List of top performing keywords
         """
-        # Sort by metric (descending)
-        sorted_results = sorted(results, key=lambda x: x.get(metric, 0), reverse=True)
+        # Partial selection of the top `limit` results (descending) - O(N log limit)
+        top_results = heapq.nlargest(limit, results, key=lambda x: x.get(metric, 0))
         
         # Return top performers with additional metrics
         top_performers = []
-        for i, result in enumerate(sorted_results[:limit]):
+        for i, result in enumerate(top_results):
             performer = {
                 'rank': i + 1,
                 'keyword': result.get('keyword', 'Unknown'),
@@ -5,9 +5,38 @@ This module handles budget distribution across hours of the day
 to simulate realistic ad serving patterns.
 """
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Sequence
 from app.core.constants import HOURLY_PACING
 
+# Numba is optional - fall back to the plain NumPy kernel when unavailable
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Default pacing normalized to sum to 1.0, plus the remaining share of the
+# day from each hour onwards (_TAIL_SUMS[h] == sum(_NORM_PACING[h:]))
+_NORM_PACING = np.asarray(HOURLY_PACING, dtype=np.float64) / sum(HOURLY_PACING)
+_TAIL_SUMS = np.cumsum(_NORM_PACING[::-1])[::-1]
+
+# Pacing type -> index into _PACING_MOD (unknown types pace as 'standard')
+_PACING_CODE = {'standard': 0, 'accelerated': 1, 'conservative': 2}
+_PACING_MOD = np.array([1.0, 1.3, 0.8])
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _apply_pacing_batch(impressions: np.ndarray, codes: np.ndarray, mods: np.ndarray) -> np.ndarray:
+        """Scale each impression count by its pacing modifier, truncating to int"""
+        out = np.empty(impressions.shape[0], dtype=np.int64)
+        for i in range(impressions.shape[0]):
+            out[i] = int(impressions[i] * mods[codes[i]])
+        return out
+else:
+    def _apply_pacing_batch(impressions: np.ndarray, codes: np.ndarray, mods: np.ndarray) -> np.ndarray:
+        """Scale each impression count by its pacing modifier, truncating to int"""
+        return (impressions * mods[codes]).astype(np.int64)
+
 
 def distribute_budget_by_hour(daily_budget: float, custom_pacing: List[float] = None) -> List[float]:
     """
@@ -48,16 +77,31 @@ def apply_pacing_modifier(
     Returns:
         Modified impression count
     """
-    if pacing_type == "accelerated":
-        # Deliver ads faster - less budget spreading
-        modifier = 1.3
-    elif pacing_type == "conservative":
-        # Deliver ads more evenly - more budget spreading
-        modifier = 0.8
-    else:  # standard
-        modifier = 1.0
+    # accelerated (1.3) delivers faster, conservative (0.8) spreads budget more evenly
+    return int(impressions * _PACING_MOD[_PACING_CODE.get(pacing_type, 0)])
+
+
+def apply_pacing_modifier_batch(
+    impressions: Sequence[float],
+    pacing_types: Sequence[str]
+) -> np.ndarray:
+    """
+    Apply pacing modifiers to a batch of impression counts
     
-    return int(impressions * modifier)
+    Args:
+        impressions: Base impression counts
+        pacing_types: Pacing type for each impression count
+        
+    Returns:
+        Array of modified impression counts (int64)
+    """
+    impressions_arr = np.asarray(impressions, dtype=np.float64)
+    codes = np.fromiter(
+        (_PACING_CODE.get(p, 0) for p in pacing_types),
+        dtype=np.int64,
+        count=len(pacing_types)
+    )
+    return _apply_pacing_batch(impressions_arr, codes, _PACING_MOD)
 
 
 def calculate_budget_utilization(
@@ -108,17 +152,18 @@ def get_hourly_budget_recommendation(
     Returns:
         Recommended budget for current hour
     """
-    hourly_budgets = distribute_budget_by_hour(daily_budget)
-    remaining_budget = daily_budget - spent_so_far
+    # No hours left in the day
+    if current_hour >= len(_TAIL_SUMS):
+        return 0.0
     
-    # Sum remaining hourly allocations
-    remaining_hours_budget = sum(hourly_budgets[current_hour:])
+    # Sum of remaining hourly allocations, read from the precomputed tail sums
+    remaining_hours_budget = daily_budget * float(_TAIL_SUMS[current_hour])
     
-    if remaining_hours_budget == 0:
-        return 0
+    if remaining_hours_budget <= 0:
+        return 0.0
     
     # Proportionally adjust remaining budget
-    adjustment_factor = remaining_budget / remaining_hours_budget
-    recommended = hourly_budgets[current_hour] * adjustment_factor
+    adjustment_factor = (daily_budget - spent_so_far) / remaining_hours_budget
+    recommended = daily_budget * float(_NORM_PACING[current_hour]) * adjustment_factor
     
-    return max(0, round(recommended, 2))
+    return max(0.0, round(recommended, 2))
@@ -12,12 +12,22 @@ Scale: 1-10 (like Google Ads)
 
 import os
 import re
+import contextlib
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import numpy as np
+from collections import OrderedDict
+from diskcache import Cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
 from urllib.parse import urlparse
 import logging
+from app.core.constants import CACHE_TTL_SECONDS
 
 # Import Gemini AI for semantic analysis
 try:
@@ -28,13 +38,267 @@ except ImportError:
 
 # Import sentence transformers for offline semantic similarity
 try:
-    from sentence_transformers import SentenceTransformer, util
+    import torch
+    from sentence_transformers import SentenceTransformer
     SENTENCE_TRANSFORMERS_AVAILABLE = True
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
 
+# Import ONNX Runtime (via optimum) for int8-quantized sentence embeddings
+try:
+    from optimum.onnxruntime import ORTModelForFeatureExtraction
+    from transformers import AutoTokenizer
+    ONNX_RUNTIME_AVAILABLE = True
+except ImportError:
+    ONNX_RUNTIME_AVAILABLE = False
+
+# Import selectolax for fast HTML parsing of landing pages
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Numba is optional - the batch CTR kernel falls back to plain NumPy
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Import Aho-Corasick automaton for bulk keyword intent classification
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Gemini model used to precompute relevance scores, and pairs per request
+GEMINI_MODEL_NAME = 'gemini-1.5-flash'
+GEMINI_RELEVANCE_BATCH_SIZE = 20
+
+# Sentence embedding model and the on-disk location of its int8 ONNX export
+# (built by build_onnx_model.py; resolved against the backend directory, not the CWD)
+SENTENCE_MODEL_NAME = 'all-MiniLM-L6-v2'
+ONNX_MODEL_DIR = os.getenv(
+    'QS_ONNX_MODEL_DIR',
+    str(Path(__file__).resolve().parents[2] / 'models' / 'minilm-int8')
+)
+ONNX_QUANTIZED_FILE = 'model_quantized.onnx'
+
+# Persistent (SQLite-backed) cache for landing page analyses and embeddings
+QS_CACHE_DIR = os.getenv('QS_CACHE_DIR', './cache/quality_score')
+QS_CACHE_SIZE_LIMIT = 2 ** 30  # 1GB
+
+# Opt-in torch.compile of the sentence transformer (slow first encode)
+QS_TORCH_COMPILE = os.getenv('QS_TORCH_COMPILE', 'false').lower() == 'true'
+
+# Opt-in PyTorch intra-op thread count; torch.set_num_threads is process-wide,
+# so 0 leaves torch's default for every other torch user in the worker
+QS_TORCH_THREADS = int(os.getenv('QS_TORCH_THREADS', '0'))
+
+# Maximum number of text embeddings kept in memory (LRU)
+EMBEDDING_CACHE_SIZE = 4096
+
+# Concurrent landing page fetches (also the HTTP connection pool size)
+LANDING_PAGE_FETCH_WORKERS = 32
+
+# Bytes of a landing page downloaded for HTML analysis
+LANDING_PAGE_MAX_BYTES = 262144
+
+# Persistent landing page scores are keyed by the signal parser (and its version)
+# that produced them, since selectolax and the substring fallback can disagree
+_LANDING_PAGE_PARSER_TAG = "selectolax-v1" if SELECTOLAX_AVAILABLE else "substring-v1"
+
+# Expected CTR adjustments by keyword attribute (unlisted values: no adjustment)
+_CTR_INTENT_BONUS = {'informational': 0.01, 'navigational': 0.02, 'transactional': 0.03}
+_CTR_MATCH_BONUS = {'exact': 0.02, 'phrase': 0.01}
+_CTR_COMPETITION_DELTA = {'low': 0.01, 'high': -0.01}
+
+def _ctr_code_table(deltas: Dict[str, float]) -> Tuple[Dict[str, int], np.ndarray]:
+    """Encode a delta table as (value -> code, code -> delta array); the extra
+    last code is the no-adjustment code for unlisted values"""
+    return {value: code for code, value in enumerate(deltas)}, np.array(list(deltas.values()) + [0.0])
+
+# Integer-coded versions of the tables above for the batch path
+_CTR_INTENT_CODES, _CTR_INTENT_ARR = _ctr_code_table(_CTR_INTENT_BONUS)
+_CTR_MATCH_CODES, _CTR_MATCH_ARR = _ctr_code_table(_CTR_MATCH_BONUS)
+_CTR_COMPETITION_CODES, _CTR_COMPETITION_ARR = _ctr_code_table(_CTR_COMPETITION_DELTA)
+
+# Extension bonus by number of extensions (4 or more share the last entry)
+_EXT_BONUS = (1.0, 1.1, 1.2, 1.3, 1.5)
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True)
+    def _ctr_kernel(intent_codes, match_codes, competition_codes, keyword_in_ad, is_mobile,
+                    many_extensions, intent_bonus, match_bonus, competition_delta):
+        """Expected CTR for each encoded (ad, keyword) pair in one fused pass"""
+        n = intent_codes.shape[0]
+        out = np.empty(n)
+        for i in prange(n):
+            x = 0.03
+            x += intent_bonus[intent_codes[i]]
+            x += match_bonus[match_codes[i]]
+            if keyword_in_ad[i]:
+                x += 0.02
+            if is_mobile[i]:
+                x += 0.01
+            if many_extensions[i]:
+                x += 0.01
+            x += competition_delta[competition_codes[i]]
+            out[i] = min(1.0, max(0.01, x))
+        return out
+    
+    # Compile the CTR kernel for the batch path's argument types now rather than
+    # on the first simulation request
+    _ctr_kernel(
+        np.zeros(1, dtype=np.int8), np.zeros(1, dtype=np.int8), np.zeros(1, dtype=np.int8),
+        np.zeros(1, dtype=bool), np.zeros(1, dtype=bool), np.zeros(1, dtype=bool),
+        _CTR_INTENT_ARR, _CTR_MATCH_ARR, _CTR_COMPETITION_ARR
+    )
+else:
+    def _ctr_kernel(intent_codes, match_codes, competition_codes, keyword_in_ad, is_mobile,
+                    many_extensions, intent_bonus, match_bonus, competition_delta):
+        """Expected CTR for each encoded (ad, keyword) pair"""
+        base_ctr = np.full(intent_codes.shape[0], 0.03)
+        base_ctr += intent_bonus[intent_codes]
+        base_ctr += match_bonus[match_codes]
+        base_ctr += np.where(keyword_in_ad, 0.02, 0.0)
+        base_ctr += np.where(is_mobile, 0.01, 0.0)
+        base_ctr += np.where(many_extensions, 0.01, 0.0)
+        base_ctr += competition_delta[competition_codes]
+        return np.clip(base_ctr, 0.01, 1.0)
+
+# Ad copy words that signal transactional intent alignment
+TRANSACTIONAL_AD_WORDS = frozenset(["buy", "purchase", "order", "shop", "price", "deal", "sale"])
+
+# Word tokenizer shared by the rule-based relevance checks
+_WORD_RE = re.compile(r"\w+")
+
+# Intent classes in classification priority order
+INTENT_PRIORITY = ("transactional", "navigational", "informational")
+
+# Matches patterns of the form \b(word|word|...)\b
+_LITERAL_ALTERNATION = re.compile(r'^\\b\(([\w |]+)\)\\b$')
+
+def _pattern_alternatives(pattern: str) -> Optional[List[str]]:
+    """Literal alternatives of a simple word alternation pattern, else None"""
+    match = _LITERAL_ALTERNATION.match(pattern)
+    return match.group(1).split('|') if match else None
+
+def _is_word_char(char: str) -> bool:
+    """Equivalent of regex \\w for a single character"""
+    return char.isalnum() or char == '_'
+
+# URL heuristics as (field, score delta, patterns); a group applies at most once
+_URL_HEURISTICS = (
+    ('domain', -0.3, ('localhost', 'test', 'demo', 'example')),  # Low-quality domains
+    ('domain', 0.1, ('google.com', 'microsoft.com', 'apple.com', 'amazon.com', 'facebook.com')),
+    ('path', 0.05, ('/landing', '/lp', '/offer', '/deal')),  # Landing page optimization
+    ('path', -0.4, ('/404', '/error', '/not-found')),  # Problematic pages
+)
+
+def _build_url_automaton():
+    """Aho-Corasick automaton mapping each URL pattern to its heuristic group"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for group, (_, _, patterns) in enumerate(_URL_HEURISTICS):
+        for pattern in patterns:
+            automaton.add_word(pattern, (group, len(pattern)))
+    automaton.make_automaton()
+    return automaton
+
+_URL_AUTOMATON = _build_url_automaton()
+
+def _matched_url_groups(domain: str, path: str) -> set:
+    """Indices of the _URL_HEURISTICS groups matching a domain and path"""
+    if _URL_AUTOMATON is None:
+        fields = {'domain': domain, 'path': path}
+        return {
+            group for group, (field, _, patterns) in enumerate(_URL_HEURISTICS)
+            if any(pattern in fields[field] for pattern in patterns)
+        }
+    
+    # Single pass over "domain|path"; the match position tells which field it hit
+    groups = set()
+    for end, (group, length) in _URL_AUTOMATON.iter(f"{domain}|{path}"):
+        field = _URL_HEURISTICS[group][0]
+        start = end - length + 1
+        if (field == 'domain' and end < len(domain)) or (field == 'path' and start > len(domain)):
+            groups.add(group)
+    return groups
+
+@lru_cache(maxsize=8192)
+def _score_url_key(is_https: bool, domain: str, path: str, long_url: bool) -> float:
+    """
+    Heuristic landing page score from the parts of a URL that matter
+    
+    Args:
+        is_https: Whether the URL uses HTTPS
+        domain: Lowercased network location
+        path: Lowercased URL path
+        long_url: Whether the full URL is longer than 100 characters
+        
+    Returns:
+        Landing page score (0.1 to 1.0)
+    """
+    score = 1.0  # Start with perfect score
+    
+    # HTTPS check
+    if not is_https:
+        score -= 0.1
+    
+    # Domain and path pattern heuristics, applied in table order
+    matched_groups = _matched_url_groups(domain, path)
+    for group, (_, delta, _) in enumerate(_URL_HEURISTICS):
+        if group in matched_groups:
+            score += delta
+    
+    # URL length penalty (very long URLs)
+    if long_url:
+        score -= 0.05
+    
+    # Subdomain analysis
+    subdomain = domain.split('.')[0] if '.' in domain else ''
+    if subdomain in ['www', 'shop', 'store', 'app']:
+        score += 0.02  # Professional subdomains
+    
+    return max(0.1, min(1.0, round(score, 2)))
+
+def _landing_page_signals(html: str) -> Dict[str, bool]:
+    """
+    Detect landing page quality signals in (the start of) an HTML document
+    
+    Args:
+        html: HTML source
+        
+    Returns:
+        Dictionary of signal name -> present
+    """
+    if SELECTOLAX_AVAILABLE:
+        tree = HTMLParser(html)
+        return {
+            'viewport': tree.css_first('meta[name="viewport"]') is not None,
+            'structured_data': tree.css_first('script[type="application/ld+json"]') is not None,
+            'title': tree.css_first('title') is not None,
+            'meta_description': tree.css_first('meta[name="description"]') is not None,
+            'loading_indicator': tree.css_first(
+                '[class*="loading"], [class*="spinner"], [id*="loading"], [id*="spinner"]'
+            ) is not None,
+        }
+    
+    html = html.lower()
+    return {
+        'viewport': "viewport" in html,
+        'structured_data': "application/ld+json" in html,
+        'title': "<title>" in html,
+        'meta_description': 'name="description"' in html,
+        'loading_indicator': "loading" in html or "spinner" in html,
+    }
+
 @dataclass
 class AdData:
     """Ad data structure"""
@@ -45,6 +309,22 @@ class AdData:
     extensions: List[str] = None
     device_targeting: str = "all"  # mobile, desktop, all
     ad_type: str = "search"  # search, display, shopping
+    # Derived from headlines + descriptions once, at construction
+    _content: str = field(init=False, repr=False, compare=False)
+    _content_lower: str = field(init=False, repr=False, compare=False)
+    _content_tokens: frozenset = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._content = " ".join(self.headlines + self.descriptions)
+        self._content_lower = self._content.lower()
+        self._content_tokens = frozenset(_WORD_RE.findall(self._content_lower))
+
+def _relevance_key(ad: AdData, keyword_text: str) -> Tuple[str, bytes]:
+    """Lookup key for a precomputed relevance score"""
+    return (
+        keyword_text.lower().strip(),
+        hashlib.blake2b(ad._content.encode('utf-8'), digest_size=16).digest()
+    )
 
 @dataclass
 class KeywordData:
@@ -64,6 +344,75 @@ class QualityScoreComponents:
     raw_score: float
     final_score: float
 
+class OnnxSentenceEncoder:
+    """
+    int8-quantized ONNX Runtime replacement for SentenceTransformer.encode
+    
+    Loads a model pre-built by build_onnx_model.py and serves embeddings via
+    the CPU execution provider with mean pooling in NumPy.
+    """
+    
+    def __init__(self, model_dir: str = ONNX_MODEL_DIR):
+        """
+        Load the quantized model
+        
+        Args:
+            model_dir: Directory holding the quantized ONNX model and tokenizer
+            
+        Raises:
+            FileNotFoundError: If the model has not been built
+        """
+        model_path = Path(model_dir)
+        if not (model_path / ONNX_QUANTIZED_FILE).exists():
+            raise FileNotFoundError(f"No quantized ONNX model at {model_path} (run build_onnx_model.py)")
+        
+        self.tokenizer = AutoTokenizer.from_pretrained(model_path)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            model_path, file_name=ONNX_QUANTIZED_FILE, provider="CPUExecutionProvider"
+        )
+    
+    def encode(
+        self,
+        sentences: List[str],
+        batch_size: int = 32,
+        convert_to_numpy: bool = True,
+        normalize_embeddings: bool = False,
+        show_progress_bar: bool = False
+    ) -> np.ndarray:
+        """
+        Encode sentences into mean-pooled embeddings
+        
+        Args:
+            sentences: Texts to encode
+            batch_size: Texts per ONNX Runtime call
+            convert_to_numpy: Accepted for API compatibility (always NumPy)
+            normalize_embeddings: L2-normalize the embeddings
+            show_progress_bar: Accepted for API compatibility (ignored)
+            
+        Returns:
+            Array of shape (len(sentences), embedding_dim)
+        """
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            inputs = self.tokenizer(
+                sentences[start:start + batch_size],
+                padding=True,
+                truncation=True,
+                max_length=256,
+                return_tensors="np"
+            )
+            token_embeddings = np.asarray(self.model(**inputs).last_hidden_state)
+            
+            # Mean pooling over non-padding tokens
+            mask = inputs["attention_mask"][..., None].astype(token_embeddings.dtype)
+            pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            
+            if normalize_embeddings:
+                pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            batches.append(pooled)
+        
+        return np.vstack(batches)
+
 class QualityScoreEngine:
     """
     Realistic Quality Score calculation engine based on Google Ads methodology
@@ -79,13 +428,34 @@ class QualityScoreEngine:
         self.gemini_api_key = gemini_api_key or os.getenv('GEMINI_API_KEY')
         self.gemini_model = None
         self.sentence_model = None
+        # Identifies the embedding model in persistent cache keys
+        self._embedding_model_tag = None
         
         # Initialize AI models
         self._init_gemini()
         self._init_sentence_transformers()
         
-        # Cache for landing page scores
-        self.lp_cache = {}
+        # Shared HTTP session so landing page fetches reuse pooled connections
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=LANDING_PAGE_FETCH_WORKERS,
+            pool_maxsize=LANDING_PAGE_FETCH_WORKERS
+        )
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
+        
+        # Precomputed Gemini relevance scores keyed by (keyword, ad content digest)
+        self._gemini_cache: Dict[Tuple[str, bytes], float] = {}
+        
+        # LRU cache of normalized text embeddings keyed by content digest
+        self._emb_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        
+        # Persistent cache shared across restarts (None if it cannot be opened)
+        try:
+            self._disk_cache = Cache(QS_CACHE_DIR, size_limit=QS_CACHE_SIZE_LIMIT)
+        except Exception as e:
+            logger.warning(f"Failed to open Quality Score disk cache: {e}")
+            self._disk_cache = None
         
         # Keyword intent patterns
         self.intent_patterns = {
@@ -102,13 +472,53 @@ class QualityScoreEngine:
                 r'\b(review|compare|best|top|list|examples)\b'
             ]
         }
+        
+        # Flat word table per intent, plus a regex for multi-word phrases and
+        # any pattern that is not a plain word list
+        self._intent_words: Dict[str, frozenset] = {}
+        self._intent_phrase_regex: Dict[str, Optional[re.Pattern]] = {}
+        for intent, patterns in self.intent_patterns.items():
+            words = set()
+            residual = []
+            for pattern in patterns:
+                alternatives = _pattern_alternatives(pattern)
+                if alternatives is None:
+                    residual.append(pattern)
+                    continue
+                words.update(alt for alt in alternatives if _WORD_RE.fullmatch(alt))
+                phrases = [alt for alt in alternatives if not _WORD_RE.fullmatch(alt)]
+                if phrases:
+                    residual.append(r'\b(' + '|'.join(map(re.escape, phrases)) + r')\b')
+            
+            self._intent_words[intent] = frozenset(words)
+            self._intent_phrase_regex[intent] = (
+                re.compile("|".join(f"(?:{p})" for p in residual), re.IGNORECASE) if residual else None
+            )
+        self._intent_automaton = self._build_intent_automaton()
+    
+    def _build_intent_automaton(self):
+        """Build an Aho-Corasick automaton over all literal intent words"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for intent, patterns in self.intent_patterns.items():
+            for pattern in patterns:
+                words = _pattern_alternatives(pattern)
+                if words is None:
+                    # Not a plain word list - bulk classification uses the regexes
+                    return None
+                for word in words:
+                    automaton.add_word(word, (intent, len(word)))
+        automaton.make_automaton()
+        return automaton
     
     def _init_gemini(self):
         """Initialize Gemini AI model"""
         if GEMINI_AVAILABLE and self.gemini_api_key:
             try:
                 genai.configure(api_key=self.gemini_api_key)
-                self.gemini_model = genai.GenerativeModel('gemini-pro')
+                self.gemini_model = genai.GenerativeModel(GEMINI_MODEL_NAME)
                 logger.info("Gemini AI model initialized successfully")
             except Exception as e:
                 logger.warning(f"Failed to initialize Gemini AI: {e}")
@@ -118,9 +528,22 @@ class QualityScoreEngine:
     
     def _init_sentence_transformers(self):
         """Initialize sentence transformers for offline semantic similarity"""
+        # Prefer the int8 ONNX model when ONNX Runtime is installed and the model was built
+        if ONNX_RUNTIME_AVAILABLE and (Path(ONNX_MODEL_DIR) / ONNX_QUANTIZED_FILE).exists():
+            try:
+                self.sentence_model = OnnxSentenceEncoder()
+                self._embedding_model_tag = f"{SENTENCE_MODEL_NAME}-onnx-int8"
+                logger.info("Quantized ONNX sentence model initialized successfully")
+                return
+            except Exception as e:
+                logger.warning(f"Failed to initialize quantized ONNX sentence model: {e}")
+                self.sentence_model = None
+        
         if SENTENCE_TRANSFORMERS_AVAILABLE:
             try:
-                self.sentence_model = SentenceTransformer('all-MiniLM-L6-v2')
+                self.sentence_model = SentenceTransformer(SENTENCE_MODEL_NAME)
+                self._embedding_model_tag = SENTENCE_MODEL_NAME
+                self._tune_torch_model()
                 logger.info("Sentence transformers model initialized successfully")
             except Exception as e:
                 logger.warning(f"Failed to initialize sentence transformers: {e}")
@@ -128,6 +551,37 @@ class QualityScoreEngine:
         else:
             logger.info("Sentence transformers not available - using rule-based methods")
     
+    def _tune_torch_model(self):
+        """Configure optional PyTorch threading, eval mode and optional compilation"""
+        if QS_TORCH_THREADS > 0:
+            torch.set_num_threads(QS_TORCH_THREADS)
+        self.sentence_model.eval()
+        
+        if QS_TORCH_COMPILE and hasattr(torch, "compile"):
+            try:
+                self.sentence_model[0].auto_model = torch.compile(
+                    self.sentence_model[0].auto_model, mode="reduce-overhead", dynamic=True
+                )
+                logger.info("Sentence transformers model compiled with torch.compile")
+            except Exception as e:
+                logger.warning(f"torch.compile failed, using eager model: {e}")
+    
+    def _encode(self, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """Encode texts into normalized embeddings without autograd bookkeeping"""
+        if SENTENCE_TRANSFORMERS_AVAILABLE and isinstance(self.sentence_model, SentenceTransformer):
+            context = torch.inference_mode()
+        else:
+            context = contextlib.nullcontext()
+        
+        with context:
+            return self.sentence_model.encode(
+                texts,
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+    
     def calculate_quality_score(
         self, 
         ad: AdData, 
@@ -153,6 +607,45 @@ class QualityScoreEngine:
         landing_page_score = self.calculate_landing_page_experience(final_url)
         extension_bonus = self.calculate_extension_bonus(ad)
         
+        return self._combine_components(expected_ctr, ad_relevance, landing_page_score, extension_bonus)
+    
+    def calculate_quality_scores(
+        self,
+        pairs: List[Tuple[AdData, KeywordData]]
+    ) -> List[QualityScoreComponents]:
+        """
+        Calculate Quality Scores for many (ad, keyword) pairs at once
+        
+        Ad relevance for all pairs is computed with a single sentence
+        transformers forward pass instead of one per pair.
+        
+        Args:
+            pairs: List of (ad, keyword) tuples; each ad's final_url is used
+            
+        Returns:
+            QualityScoreComponents for each pair, in input order
+        """
+        expected_ctrs = self.predict_expected_ctr_batch(pairs).tolist()
+        relevances = self.check_ad_relevance_bulk(pairs)
+        
+        return [
+            self._combine_components(
+                expected_ctr,
+                ad_relevance,
+                self.calculate_landing_page_experience(ad.final_url),
+                self.calculate_extension_bonus(ad)
+            )
+            for (ad, _), expected_ctr, ad_relevance in zip(pairs, expected_ctrs, relevances)
+        ]
+    
+    def _combine_components(
+        self,
+        expected_ctr: float,
+        ad_relevance: float,
+        landing_page_score: float,
+        extension_bonus: float
+    ) -> QualityScoreComponents:
+        """Combine component scores into the final Quality Score breakdown"""
         # Calculate raw Quality Score
         raw_score = expected_ctr * ad_relevance * landing_page_score * extension_bonus * 10
         
@@ -182,18 +675,10 @@ class QualityScoreEngine:
         base_ctr = 0.03  # Base CTR of 3%
         
         # Keyword intent bonus
-        if keyword.intent == "transactional":
-            base_ctr += 0.03
-        elif keyword.intent == "navigational":
-            base_ctr += 0.02
-        elif keyword.intent == "informational":
-            base_ctr += 0.01
+        base_ctr += _CTR_INTENT_BONUS.get(keyword.intent, 0.0)
         
         # Match type impact
-        if keyword.match_type == "exact":
-            base_ctr += 0.02
-        elif keyword.match_type == "phrase":
-            base_ctr += 0.01
+        base_ctr += _CTR_MATCH_BONUS.get(keyword.match_type, 0.0)
         
         # Keyword inclusion in ad
         if self._keyword_in_ad(ad, keyword.text):
@@ -208,17 +693,58 @@ class QualityScoreEngine:
             base_ctr += 0.01
         
         # Competition impact
-        if keyword.competition == "low":
-            base_ctr += 0.01
-        elif keyword.competition == "high":
-            base_ctr -= 0.01
+        base_ctr += _CTR_COMPETITION_DELTA.get(keyword.competition, 0.0)
         
         return min(1.0, max(0.01, base_ctr))  # Cap between 1% and 100%
     
+    def predict_expected_ctr_batch(self, pairs: List[Tuple[AdData, KeywordData]]) -> np.ndarray:
+        """
+        Predict Expected CTR for many (ad, keyword) pairs at once
+        
+        Vectorized equivalent of predict_expected_ctr: categorical fields are
+        encoded to integer codes and evaluated by a single (Numba-compiled
+        when available) kernel.
+        
+        Args:
+            pairs: List of (ad, keyword) tuples
+            
+        Returns:
+            Array of expected CTRs (0.01 to 1.0), in input order
+        """
+        n = len(pairs)
+        intent_codes = np.fromiter(
+            (_CTR_INTENT_CODES.get(kw.intent, len(_CTR_INTENT_CODES)) for _, kw in pairs), dtype=np.int8, count=n
+        )
+        match_codes = np.fromiter(
+            (_CTR_MATCH_CODES.get(kw.match_type, len(_CTR_MATCH_CODES)) for _, kw in pairs), dtype=np.int8, count=n
+        )
+        competition_codes = np.fromiter(
+            (_CTR_COMPETITION_CODES.get(kw.competition, len(_CTR_COMPETITION_CODES)) for _, kw in pairs), dtype=np.int8, count=n
+        )
+        keyword_in_ad = np.fromiter(
+            (self._keyword_in_ad(ad, kw.text) for ad, kw in pairs), dtype=bool, count=n
+        )
+        is_mobile = np.fromiter(
+            (ad.device_targeting == "mobile" for ad, _ in pairs), dtype=bool, count=n
+        )
+        many_extensions = np.fromiter(
+            (bool(ad.extensions) and len(ad.extensions) > 2 for ad, _ in pairs), dtype=bool, count=n
+        )
+        
+        # Same adjustments, in the same order, as predict_expected_ctr
+        return _ctr_kernel(
+            intent_codes, match_codes, competition_codes,
+            keyword_in_ad, is_mobile, many_extensions,
+            _CTR_INTENT_ARR, _CTR_MATCH_ARR, _CTR_COMPETITION_ARR
+        )
+    
     def check_ad_relevance(self, ad: AdData, keyword: KeywordData) -> float:
         """
         Check ad relevance to keyword using AI or semantic similarity
         
+        Gemini is never called here; its scores are only used when
+        precomputed with precompute_relevance.
+        
         Args:
             ad: Ad data
             keyword: Keyword data
@@ -226,12 +752,11 @@ class QualityScoreEngine:
         Returns:
             Relevance score (0.0 to 1.0)
         """
-        # Try Gemini AI first
-        if self.gemini_model:
-            try:
-                return self._check_relevance_gemini(ad, keyword)
-            except Exception as e:
-                logger.warning(f"Gemini relevance check failed: {e}")
+        # Use a precomputed Gemini score first (skip hashing the key when none exist)
+        if self._gemini_cache:
+            prior = self._gemini_cache.get(_relevance_key(ad, keyword.text))
+            if prior is not None:
+                return prior
         
         # Fall back to sentence transformers
         if self.sentence_model:
@@ -243,88 +768,261 @@ class QualityScoreEngine:
         # Fall back to rule-based method
         return self._check_relevance_rule_based(ad, keyword)
     
-    def _check_relevance_gemini(self, ad: AdData, keyword: KeywordData) -> float:
-        """Check relevance using Gemini AI"""
-        headlines_text = " ".join(ad.headlines)
-        descriptions_text = " ".join(ad.descriptions)
+    def check_ad_relevance_bulk(self, pairs: List[Tuple[AdData, KeywordData]]) -> List[float]:
+        """
+        Check ad relevance for many (ad, keyword) pairs
         
-        prompt = f"""
-        Score the semantic relevance of the following ad to the keyword '{keyword.text}'.
+        Args:
+            pairs: List of (ad, keyword) tuples
+            
+        Returns:
+            Relevance scores (0.0 to 1.0), in input order
+        """
+        if self._gemini_cache:
+            scores = [self._gemini_cache.get(_relevance_key(ad, keyword.text)) for ad, keyword in pairs]
+        else:
+            scores = [None] * len(pairs)
+        pending = [i for i, score in enumerate(scores) if score is None]
+        
+        if self.sentence_model and pending:
+            try:
+                bulk_scores = self._check_relevance_sentence_transformers_bulk([pairs[i] for i in pending])
+                for i, score in zip(pending, bulk_scores):
+                    scores[i] = score
+                return scores
+            except Exception as e:
+                logger.warning(f"Sentence transformers bulk relevance check failed: {e}")
+        
+        for i in pending:
+            scores[i] = self.check_ad_relevance(*pairs[i])
+        return scores
+    
+    def precompute_relevance(self, keywords: List[str], ads: List[AdData]) -> int:
+        """
+        Precompute Gemini relevance scores for every keyword x ad combination
+        
+        Pairs are scored in batches of GEMINI_RELEVANCE_BATCH_SIZE per prompt
+        and stored as a lookup table consulted by check_ad_relevance.
+        
+        Args:
+            keywords: Keyword texts
+            ads: Ads to score against each keyword
+            
+        Returns:
+            Number of pairs newly scored
+        """
+        if not self.gemini_model:
+            logger.info("Gemini AI not available - skipping relevance precomputation")
+            return 0
         
-        Keyword: {keyword.text}
-        Match Type: {keyword.match_type}
-        Intent: {keyword.intent}
+        pairs = [
+            (keyword, ad) for keyword in dict.fromkeys(keywords) for ad in ads
+            if _relevance_key(ad, keyword) not in self._gemini_cache
+        ]
         
-        Ad Headlines: {headlines_text}
-        Ad Descriptions: {descriptions_text}
+        scored = 0
+        for start in range(0, len(pairs), GEMINI_RELEVANCE_BATCH_SIZE):
+            batch = pairs[start:start + GEMINI_RELEVANCE_BATCH_SIZE]
+            scores = self._score_relevance_gemini(batch)
+            if scores is None:
+                continue
+            for (keyword, ad), score in zip(batch, scores):
+                self._gemini_cache[_relevance_key(ad, keyword)] = score
+            scored += len(batch)
+        
+        return scored
+    
+    def _score_relevance_gemini(self, batch: List[Tuple[str, AdData]]) -> Optional[List[float]]:
+        """Score a batch of (keyword, ad) pairs with one Gemini request"""
+        pair_lines = "\n".join(
+            f"{i}. Keyword: {keyword} | Ad Headlines: {' '.join(ad.headlines)} | "
+            f"Ad Descriptions: {' '.join(ad.descriptions)}"
+            for i, (keyword, ad) in enumerate(batch, 1)
+        )
+        
+        prompt = f"""
+        Score the semantic relevance of each ad to its keyword.
         
         Consider:
         - Semantic similarity between keyword and ad content
         - Intent alignment (informational vs transactional)
-        - Match type appropriateness
         
-        Output only a number between 0.0 and 1.0 (e.g., 0.85).
+        Pairs:
+        {pair_lines}
+        
+        Output only a JSON array of {len(batch)} numbers between 0.0 and 1.0,
+        one per pair, in order (e.g., [0.85, 0.4]).
         """
         
         try:
-            response = self.gemini_model.generate_content(prompt)
-            score_text = response.text.strip()
+            response = self.gemini_model.generate_content(
+                prompt, generation_config={"response_mime_type": "application/json"}
+            )
+            scores = json.loads(response.text)
+            if not isinstance(scores, list) or len(scores) != len(batch):
+                raise ValueError(f"expected {len(batch)} scores, got {scores!r}")
+            return [min(1.0, max(0.0, float(score))) for score in scores]
             
-            # Extract number from response
-            score_match = re.search(r'0\.\d+|1\.0', score_text)
-            if score_match:
-                return float(score_match.group())
-            else:
-                # Fallback parsing
-                return float(score_text.split()[0]) if score_text.replace('.', '').isdigit() else 0.5
-                
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
-            return 0.5
+            return None
     
     def _check_relevance_sentence_transformers(self, ad: AdData, keyword: KeywordData) -> float:
         """Check relevance using sentence transformers"""
         try:
             # Combine ad content
-            ad_content = " ".join(ad.headlines + ad.descriptions)
+            ad_content = ad._content
             
-            # Get embeddings
-            keyword_embedding = self.sentence_model.encode([keyword.text])
-            ad_embedding = self.sentence_model.encode([ad_content])
+            # Get embeddings (cache misses are encoded in a single forward pass)
+            keyword_embedding, ad_embedding = self._embed_texts([keyword.text, ad_content])
             
-            # Calculate cosine similarity
-            similarity = util.cos_sim(keyword_embedding, ad_embedding)[0][0]
+            # Embeddings are normalized, so cosine similarity is a dot product
+            similarity = float(np.dot(keyword_embedding, ad_embedding))
             
             # Convert to 0-1 scale (cosine similarity is -1 to 1)
-            relevance_score = (similarity + 1) / 2
-            
-            return float(relevance_score)
+            return (similarity + 1) * 0.5
             
         except Exception as e:
             logger.error(f"Sentence transformers error: {e}")
             return 0.5
     
+    def _embed_texts(self, texts: List[str], batch_size: int = 64) -> List[np.ndarray]:
+        """
+        Get normalized sentence embeddings, encoding only uncached texts
+        
+        Args:
+            texts: Texts to embed
+            batch_size: Encoder batch size for the uncached texts
+            
+        Returns:
+            Embedding vector for each text, in input order
+        """
+        keys = [hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest() for text in texts]
+        
+        embeddings = {}
+        missing: Dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            embedding = self._emb_cache.get(key)
+            if embedding is None:
+                embedding = self._disk_cache_get(self._embedding_cache_key(key))
+                if embedding is not None:
+                    self._emb_cache[key] = embedding
+            else:
+                self._emb_cache.move_to_end(key)
+            
+            if embedding is None:
+                missing[key] = text
+            else:
+                embeddings[key] = embedding
+        
+        if missing:
+            encoded = self._encode(list(missing.values()), batch_size=batch_size)
+            for key, embedding in zip(missing, encoded):
+                self._emb_cache[key] = embedding
+                embeddings[key] = embedding
+                self._disk_cache_set(self._embedding_cache_key(key), embedding)
+        
+        while len(self._emb_cache) > EMBEDDING_CACHE_SIZE:
+            self._emb_cache.popitem(last=False)
+        
+        return [embeddings[key] for key in keys]
+    
+    def warm_keyword_cache(self, keywords: List[str]) -> int:
+        """
+        Embed all keywords of a simulation up-front in one batch
+        
+        Args:
+            keywords: Keyword texts
+            
+        Returns:
+            Number of keywords that were not already in the in-memory cache
+        """
+        if not self.sentence_model:
+            return 0
+        
+        keywords = list(dict.fromkeys(keywords))
+        cached = sum(
+            hashlib.blake2b(kw.encode('utf-8'), digest_size=16).digest() in self._emb_cache
+            for kw in keywords
+        )
+        try:
+            # Goes through the bounded embedding LRU so warmed keywords are evicted like any other
+            self._embed_texts(keywords, batch_size=128)
+        except Exception as e:
+            logger.warning(f"Keyword embedding warm-up failed: {e}")
+            return 0
+        
+        return len(keywords) - cached
+    
+    def _embedding_cache_key(self, digest: bytes) -> str:
+        """Persistent cache key for an embedding, versioned by embedding model"""
+        return f"emb:{self._embedding_model_tag}:{digest.hex()}"
+    
+    def _disk_cache_get(self, key: str) -> Any:
+        """Read from the persistent cache, returning None on miss or error"""
+        if self._disk_cache is None:
+            return None
+        try:
+            return self._disk_cache.get(key)
+        except Exception as e:
+            logger.warning(f"Quality Score disk cache read failed: {e}")
+            return None
+    
+    def _disk_cache_set(self, key: str, value: Any):
+        """Write to the persistent cache, ignoring errors"""
+        if self._disk_cache is None:
+            return
+        try:
+            self._disk_cache.set(key, value, expire=CACHE_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Quality Score disk cache write failed: {e}")
+    
+    def _check_relevance_sentence_transformers_bulk(
+        self,
+        pairs: List[Tuple[AdData, KeywordData]]
+    ) -> List[float]:
+        """Check relevance for many pairs using one sentence transformers batch"""
+        # Deduplicate texts so each keyword and ad is encoded once
+        keyword_index: Dict[str, int] = {}
+        ad_index: Dict[str, int] = {}
+        pair_indices = []
+        for ad, keyword in pairs:
+            ad_content = ad._content
+            k = keyword_index.setdefault(keyword.text, len(keyword_index))
+            a = ad_index.setdefault(ad_content, len(ad_index))
+            pair_indices.append((k, a))
+        
+        embeddings = self._embed_texts(list(keyword_index) + list(ad_index))
+        keyword_embeddings = np.vstack(embeddings[:len(keyword_index)])
+        ad_embeddings = np.vstack(embeddings[len(keyword_index):])
+        
+        # Normalized embeddings: cosine similarity is a plain matmul
+        similarities = (keyword_embeddings @ ad_embeddings.T).tolist()
+        
+        # Convert to 0-1 scale (cosine similarity is -1 to 1)
+        return [(similarities[k][a] + 1) / 2 for k, a in pair_indices]
+    
     def _check_relevance_rule_based(self, ad: AdData, keyword: KeywordData) -> float:
         """Check relevance using rule-based method"""
         score = 0.5  # Base score
         
         keyword_lower = keyword.text.lower()
-        ad_content = " ".join(ad.headlines + ad.descriptions).lower()
+        ad_content = ad._content_lower
         
         # Exact keyword match
         if keyword_lower in ad_content:
             score += 0.3
         
-        # Partial keyword match
-        keyword_words = keyword_lower.split()
-        matched_words = sum(1 for word in keyword_words if word in ad_content)
+        # Partial keyword match (whole words, via set membership)
+        ad_tokens = ad._content_tokens
+        keyword_words = _WORD_RE.findall(keyword_lower)
+        matched_words = sum(1 for word in keyword_words if word in ad_tokens)
         if matched_words > 0:
             score += 0.2 * (matched_words / len(keyword_words))
         
         # Intent alignment
         if keyword.intent == "transactional":
-            transactional_words = ["buy", "purchase", "order", "shop", "price", "deal", "sale"]
-            if any(word in ad_content for word in transactional_words):
+            if not TRANSACTIONAL_AD_WORDS.isdisjoint(ad_tokens):
                 score += 0.1
         
         return min(1.0, score)
@@ -339,14 +1037,8 @@ class QualityScoreEngine:
         Returns:
             Landing page score (0.1 to 1.0)
         """
-        # Check cache first
-        if url in self.lp_cache:
-            return self.lp_cache[url]
-        
         try:
-            score = self._analyze_landing_page_offline(url)
-            self.lp_cache[url] = score
-            return score
+            return self._analyze_landing_page_offline(url)
         except Exception as e:
             logger.warning(f"Landing page analysis failed for {url}: {e}")
             return 0.5  # Default score
@@ -354,47 +1046,15 @@ class QualityScoreEngine:
     def _analyze_landing_page_offline(self, url: str) -> float:
         """Analyze landing page using offline method (no HTTP requests)"""
         try:
-            # Parse URL to extract domain information
-            from urllib.parse import urlparse
+            # Only scheme, domain, path and overall length affect the score, so
+            # URLs differing in query string share a cache entry
             parsed_url = urlparse(url)
-            domain = parsed_url.netloc.lower()
-            
-            score = 1.0  # Start with perfect score
-            
-            # HTTPS check
-            if not url.startswith("https://"):
-                score -= 0.1
-            
-            # Domain quality heuristics
-            if any(keyword in domain for keyword in ['localhost', 'test', 'demo', 'example']):
-                score -= 0.3
-            
-            # Common high-quality domains get bonus
-            high_quality_domains = ['google.com', 'microsoft.com', 'apple.com', 'amazon.com', 'facebook.com']
-            if any(hq_domain in domain for hq_domain in high_quality_domains):
-                score += 0.1
-            
-            # URL structure analysis
-            path = parsed_url.path.lower()
-            
-            # Check for common landing page patterns
-            if any(pattern in path for pattern in ['/landing', '/lp', '/offer', '/deal']):
-                score += 0.05  # Landing page optimization
-            
-            # Check for problematic patterns
-            if any(pattern in path for pattern in ['/404', '/error', '/not-found']):
-                score -= 0.4
-            
-            # URL length penalty (very long URLs)
-            if len(url) > 100:
-                score -= 0.05
-            
-            # Subdomain analysis
-            subdomain = domain.split('.')[0] if '.' in domain else ''
-            if subdomain in ['www', 'shop', 'store', 'app']:
-                score += 0.02  # Professional subdomains
-            
-            return max(0.1, min(1.0, round(score, 2)))
+            return _score_url_key(
+                url.startswith("https://"),
+                parsed_url.netloc.lower(),
+                parsed_url.path.lower(),
+                len(url) > 100
+            )
             
         except Exception as e:
             logger.error(f"Error in offline landing page analysis for {url}: {e}")
@@ -402,15 +1062,24 @@ class QualityScoreEngine:
     
     def _analyze_landing_page(self, url: str) -> float:
         """Analyze landing page using HTML heuristics"""
+        cache_key = f"lp:{_LANDING_PAGE_PARSER_TAG}:{url}"
+        cached_score = self._disk_cache_get(cache_key)
+        if cached_score is not None:
+            return cached_score
+        
         try:
-            response = requests.get(url, timeout=10, allow_redirects=True)
-            html = response.text.lower()
-            content_size = len(response.content)
+            # Only the start of the page is needed for the head-level signals
+            with self._http.get(url, stream=True, timeout=10, allow_redirects=True) as response:
+                raw = response.raw.read(LANDING_PAGE_MAX_BYTES, decode_content=True) or b''
+                # Larger pages are sized from the header without downloading them
+                content_size = int(response.headers.get('Content-Length') or len(raw))
+            
+            signals = _landing_page_signals(raw.decode('utf-8', 'ignore'))
             
             score = 1.0
             
             # Mobile optimization
-            if "viewport" not in html:
+            if not signals['viewport']:
                 score -= 0.2
             
             # Page size check
@@ -424,27 +1093,48 @@ class QualityScoreEngine:
                 score -= 0.1
             
             # Structured data
-            if "application/ld+json" not in html:
+            if not signals['structured_data']:
                 score -= 0.1
             
             # Title tag
-            if "<title>" not in html:
+            if not signals['title']:
                 score -= 0.1
             
             # Meta description
-            if 'name="description"' not in html:
+            if not signals['meta_description']:
                 score -= 0.05
             
             # Page load indicators
-            if "loading" in html or "spinner" in html:
+            if signals['loading_indicator']:
                 score -= 0.05
             
-            return max(0.1, round(score, 2))
+            score = max(0.1, round(score, 2))
+            self._disk_cache_set(cache_key, score)
+            return score
             
         except Exception as e:
             logger.error(f"Error analyzing landing page {url}: {e}")
             return 0.5
     
+    def analyze_landing_pages_bulk(self, urls: List[str]) -> Dict[str, float]:
+        """
+        Analyze many landing pages with concurrent HTTP fetches
+        
+        Args:
+            urls: Landing page URLs (duplicates are fetched once)
+            
+        Returns:
+            Dictionary of url -> landing page score
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        if not unique_urls:
+            return {}
+        
+        max_workers = min(LANDING_PAGE_FETCH_WORKERS, len(unique_urls))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            scores = executor.map(self._analyze_landing_page, unique_urls)
+            return dict(zip(unique_urls, scores))
+    
     def calculate_extension_bonus(self, ad: AdData) -> float:
         """
         Calculate extension bonus factor
@@ -455,22 +1145,7 @@ class QualityScoreEngine:
         Returns:
             Extension bonus factor (1.0 to 1.5)
         """
-        if not ad.extensions:
-            return 1.0
-        
-        num_extensions = len(ad.extensions)
-        
-        # Extension bonus calculation
-        if num_extensions >= 4:
-            return 1.5
-        elif num_extensions >= 3:
-            return 1.3
-        elif num_extensions >= 2:
-            return 1.2
-        elif num_extensions >= 1:
-            return 1.1
-        else:
-            return 1.0
+        return _EXT_BONUS[min(len(ad.extensions or ()), len(_EXT_BONUS) - 1)]
     
     def classify_keyword_intent(self, keyword_text: str) -> str:
         """
@@ -483,29 +1158,57 @@ class QualityScoreEngine:
             Intent classification: informational, navigational, transactional
         """
         keyword_lower = keyword_text.lower()
+        tokens = set(_WORD_RE.findall(keyword_lower))
         
-        # Check transactional patterns
-        for pattern in self.intent_patterns['transactional']:
-            if re.search(pattern, keyword_lower):
-                return "transactional"
-        
-        # Check navigational patterns
-        for pattern in self.intent_patterns['navigational']:
-            if re.search(pattern, keyword_lower):
-                return "navigational"
-        
-        # Check informational patterns
-        for pattern in self.intent_patterns['informational']:
-            if re.search(pattern, keyword_lower):
-                return "informational"
+        # Check word tables (then phrase patterns) in priority order
+        for intent in INTENT_PRIORITY:
+            if not self._intent_words[intent].isdisjoint(tokens):
+                return intent
+            phrase_regex = self._intent_phrase_regex[intent]
+            if phrase_regex is not None and phrase_regex.search(keyword_lower):
+                return intent
         
         # Default to informational
         return "informational"
     
+    def classify_keywords_bulk(self, keywords: List[str]) -> List[str]:
+        """
+        Classify the intent of many keywords
+        
+        Scans each keyword once with an Aho-Corasick automaton over all intent
+        words when pyahocorasick is installed, otherwise uses the regexes.
+        
+        Args:
+            keywords: Keywords to classify
+            
+        Returns:
+            Intent classification for each keyword, in input order
+        """
+        if self._intent_automaton is None:
+            return [self.classify_keyword_intent(keyword) for keyword in keywords]
+        
+        intents = []
+        for keyword in keywords:
+            text = keyword.lower()
+            found = set()
+            for end, (intent, length) in self._intent_automaton.iter(text):
+                start = end - length + 1
+                # Enforce the \b word boundaries of the original patterns
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end + 1 < len(text) and _is_word_char(text[end + 1]):
+                    continue
+                found.add(intent)
+                if intent == INTENT_PRIORITY[0]:
+                    break
+            
+            intents.append(next((intent for intent in INTENT_PRIORITY if intent in found), "informational"))
+        
+        return intents
+    
     def _keyword_in_ad(self, ad: AdData, keyword: str) -> bool:
         """Check if keyword appears in ad content"""
-        ad_content = " ".join(ad.headlines + ad.descriptions).lower()
-        return keyword.lower() in ad_content
+        return keyword.lower() in ad._content_lower
 
 # Global instance
 quality_score_engine = QualityScoreEngine()
@@ -514,6 +1217,22 @@ def calculate_quality_score(ad: AdData, keyword: KeywordData, final_url: str = N
     """Convenience function to calculate Quality Score"""
     return quality_score_engine.calculate_quality_score(ad, keyword, final_url)
 
+def calculate_quality_scores(pairs: List[Tuple[AdData, KeywordData]]) -> List[QualityScoreComponents]:
+    """Convenience function to calculate Quality Scores for many (ad, keyword) pairs"""
+    return quality_score_engine.calculate_quality_scores(pairs)
+
+def precompute_relevance(keywords: List[str], ads: List[AdData]) -> int:
+    """Convenience function to precompute Gemini relevance scores"""
+    return quality_score_engine.precompute_relevance(keywords, ads)
+
+def warm_keyword_cache(keywords: List[str]) -> int:
+    """Convenience function to embed a simulation's keywords up-front"""
+    return quality_score_engine.warm_keyword_cache(keywords)
+
 def classify_keyword_intent(keyword_text: str) -> str:
     """Convenience function to classify keyword intent"""
     return quality_score_engine.classify_keyword_intent(keyword_text)
+
+def classify_keywords_bulk(keywords: List[str]) -> List[str]:
+    """Convenience function to classify the intent of many keywords"""
+    return quality_score_engine.classify_keywords_bulk(keywords)
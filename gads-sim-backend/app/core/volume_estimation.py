@@ -8,15 +8,91 @@ This module replaces random auction generation with logic-based volume estimatio
 4. Daily auction calculation: volume * matchTypeModifier * geoModifier
 """
 
+import heapq
 import json
 import os
-from typing import Dict, List, Tuple, Optional
+import sys
+from collections import OrderedDict, defaultdict
+from itertools import chain
+from typing import Dict, List, Tuple, Optional, Sequence, Union
 from dataclasses import dataclass
+from functools import lru_cache
 import numpy as np
 
+from app.core.constants import COMPETITION_LEVELS
+
+# Numba is optional - fall back to the plain NumPy kernel when unavailable
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+STATIC_VOLUME_DB_PATH = os.path.join(os.path.dirname(__file__), 'data', 'volume_db.npz')
+
+# Most recent (keyword, match_type, geo) estimates kept per engine
+AUCTION_CACHE_SIZE = 8192
+
+@lru_cache(maxsize=8192)
+def _norm(keyword: str) -> str:
+    """Normalize a keyword for lookup (cached, simulations repeat keywords every tick)"""
+    # Interned so lookups against the interned database keys hit on identity
+    return sys.intern(keyword.lower().strip())
+
+def _looks_like_brand(raw: str) -> bool:
+    """
+    Brand heuristic: keyword typed in caps or starting with a capital letter
+    
+    Must see the keyword before lowercasing - the check used to run on the
+    normalized keyword, where it never fired (and raised on empty keywords).
+    """
+    return raw[:1].isupper() or raw.isupper()
+
+# Base monthly volume by keyword length for unknown keywords; index 0 and the
+# last slot (lengths above 10) hold the 5000 default
+_LENGTH_VOLUME = np.array(
+    [5000, 500000, 200000, 100000, 80000, 60000, 40000, 25000, 15000, 10000, 8000, 5000],
+    dtype=np.int64
+)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _volume_core(lengths: np.ndarray, token_counts: np.ndarray, has_high_volume: np.ndarray,
+                     has_business: np.ndarray, is_brand: np.ndarray) -> np.ndarray:
+        """Apply the unknown-keyword volume heuristic to precomputed keyword features"""
+        out = np.empty(lengths.shape[0], dtype=np.int64)
+        max_idx = _LENGTH_VOLUME.shape[0] - 1
+        for i in range(lengths.shape[0]):
+            base_volume = float(_LENGTH_VOLUME[min(lengths[i], max_idx)])
+            if has_high_volume[i]:
+                base_volume *= 2.0
+            if has_business[i]:
+                base_volume *= 1.5
+            if token_counts[i] > 2:
+                base_volume *= 0.3
+            elif token_counts[i] == 2:
+                base_volume *= 0.7
+            if is_brand[i]:
+                base_volume *= 0.2
+            out[i] = int(base_volume)
+        return out
+else:
+    def _volume_core(lengths: np.ndarray, token_counts: np.ndarray, has_high_volume: np.ndarray,
+                     has_business: np.ndarray, is_brand: np.ndarray) -> np.ndarray:
+        """Apply the unknown-keyword volume heuristic to precomputed keyword features"""
+        base_volume = _LENGTH_VOLUME[np.minimum(lengths, len(_LENGTH_VOLUME) - 1)].astype(np.float64)
+        # Multiplying by 1.0 is exact, so this matches the sequential scalar arithmetic
+        base_volume *= np.where(has_high_volume, 2.0, 1.0)
+        base_volume *= np.where(has_business, 1.5, 1.0)
+        base_volume *= np.where(token_counts > 2, 0.3, np.where(token_counts == 2, 0.7, 1.0))
+        base_volume *= np.where(is_brand, 0.2, 1.0)
+        return base_volume.astype(np.int64)
+
 @dataclass
 class VolumeData:
     """Search volume data for a keyword"""
+    __slots__ = ('keyword', 'monthly_searches', 'competition', 'competition_index', 'avg_cpc', 'cpc_low', 'cpc_high')
+    
     keyword: str
     monthly_searches: int
     competition: str  # 'Low', 'Medium', 'High'
@@ -28,6 +104,8 @@ class VolumeData:
 @dataclass
 class AuctionEstimate:
     """Estimated daily auctions for a keyword"""
+    __slots__ = ('keyword', 'match_type', 'daily_auctions', 'volume_source', 'confidence')
+    
     keyword: str
     match_type: str
     daily_auctions: int
@@ -38,125 +116,74 @@ class VolumeEstimationEngine:
     """Main engine for search volume estimation"""
     
     def __init__(self):
-        self.static_volume_db = self._load_static_volume_db()
+        self._load_static_volume_db()
         self.match_type_modifiers = self._get_match_type_modifiers()
         self.geo_modifiers = self._get_geo_modifiers()
+        self._build_lookup_arrays()
         
-    def _load_static_volume_db(self) -> Dict[str, VolumeData]:
-        """Load static volume database"""
-        # This would typically load from a JSON file or database
-        # For now, we'll create a comprehensive sample dataset
-        return {
-            # Business Services
-            'plumber': VolumeData('plumber', 450000, 'High', 0.8, 8.50, 5.20, 12.80),
-            'electrician': VolumeData('electrician', 320000, 'High', 0.75, 12.30, 8.50, 18.20),
-            'hvac repair': VolumeData('hvac repair', 180000, 'Medium', 0.65, 15.80, 10.20, 22.50),
-            'roofing contractor': VolumeData('roofing contractor', 95000, 'Medium', 0.60, 18.90, 12.50, 28.40),
-            'landscaping services': VolumeData('landscaping services', 120000, 'Medium', 0.55, 14.20, 9.80, 20.10),
-            
-            # Technology
-            'web design': VolumeData('web design', 280000, 'High', 0.85, 12.50, 8.20, 18.90),
-            'seo services': VolumeData('seo services', 150000, 'High', 0.80, 25.40, 18.50, 35.20),
-            'digital marketing': VolumeData('digital marketing', 220000, 'High', 0.75, 18.90, 12.80, 28.50),
-            'software development': VolumeData('software development', 180000, 'Medium', 0.70, 22.10, 15.60, 31.80),
-            'mobile app development': VolumeData('mobile app development', 85000, 'Medium', 0.65, 28.90, 20.50, 40.20),
-            
-            # Healthcare
-            'dentist': VolumeData('dentist', 380000, 'High', 0.75, 9.80, 6.50, 15.20),
-            'chiropractor': VolumeData('chiropractor', 120000, 'Medium', 0.60, 11.20, 7.80, 16.90),
-            'physical therapy': VolumeData('physical therapy', 95000, 'Medium', 0.55, 13.50, 9.20, 19.80),
-            'mental health counseling': VolumeData('mental health counseling', 65000, 'Low', 0.45, 16.80, 11.50, 24.20),
-            'veterinarian': VolumeData('veterinarian', 150000, 'Medium', 0.65, 8.90, 5.80, 13.50),
-            
-            # Legal Services
-            'personal injury lawyer': VolumeData('personal injury lawyer', 280000, 'High', 0.90, 45.20, 32.80, 68.50),
-            'divorce lawyer': VolumeData('divorce lawyer', 180000, 'High', 0.85, 38.90, 28.50, 55.20),
-            'criminal defense attorney': VolumeData('criminal defense attorney', 120000, 'High', 0.80, 42.10, 30.80, 58.90),
-            'estate planning lawyer': VolumeData('estate planning lawyer', 85000, 'Medium', 0.70, 35.60, 25.20, 48.90),
-            'business lawyer': VolumeData('business lawyer', 95000, 'Medium', 0.65, 28.90, 20.50, 40.20),
-            
-            # Real Estate
-            'real estate agent': VolumeData('real estate agent', 320000, 'High', 0.80, 12.50, 8.90, 18.20),
-            'home inspector': VolumeData('home inspector', 45000, 'Medium', 0.55, 18.90, 12.80, 28.50),
-            'property management': VolumeData('property management', 38000, 'Low', 0.50, 15.20, 10.50, 22.80),
-            'commercial real estate': VolumeData('commercial real estate', 25000, 'Medium', 0.60, 22.80, 16.20, 32.50),
-            'real estate investment': VolumeData('real estate investment', 18000, 'Low', 0.45, 19.50, 13.80, 28.20),
-            
-            # Automotive
-            'auto repair': VolumeData('auto repair', 280000, 'High', 0.75, 8.90, 6.20, 13.50),
-            'car insurance': VolumeData('car insurance', 450000, 'High', 0.85, 12.50, 8.90, 18.20),
-            'used cars': VolumeData('used cars', 680000, 'High', 0.90, 6.80, 4.50, 10.20),
-            'auto parts': VolumeData('auto parts', 180000, 'Medium', 0.65, 4.20, 2.80, 6.90),
-            'car detailing': VolumeData('car detailing', 65000, 'Medium', 0.55, 9.80, 6.50, 15.20),
-            
-            # Food & Restaurant
-            'restaurant': VolumeData('restaurant', 520000, 'High', 0.80, 3.20, 2.10, 5.80),
-            'pizza delivery': VolumeData('pizza delivery', 180000, 'High', 0.75, 2.80, 1.90, 4.50),
-            'catering services': VolumeData('catering services', 85000, 'Medium', 0.60, 8.90, 6.20, 13.50),
-            'food truck': VolumeData('food truck', 45000, 'Medium', 0.55, 5.20, 3.50, 8.90),
-            'bakery': VolumeData('bakery', 65000, 'Medium', 0.50, 4.80, 3.20, 7.50),
-            
-            # Fitness & Wellness
-            'gym': VolumeData('gym', 280000, 'High', 0.75, 4.20, 2.80, 6.90),
-            'personal trainer': VolumeData('personal trainer', 120000, 'Medium', 0.60, 8.90, 6.20, 13.50),
-            'yoga classes': VolumeData('yoga classes', 85000, 'Medium', 0.55, 6.80, 4.50, 10.20),
-            'massage therapy': VolumeData('massage therapy', 95000, 'Medium', 0.60, 9.80, 6.50, 15.20),
-            'nutritionist': VolumeData('nutritionist', 45000, 'Low', 0.45, 12.50, 8.90, 18.20),
-            
-            # Education & Training
-            'online courses': VolumeData('online courses', 180000, 'High', 0.80, 8.90, 6.20, 13.50),
-            'language learning': VolumeData('language learning', 150000, 'High', 0.75, 6.80, 4.50, 10.20),
-            'coding bootcamp': VolumeData('coding bootcamp', 65000, 'Medium', 0.65, 15.20, 10.50, 22.80),
-            'music lessons': VolumeData('music lessons', 85000, 'Medium', 0.55, 9.80, 6.50, 15.20),
-            'tutoring services': VolumeData('tutoring services', 120000, 'Medium', 0.60, 8.90, 6.20, 13.50),
-            
-            # E-commerce
-            'online shopping': VolumeData('online shopping', 1200000, 'High', 0.90, 2.10, 1.40, 3.20),
-            'free shipping': VolumeData('free shipping', 450000, 'High', 0.85, 1.80, 1.20, 2.80),
-            'discount codes': VolumeData('discount codes', 280000, 'High', 0.80, 2.50, 1.70, 3.80),
-            'product reviews': VolumeData('product reviews', 180000, 'Medium', 0.70, 1.90, 1.30, 2.90),
-            'compare prices': VolumeData('compare prices', 95000, 'Medium', 0.65, 2.20, 1.50, 3.20),
-            
-            # Travel & Tourism
-            'hotel booking': VolumeData('hotel booking', 380000, 'High', 0.85, 3.20, 2.10, 5.80),
-            'flight deals': VolumeData('flight deals', 280000, 'High', 0.80, 4.50, 3.00, 6.80),
-            'vacation rental': VolumeData('vacation rental', 120000, 'Medium', 0.70, 2.80, 1.90, 4.50),
-            'travel insurance': VolumeData('travel insurance', 65000, 'Medium', 0.60, 5.20, 3.50, 8.90),
-            'tourist attractions': VolumeData('tourist attractions', 85000, 'Low', 0.50, 1.90, 1.30, 2.90),
-            
-            # Financial Services
-            'credit card': VolumeData('credit card', 450000, 'High', 0.90, 8.90, 6.20, 13.50),
-            'mortgage rates': VolumeData('mortgage rates', 280000, 'High', 0.85, 12.50, 8.90, 18.20),
-            'investment advice': VolumeData('investment advice', 120000, 'High', 0.80, 18.90, 12.80, 28.50),
-            'tax preparation': VolumeData('tax preparation', 180000, 'High', 0.75, 15.20, 10.50, 22.80),
-            'insurance quotes': VolumeData('insurance quotes', 220000, 'High', 0.80, 8.90, 6.20, 13.50),
-            
-            # Home & Garden
-            'home improvement': VolumeData('home improvement', 320000, 'High', 0.75, 6.80, 4.50, 10.20),
-            'furniture': VolumeData('furniture', 280000, 'High', 0.80, 4.20, 2.80, 6.90),
-            'home decor': VolumeData('home decor', 180000, 'Medium', 0.70, 3.20, 2.10, 5.80),
-            'garden supplies': VolumeData('garden supplies', 95000, 'Medium', 0.60, 2.80, 1.90, 4.50),
-            'cleaning services': VolumeData('cleaning services', 120000, 'Medium', 0.65, 8.90, 6.20, 13.50),
-            
-            # Fashion & Beauty
-            'clothing': VolumeData('clothing', 680000, 'High', 0.85, 2.10, 1.40, 3.20),
-            'shoes': VolumeData('shoes', 450000, 'High', 0.80, 2.50, 1.70, 3.80),
-            'makeup': VolumeData('makeup', 280000, 'High', 0.75, 3.20, 2.10, 5.80),
-            'hair salon': VolumeData('hair salon', 150000, 'Medium', 0.60, 6.80, 4.50, 10.20),
-            'nail salon': VolumeData('nail salon', 85000, 'Medium', 0.55, 5.20, 3.50, 8.90),
-            
-            # Generic Business Terms
-            'near me': VolumeData('near me', 1200000, 'High', 0.90, 1.20, 0.80, 1.80),
-            'best': VolumeData('best', 2800000, 'High', 0.95, 0.80, 0.50, 1.20),
-            'cheap': VolumeData('cheap', 1800000, 'High', 0.90, 0.90, 0.60, 1.40),
-            'affordable': VolumeData('affordable', 1200000, 'High', 0.85, 1.10, 0.70, 1.60),
-            'professional': VolumeData('professional', 850000, 'Medium', 0.70, 2.20, 1.50, 3.20),
-            'local': VolumeData('local', 2200000, 'High', 0.90, 0.70, 0.50, 1.00),
-            'reviews': VolumeData('reviews', 1500000, 'High', 0.85, 1.50, 1.00, 2.20),
-            'services': VolumeData('services', 3200000, 'High', 0.90, 0.60, 0.40, 0.90),
-            'company': VolumeData('company', 2800000, 'High', 0.85, 0.80, 0.50, 1.20),
-            'business': VolumeData('business', 2500000, 'High', 0.80, 0.90, 0.60, 1.40)
-        }
+        # Whole-word vocabularies for the unknown-keyword volume heuristic
+        self._high_volume_words = frozenset({'near', 'me', 'best', 'cheap', 'affordable', 'local', 'reviews', 'services', 'company', 'business'})
+        self._business_terms = frozenset({'service', 'company', 'business', 'professional', 'expert', 'specialist'})
+        
+        self._auction_cache: "OrderedDict[Tuple[str, str, str], AuctionEstimate]" = OrderedDict()
+        
+        if NUMBA_AVAILABLE:
+            # Compile the volume kernel now rather than on the first simulation request
+            self._estimate_volume_batch(['warm up'])
+        
+    def _volume_data_at(self, row: int) -> VolumeData:
+        """Reconstruct the VolumeData for a database row"""
+        return VolumeData(
+            keyword=self._keywords[row],
+            monthly_searches=int(self._monthly[row]),
+            competition=COMPETITION_LEVELS[self._competition_codes[row]],
+            competition_index=float(self._comp_idx[row]),
+            avg_cpc=float(self._avg_cpc[row]),
+            cpc_low=float(self._cpc_low[row]),
+            cpc_high=float(self._cpc_high[row])
+        )
+        
+    def _build_lookup_arrays(self):
+        """Precompute modifier arrays and indexes for the batch estimators and suggestions"""
+        # The trailing slot holds the 0.5 modifier used for unknown match types
+        self._mt_index = {mt: i for i, mt in enumerate(self.match_type_modifiers)}
+        self._mt_arr = np.array(list(self.match_type_modifiers.values()) + [0.5])
+        
+        self._geo_index = {geo: i for i, geo in enumerate(self.geo_modifiers)}
+        self._geo_default_idx = self._geo_index['default']
+        self._geo_arr = np.array(list(self.geo_modifiers.values()))
+        
+        # CPC multipliers: exact 1.2, phrase 1.0, anything else priced as broad
+        self._mt_cpc_index = {'exact': 0, 'phrase': 1, 'broad': 2}
+        self._mt_cpc_mult = np.array([1.2, 1.0, 0.8])
+        # Fallback (low, avg, high) CPC indexed by competition code
+        self._fallback_cpc = np.array([[2.0, 5.0, 10.0], [4.0, 8.0, 15.0], [8.0, 15.0, 25.0]])
+        
+        # Rows ranked by monthly searches (desc), ties in database order
+        self._rank_to_row = np.lexsort((np.arange(len(self._monthly)), -self._monthly))
+        row_rank = np.empty_like(self._rank_to_row)
+        row_rank[self._rank_to_row] = np.arange(len(self._rank_to_row))
+        
+        # Inverted token index for suggestions, postings hold sorted row ranks
+        token_index = defaultdict(list)
+        for row, kw in enumerate(self._keywords):
+            for token in set(kw.split()):
+                token_index[token].append(int(row_rank[row]))
+        for postings in token_index.values():
+            postings.sort()
+        self._token_index = dict(token_index)
+        
+    def _load_static_volume_db(self):
+        """Load the static volume database (built by build_volume_db.py) into parallel arrays"""
+        with np.load(STATIC_VOLUME_DB_PATH) as data:
+            self._keywords = [sys.intern(kw) for kw in data['keywords'].tolist()]
+            self._monthly = data['monthly']
+            self._competition_codes = data['competition_code']
+            self._comp_idx = data['comp_idx']
+            self._avg_cpc = data['avg_cpc']
+            self._cpc_low = data['cpc_low']
+            self._cpc_high = data['cpc_high']
+        self._kw_index = {kw: i for i, kw in enumerate(self._keywords)}
     
     def _get_match_type_modifiers(self) -> Dict[str, float]:
         """Get match type modifiers for auction participation"""
@@ -194,21 +221,30 @@ class VolumeEstimationEngine:
         - Geographic modifier
         
         Formula: daily_auctions = (monthly_searches / 30) * match_type_modifier * geo_modifier
+        
+        Results are memoized per (keyword, match_type, geo); the returned
+        AuctionEstimate is shared and must be treated as read-only.
         """
+        cache_key = (keyword, match_type, geo)
+        cached = self._auction_cache.get(cache_key)
+        if cached is not None:
+            self._auction_cache.move_to_end(cache_key)
+            return cached
+        
         # Normalize keyword for lookup
-        normalized_keyword = keyword.lower().strip()
+        normalized_keyword = _norm(keyword)
         
         # Get base volume data
-        volume_data = self.static_volume_db.get(normalized_keyword)
+        row = self._kw_index.get(normalized_keyword)
         
-        if volume_data:
+        if row is not None:
             # Use static data
-            monthly_searches = volume_data.monthly_searches
+            monthly_searches = int(self._monthly[row])
             volume_source = 'static'
             confidence = 0.9
         else:
             # Estimate based on keyword characteristics
-            monthly_searches = self._estimate_volume_from_keyword(normalized_keyword)
+            monthly_searches = self._estimate_volume_from_keyword(normalized_keyword, raw=keyword.strip())
             volume_source = 'estimated'
             confidence = 0.6
         
@@ -222,90 +258,175 @@ class VolumeEstimationEngine:
         # Ensure minimum of 1 auction per day
         daily_auctions = max(1, daily_auctions)
         
-        return AuctionEstimate(
+        estimate = AuctionEstimate(
             keyword=keyword,
             match_type=match_type,
             daily_auctions=daily_auctions,
             volume_source=volume_source,
             confidence=confidence
         )
+        
+        self._auction_cache[cache_key] = estimate
+        while len(self._auction_cache) > AUCTION_CACHE_SIZE:
+            self._auction_cache.popitem(last=False)
+        
+        return estimate
     
-    def _estimate_volume_from_keyword(self, keyword: str) -> int:
+    def estimate_daily_auctions_batch(
+        self,
+        keywords: Sequence[str],
+        match_types: Union[str, Sequence[str]],
+        geos: Union[str, Sequence[str]]
+    ) -> np.ndarray:
         """
-        Estimate search volume for unknown keywords based on:
-        - Keyword length (shorter = higher volume)
-        - Common words (higher volume)
-        - Business terms (medium volume)
-        - Long-tail terms (lower volume)
+        Vectorized estimate_daily_auctions returning only the daily auction counts
+        
+        Args:
+            keywords: Keywords to estimate
+            match_types: One match type per keyword, or a single match type for all
+            geos: One geo per keyword, or a single geo for all
+            
+        Returns:
+            int64 array of daily auctions, aligned with keywords
         """
-        # Base volume by keyword length
-        length_modifiers = {
-            1: 500000,   # Single character (rare)
-            2: 200000,   # Two characters
-            3: 100000,   # Three characters
-            4: 80000,    # Four characters
-            5: 60000,    # Five characters
-            6: 40000,    # Six characters
-            7: 25000,    # Seven characters
-            8: 15000,    # Eight characters
-            9: 10000,    # Nine characters
-            10: 8000,    # Ten characters
-        }
+        n = len(keywords)
+        normalized = [_norm(kw) for kw in keywords]
+        idx = np.fromiter((self._kw_index.get(kw, -1) for kw in normalized), dtype=np.int64, count=n)
         
-        # Get base volume by length
-        base_volume = length_modifiers.get(len(keyword), 5000)
+        # Only keywords missing from the static database need the heuristic estimate
+        monthly = self._monthly[idx.clip(0)]
+        misses = np.flatnonzero(idx < 0)
+        if len(misses):
+            monthly[misses] = self._estimate_volume_batch(
+                [normalized[i] for i in misses], raws=[keywords[i].strip() for i in misses]
+            )
         
-        # High-volume word modifiers
-        high_volume_words = ['near', 'me', 'best', 'cheap', 'affordable', 'local', 'reviews', 'services', 'company', 'business']
-        if any(word in keyword for word in high_volume_words):
-            base_volume *= 2.0
+        mt_unknown = len(self._mt_arr) - 1
+        if isinstance(match_types, str):
+            match_modifier = self._mt_arr[self._mt_index.get(match_types, mt_unknown)]
+        else:
+            mt_codes = np.fromiter((self._mt_index.get(mt, mt_unknown) for mt in match_types), dtype=np.intp, count=n)
+            match_modifier = np.take(self._mt_arr, mt_codes)
         
-        # Business term modifiers
-        business_terms = ['service', 'company', 'business', 'professional', 'expert', 'specialist']
-        if any(term in keyword for term in business_terms):
-            base_volume *= 1.5
+        if isinstance(geos, str):
+            geo_modifier = self._geo_arr[self._geo_index.get(geos, self._geo_default_idx)]
+        else:
+            geo_codes = np.fromiter((self._geo_index.get(g, self._geo_default_idx) for g in geos), dtype=np.intp, count=n)
+            geo_modifier = np.take(self._geo_arr, geo_codes)
+        
+        # Same operation order as the scalar path so results match exactly
+        daily_auctions = ((monthly / 30) * match_modifier * geo_modifier).astype(np.int64)
+        return np.maximum(daily_auctions, 1)
+    
+    def _estimate_volume_batch(self, keywords: List[str], raws: Optional[List[str]] = None) -> np.ndarray:
+        """
+        Vectorized _estimate_volume_from_keyword
+        
+        Only the keyword features are extracted in Python; the arithmetic runs
+        in a single kernel call.
+        """
+        if raws is None:
+            raws = keywords
+        n = len(keywords)
+        lengths = np.empty(n, dtype=np.int64)
+        token_counts = np.empty(n, dtype=np.int64)
+        has_high_volume = np.empty(n, dtype=np.bool_)
+        has_business = np.empty(n, dtype=np.bool_)
+        is_brand = np.empty(n, dtype=np.bool_)
         
-        # Long-tail modifiers (more specific = lower volume)
-        if len(keyword.split()) > 2:
-            base_volume *= 0.3
-        elif len(keyword.split()) == 2:
-            base_volume *= 0.7
+        for i, (keyword, raw) in enumerate(zip(keywords, raws)):
+            tokens = keyword.split()
+            token_set = set(tokens)
+            lengths[i] = len(keyword)
+            token_counts[i] = len(tokens)
+            has_high_volume[i] = not token_set.isdisjoint(self._high_volume_words)
+            has_business[i] = not token_set.isdisjoint(self._business_terms)
+            is_brand[i] = _looks_like_brand(raw)
         
-        # Brand name detection (lower volume for specific brands)
-        if keyword.isupper() or keyword[0].isupper():
-            base_volume *= 0.2
+        return _volume_core(lengths, token_counts, has_high_volume, has_business, is_brand)
+    
+    def _estimate_volume_from_keyword(self, keyword: str, raw: Optional[str] = None) -> int:
+        """
+        Estimate search volume for unknown keywords based on:
+        - Keyword length (shorter = higher volume)
+        - Common words (higher volume)
+        - Business terms (medium volume)
+        - Long-tail terms (lower volume)
+        - Capitalization of the keyword as typed (brand names)
         
-        return int(base_volume)
+        Args:
+            keyword: Normalized keyword
+            raw: Keyword as entered, before lowercasing (defaults to keyword)
+        """
+        # Same features and kernel as the batch path (_LENGTH_VOLUME / _volume_core)
+        return int(self._estimate_volume_batch([keyword], [raw if raw is not None else keyword])[0])
     
     def get_volume_data(self, keyword: str) -> Optional[VolumeData]:
         """Get volume data for a keyword if available"""
-        normalized_keyword = keyword.lower().strip()
-        return self.static_volume_db.get(normalized_keyword)
+        row = self._kw_index.get(_norm(keyword))
+        return self._volume_data_at(row) if row is not None else None
     
     def get_competition_level(self, keyword: str) -> str:
         """Get competition level for a keyword"""
-        volume_data = self.get_volume_data(keyword)
-        if volume_data:
-            return volume_data.competition
-        
-        # Estimate competition based on keyword characteristics
-        if len(keyword.split()) == 1 and len(keyword) <= 6:
-            return 'High'  # Short, single-word keywords are usually competitive
-        elif len(keyword.split()) >= 3:
-            return 'Low'   # Long-tail keywords are usually less competitive
+        row = self._kw_index.get(_norm(keyword))
+        if row is not None:
+            return COMPETITION_LEVELS[self._competition_codes[row]]
+        
+        return COMPETITION_LEVELS[self._fallback_competition_code(keyword)]
+    
+    @staticmethod
+    def _fallback_competition_code(keyword: str) -> int:
+        """Estimate the competition code of a keyword missing from the static database"""
+        token_count = len(keyword.split())
+        if token_count == 1 and len(keyword) <= 6:
+            return 2  # High - short, single-word keywords are usually competitive
+        elif token_count >= 3:
+            return 0  # Low - long-tail keywords are usually less competitive
         else:
-            return 'Medium'
+            return 1  # Medium
+    
+    def _fallback_competition_codes(self, keywords: Sequence[str]) -> np.ndarray:
+        """Vectorized _fallback_competition_code"""
+        n = len(keywords)
+        lengths = np.fromiter((len(kw) for kw in keywords), dtype=np.int64, count=n)
+        token_counts = np.fromiter((len(kw.split()) for kw in keywords), dtype=np.int64, count=n)
+        return np.select(
+            [(token_counts == 1) & (lengths <= 6), token_counts >= 3],
+            [2, 0],
+            default=1
+        ).astype(np.uint8)
+    
+    def get_competition_level_batch(self, keywords: Sequence[str]) -> np.ndarray:
+        """
+        Vectorized get_competition_level
+        
+        Args:
+            keywords: Keywords to classify
+            
+        Returns:
+            uint8 array of competition codes aligned with keywords; decode with
+            np.array(COMPETITION_LEVELS)[codes] where labels are needed
+        """
+        n = len(keywords)
+        idx = np.fromiter((self._kw_index.get(_norm(kw), -1) for kw in keywords), dtype=np.int64, count=n)
+        hit = idx >= 0
+        
+        codes = np.take(self._competition_codes, idx.clip(0))
+        if not hit.all():
+            misses = np.flatnonzero(~hit)
+            codes[misses] = self._fallback_competition_codes([keywords[i] for i in misses])
+        return codes
     
     def get_estimated_cpc(self, keyword: str, match_type: str) -> Tuple[float, float, float]:
         """
         Get estimated CPC range for a keyword
         Returns: (low_cpc, avg_cpc, high_cpc)
         """
-        volume_data = self.get_volume_data(keyword)
-        if volume_data:
-            base_low = volume_data.cpc_low
-            base_avg = volume_data.avg_cpc
-            base_high = volume_data.cpc_high
+        row = self._kw_index.get(_norm(keyword))
+        if row is not None:
+            base_low = float(self._cpc_low[row])
+            base_avg = float(self._avg_cpc[row])
+            base_high = float(self._cpc_high[row])
         else:
             # Estimate CPC based on competition and keyword characteristics
             competition = self.get_competition_level(keyword)
@@ -333,38 +454,124 @@ class VolumeEstimationEngine:
             base_high * cpc_multiplier
         )
     
+    def get_estimated_cpc_batch(
+        self,
+        keywords: Sequence[str],
+        match_types: Union[str, Sequence[str]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized get_estimated_cpc
+        
+        Args:
+            keywords: Keywords to price
+            match_types: One match type per keyword, or a single match type for all
+            
+        Returns:
+            (low_cpc, avg_cpc, high_cpc) float64 arrays aligned with keywords
+        """
+        n = len(keywords)
+        idx = np.fromiter((self._kw_index.get(_norm(kw), -1) for kw in keywords), dtype=np.int64, count=n)
+        hit = idx >= 0
+        rows = idx.clip(0)
+        
+        # Keywords missing from the static database are priced by estimated competition
+        competition_codes = np.zeros(n, dtype=np.uint8)
+        misses = np.flatnonzero(~hit)
+        if len(misses):
+            competition_codes[misses] = self._fallback_competition_codes([keywords[i] for i in misses])
+        fallback = np.take(self._fallback_cpc, competition_codes, axis=0)
+        
+        if isinstance(match_types, str):
+            multiplier = self._mt_cpc_mult[self._mt_cpc_index.get(match_types, 2)]
+        else:
+            mt_codes = np.fromiter((self._mt_cpc_index.get(mt, 2) for mt in match_types), dtype=np.intp, count=n)
+            multiplier = np.take(self._mt_cpc_mult, mt_codes)
+        
+        low = np.where(hit, np.take(self._cpc_low, rows), fallback[:, 0]) * multiplier
+        avg = np.where(hit, np.take(self._avg_cpc, rows), fallback[:, 1]) * multiplier
+        high = np.where(hit, np.take(self._cpc_high, rows), fallback[:, 2]) * multiplier
+        return low, avg, high
+    
     def get_keyword_suggestions(self, seed_keyword: str, max_suggestions: int = 10) -> List[VolumeData]:
         """
         Get keyword suggestions based on seed keyword
+        
+        Same matches as a full scan (keywords containing, or contained in, the
+        seed), highest search volume first; the token index narrows the rows
+        that need the substring test.
         """
-        suggestions = []
-        normalized_seed = seed_keyword.lower().strip()
+        normalized_seed = _norm(seed_keyword)
+        seed_tokens = set(normalized_seed.split())
+        if not seed_tokens:
+            # An empty seed is contained in every keyword
+            candidates = set(range(len(self._keywords)))
+        else:
+            # A keyword containing the seed holds each seed token inside one of its own tokens
+            candidates = None
+            for token in seed_tokens:
+                postings = set(chain.from_iterable(
+                    self._token_index[vocab_token] for vocab_token in self._token_index if token in vocab_token
+                ))
+                candidates = postings if candidates is None else candidates & postings
+                if not candidates:
+                    break
+            # A keyword contained in the seed has all of its tokens inside the seed
+            candidates.update(chain.from_iterable(
+                postings for vocab_token, postings in self._token_index.items() if vocab_token in normalized_seed
+            ))
         
-        # Find keywords that contain the seed keyword
-        for keyword, volume_data in self.static_volume_db.items():
+        matches = []
+        for rank in candidates:
+            keyword = self._keywords[self._rank_to_row[rank]]
             if normalized_seed in keyword or keyword in normalized_seed:
-                suggestions.append(volume_data)
+                matches.append(rank)
         
-        # Sort by monthly searches (descending)
-        suggestions.sort(key=lambda x: x.monthly_searches, reverse=True)
-        
-        return suggestions[:max_suggestions]
+        # Ranks are volume order (ties in database order), as the full scan sorted
+        return [self._volume_data_at(self._rank_to_row[rank]) for rank in heapq.nsmallest(max_suggestions, matches)]
+
+@lru_cache(maxsize=None)
+def get_volume_engine() -> VolumeEstimationEngine:
+    """Shared engine instance, built on first use rather than at import"""
+    return VolumeEstimationEngine()
 
-# Global instance
-volume_engine = VolumeEstimationEngine()
+def __getattr__(name: str):
+    # Keep `from app.core.volume_estimation import volume_engine` working without
+    # constructing the engine at import time
+    if name == 'volume_engine':
+        return get_volume_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def estimate_keyword_auctions(keyword: str, match_type: str, geo: str) -> AuctionEstimate:
     """Convenience function to estimate auctions for a keyword"""
-    return volume_engine.estimate_daily_auctions(keyword, match_type, geo)
+    return get_volume_engine().estimate_daily_auctions(keyword, match_type, geo)
+
+def estimate_keyword_auctions_batch(
+    keywords: Sequence[str],
+    match_types: Union[str, Sequence[str]],
+    geo: Union[str, Sequence[str]]
+) -> np.ndarray:
+    """Convenience function to estimate daily auctions for many keywords at once"""
+    return get_volume_engine().estimate_daily_auctions_batch(keywords, match_types, geo)
 
 def get_keyword_volume_data(keyword: str) -> Optional[VolumeData]:
     """Convenience function to get volume data"""
-    return volume_engine.get_volume_data(keyword)
+    return get_volume_engine().get_volume_data(keyword)
 
 def get_competition_level(keyword: str) -> str:
     """Convenience function to get competition level"""
-    return volume_engine.get_competition_level(keyword)
+    return get_volume_engine().get_competition_level(keyword)
+
+def get_competition_level_batch(keywords: Sequence[str]) -> np.ndarray:
+    """Convenience function to get competition codes for many keywords at once"""
+    return get_volume_engine().get_competition_level_batch(keywords)
 
 def get_estimated_cpc(keyword: str, match_type: str) -> Tuple[float, float, float]:
     """Convenience function to get estimated CPC"""
-    return volume_engine.get_estimated_cpc(keyword, match_type)
+    return get_volume_engine().get_estimated_cpc(keyword, match_type)
+
+def get_estimated_cpc_batch(
+    keywords: Sequence[str],
+    match_types: Union[str, Sequence[str]]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convenience function to get estimated CPC ranges for many keywords at once"""
+    return get_volume_engine().get_estimated_cpc_batch(keywords, match_types)
@@ -2,14 +2,27 @@
 Database Configuration and Connection Setup
 """
 import os
-from sqlalchemy import create_engine, text
+import re
+import threading
+import time
+from functools import lru_cache
+from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
+from dataclasses import dataclass
 import pyodbc
-from typing import Generator
+from typing import AsyncGenerator, Generator, Optional
 import logging
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlencode
+
+# Async sessions need the aioodbc driver (and greenlet, pulled in by sqlalchemy[asyncio])
+try:
+    import aioodbc  # noqa: F401
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    ASYNC_DB_AVAILABLE = True
+except ImportError:
+    ASYNC_DB_AVAILABLE = False
 
 # Database configuration
 DATABASE_CONFIG = {
@@ -22,13 +35,32 @@ DATABASE_CONFIG = {
     "trusted_connection": os.getenv("DB_TRUSTED_CONNECTION", "no").lower() == "yes"
 }
 
+# ODBC connection resiliency: transparently reconnect dropped idle sessions and
+# have the OS probe idle sockets so dead peers are detected before query time
+# (KeepAlive/KeepAliveInterval are honoured by ODBC Driver 17.4+ on Linux/macOS)
+ODBC_CONNECTION_OPTIONS = {
+    "ConnectRetryCount": os.getenv("DB_CONNECT_RETRY_COUNT", "3"),
+    "ConnectRetryInterval": os.getenv("DB_CONNECT_RETRY_INTERVAL", "10"),
+    "KeepAlive": os.getenv("DB_KEEPALIVE", "30"),
+    "KeepAliveInterval": os.getenv("DB_KEEPALIVE_INTERVAL", "5"),
+}
+
+# Login timeout in seconds for new connections
+CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", "30"))
+
+def _odbc_options_suffix() -> str:
+    """ODBC_CONNECTION_OPTIONS formatted for a raw pyodbc connection string"""
+    return "".join(f";{key}={value}" for key, value in ODBC_CONNECTION_OPTIONS.items())
+
+@lru_cache(maxsize=None)
 def get_connection_string():
-    """Build SQL Server connection string"""
+    """Build SQL Server connection string (SQLAlchemy URL, built once)"""
     if DATABASE_CONFIG["trusted_connection"]:
         # Windows Authentication
         conn_str = (
             f"mssql+pyodbc://{DATABASE_CONFIG['server']},{DATABASE_CONFIG['port']}/"
             f"{DATABASE_CONFIG['database']}?driver={quote_plus(DATABASE_CONFIG['driver'])}&trusted_connection=yes"
+            f"&{urlencode(ODBC_CONNECTION_OPTIONS)}"
         )
     else:
         # SQL Server Authentication
@@ -36,23 +68,67 @@ def get_connection_string():
             f"mssql+pyodbc://{quote_plus(DATABASE_CONFIG['username'])}:{quote_plus(DATABASE_CONFIG['password'])}@"
             f"{DATABASE_CONFIG['server']},{DATABASE_CONFIG['port']}/"
             f"{DATABASE_CONFIG['database']}?driver={quote_plus(DATABASE_CONFIG['driver'])}"
+            f"&{urlencode(ODBC_CONNECTION_OPTIONS)}"
         )
     
     return conn_str
 
+@lru_cache(maxsize=4)
+def get_pyodbc_connection_string(database: str) -> str:
+    """Build a raw pyodbc connection string for the given database (e.g. 'master')"""
+    if DATABASE_CONFIG["trusted_connection"]:
+        # Windows Authentication
+        auth = "Trusted_Connection=yes"
+    else:
+        # SQL Server Authentication
+        auth = f"UID={DATABASE_CONFIG['username']};PWD={DATABASE_CONFIG['password']}"
+    
+    return (
+        f"DRIVER={{{DATABASE_CONFIG['driver']}}};SERVER={DATABASE_CONFIG['server']},{DATABASE_CONFIG['port']};"
+        f"DATABASE={database};{auth}{_odbc_options_suffix()}"
+    )
+
+# Connection pool settings. Each worker process gets its own pool, so the server
+# can see up to workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections - keep that
+# below the SQL Server connection limit when scaling out.
+POOL_CONFIG = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "25")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "50")),
+    "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", "1800")),  # Seconds before a connection is replaced
+    "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),  # Seconds to wait for a free connection
+    # Pre-ping costs a round-trip on every checkout; recycling alone is enough on a
+    # stable network. Set DB_POOL_PRE_PING=true where connections drop silently.
+    "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"
+}
+
+# Statement compilation settings shared by the sync and async engines
+COMPILE_CONFIG = {
+    # Compiled-SQL LRU (SQLAlchemy default 500); sized so every endpoint's queries stay hot
+    "query_cache_size": int(os.getenv("DB_QUERY_CACHE_SIZE", "2000")),
+    # Rows per multi-row INSERT batch; SQLAlchemy still caps each batch below
+    # SQL Server's 2100-parameter limit
+    "insertmanyvalues_page_size": 5000,
+}
+
+# SQL logging; each logged statement is tagged "[generated in ...]" on a compile
+# and "[cached since ...]" on a compiled-cache hit, which shows whether
+# DB_QUERY_CACHE_SIZE is large enough
+SQL_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+
 # Create engine with connection pooling
 engine = create_engine(
     get_connection_string(),
     poolclass=QueuePool,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
-    pool_recycle=3600,  # Recycle connections every hour
-    echo=False  # Set to True for SQL query logging
+    **POOL_CONFIG,
+    **COMPILE_CONFIG,
+    connect_args={"timeout": CONNECT_TIMEOUT},
+    fast_executemany=True,  # Send executemany() parameter batches in one round-trip instead of per row
+    echo=SQL_ECHO
 )
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create session factory. Objects stay loaded after commit so handlers can serialize
+# them without a re-SELECT; call session.refresh() where fresh database values matter.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 def get_db() -> Generator[Session, None, None]:
     """Dependency to get database session"""
@@ -62,6 +138,28 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+# Async engine for `async def` handlers: DB waits are awaited on the event loop
+# instead of holding one of FastAPI's threadpool workers for the whole query.
+if ASYNC_DB_AVAILABLE:
+    async_engine = create_async_engine(
+        get_connection_string().replace("mssql+pyodbc://", "mssql+aioodbc://", 1),
+        **POOL_CONFIG,
+        **COMPILE_CONFIG,
+        connect_args={"timeout": CONNECT_TIMEOUT},
+        echo=SQL_ECHO
+    )
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+else:
+    async_engine = None
+    AsyncSessionLocal = None
+
+async def get_async_db() -> AsyncGenerator["AsyncSession", None]:
+    """Dependency to get an async database session (requires aioodbc)"""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async database sessions require the aioodbc package")
+    async with AsyncSessionLocal() as db:
+        yield db
+
 @contextmanager
 def get_db_session():
     """Context manager for database sessions"""
@@ -75,229 +173,468 @@ def get_db_session():
     finally:
         db.close()
 
+@contextmanager
+def use_session(db: Optional[Session] = None):
+    """
+    Session for a service call: the caller's request-scoped session (from the
+    get_db dependency) when given, otherwise a standalone get_db_session()
+    """
+    if db is not None:
+        yield db
+    else:
+        with get_db_session() as session:
+            yield session
+
+@contextmanager
+def pooled_cursor():
+    """
+    Cursor on a pooled raw pyodbc connection for hand-written SQL
+    
+    Borrows from the engine's pool instead of logging in per call; commits on
+    success, rolls back on error and returns the connection to the pool.
+    """
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.fast_executemany = True
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
 def test_connection():
-    """Test database connection"""
+    """
+    Test database connection
+    
+    Always sends a SELECT 1 round-trip: pool_pre_ping is off by default, so a
+    pooled connection can outlive the server, and driver-side checks (such as
+    getinfo) would still report it as connected.
+    """
     try:
-        with engine.connect() as connection:
-            result = connection.execute(text("SELECT 1 as test"))
-            test_value = result.fetchone()[0]
-            if test_value == 1:
-                logging.info("Database connection successful")
-                return True
-            else:
-                logging.error("Database connection test failed")
-                return False
+        raw = engine.raw_connection()
+        try:
+            cursor = raw.cursor()
+            try:
+                test_value = cursor.execute("SELECT 1").fetchone()[0]
+            finally:
+                cursor.close()
+        finally:
+            raw.close()
+        if test_value == 1:
+            logging.info("Database connection successful")
+            return True
+        else:
+            logging.error("Database connection test failed")
+            return False
     except Exception as e:
         logging.error(f"Database connection failed: {str(e)}")
         return False
 
+# CREATE DATABASE can't take a parameter, so the name is allow-listed before interpolation
+_DATABASE_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+@contextmanager
+def _with_admin_conn(database: str = "master"):
+    """Direct autocommit pyodbc connection for DDL, closed on exit"""
+    conn = pyodbc.connect(get_pyodbc_connection_string(database), autocommit=True, timeout=CONNECT_TIMEOUT)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+def _ensure_database(cursor):
+    """Create the application database on a master connection if it doesn't exist"""
+    if not _DATABASE_NAME_RE.match(DATABASE_CONFIG['database']):
+        raise ValueError(f"Invalid database name: {DATABASE_CONFIG['database']!r}")
+    
+    # Check if database exists (parameterized so SQL Server reuses the plan)
+    cursor.execute("SELECT name FROM sys.databases WHERE name = ?", DATABASE_CONFIG['database'])
+    
+    if not cursor.fetchone():
+        # Create database
+        cursor.execute(f"CREATE DATABASE [{DATABASE_CONFIG['database']}]")
+        logging.info(f"Database '{DATABASE_CONFIG['database']}' created successfully")
+    else:
+        logging.info(f"Database '{DATABASE_CONFIG['database']}' already exists")
+
 def create_database_if_not_exists():
     """Create database if it doesn't exist"""
     try:
-        # Use pyodbc directly for database creation
-        conn_str = f"DRIVER={{{DATABASE_CONFIG['driver']}}};SERVER={DATABASE_CONFIG['server']},{DATABASE_CONFIG['port']};DATABASE=master;UID={DATABASE_CONFIG['username']};PWD={DATABASE_CONFIG['password']}"
-        
-        conn = pyodbc.connect(conn_str, autocommit=True)
-        cursor = conn.cursor()
-        
-        # Check if database exists
-        cursor.execute(f"SELECT name FROM sys.databases WHERE name = '{DATABASE_CONFIG['database']}'")
-        
-        if not cursor.fetchone():
-            # Create database
-            cursor.execute(f"CREATE DATABASE [{DATABASE_CONFIG['database']}]")
-            logging.info(f"Database '{DATABASE_CONFIG['database']}' created successfully")
-        else:
-            logging.info(f"Database '{DATABASE_CONFIG['database']}' already exists")
-        
-        conn.close()
+        with _with_admin_conn() as conn:
+            _ensure_database(conn.cursor())
         return True
         
     except Exception as e:
         logging.error(f"Error creating database: {str(e)}")
         return False
 
-def create_tables():
-    """Create all database tables"""
+# Table DDL by table name, run as a single batch by create_tables(). UUID keys are CHAR(36) with a
+# binary collation (half the width of NVARCHAR, and index seeks still work when
+# pyodbc binds the value as NVARCHAR); enum-like columns are ASCII VARCHAR.
+# User-facing text stays NVARCHAR.
+_TABLE_DDL = {
+    # Users table
+    "users": """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='users' AND xtype='U')
+        CREATE TABLE users (
+            id CHAR(36) COLLATE Latin1_General_100_BIN2 PRIMARY KEY,
+            email NVARCHAR(255) UNIQUE NOT NULL,
+            name NVARCHAR(255) NOT NULL,
+            provider VARCHAR(50) NOT NULL,
+            profile_pic NVARCHAR(500),
+            status VARCHAR(20) DEFAULT 'active',
+            signup_timestamp DATETIME2 DEFAULT GETUTCDATE(),
+            first_login DATETIME2,
+            last_login DATETIME2,
+            approval_date DATETIME2,
+            denial_reason NTEXT,
+            reapply_count INT DEFAULT 0,
+            added_by NVARCHAR(100) DEFAULT 'system',
+            notes NTEXT
+        )
+    """,
+    
+    # User Activities table
+    "user_activities": """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='user_activities' AND xtype='U')
+        CREATE TABLE user_activities (
+            id CHAR(36) COLLATE Latin1_General_100_BIN2 PRIMARY KEY,
+            user_id CHAR(36) COLLATE Latin1_General_100_BIN2 NOT NULL,
+            session_id NVARCHAR(100) NOT NULL,
+            login_time DATETIME2 NOT NULL,
+            logout_time DATETIME2,
+            status VARCHAR(20) DEFAULT 'active',
+            duration_mins INT DEFAULT 0,
+            page_views INT DEFAULT 0,
+            actions_taken NVARCHAR(MAX),
+            ip_address NVARCHAR(45),
+            last_activity DATETIME2,
+            idle_timeout INT DEFAULT 15,
+            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+        )
+    """,
+    
+    # Campaigns table
+    "campaigns": """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='campaigns' AND xtype='U')
+        CREATE TABLE campaigns (
+            id CHAR(36) COLLATE Latin1_General_100_BIN2 PRIMARY KEY,
+            user_id CHAR(36) COLLATE Latin1_General_100_BIN2 NOT NULL,
+            name NVARCHAR(255) NOT NULL,
+            type VARCHAR(50) DEFAULT 'search',
+            daily_budget FLOAT NOT NULL,
+            bidding_strategy VARCHAR(50) DEFAULT 'manual_cpc',
+            status VARCHAR(20) DEFAULT 'draft',
+            created_at DATETIME2 DEFAULT GETUTCDATE(),
+            updated_at DATETIME2 DEFAULT GETUTCDATE(),
+            campaign_data NVARCHAR(MAX),
+            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+        )
+    """,
+    
+    # Simulations table
+    "simulations": """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='simulations' AND xtype='U')
+        CREATE TABLE simulations (
+            id CHAR(36) COLLATE Latin1_General_100_BIN2 PRIMARY KEY,
+            user_id CHAR(36) COLLATE Latin1_General_100_BIN2 NOT NULL,
+            campaign_id CHAR(36) COLLATE Latin1_General_100_BIN2,
+            simulation_type VARCHAR(50) DEFAULT 'auction',
+            settings NVARCHAR(MAX),
+            results NVARCHAR(MAX),
+            status VARCHAR(20) DEFAULT 'running',
+            created_at DATETIME2 DEFAULT GETUTCDATE(),
+            completed_at DATETIME2,
+            execution_time_ms INT,
+            FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
+            FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE NO ACTION
+        )
+    """,
+    
+    # Keyword Data table
+    "keyword_data": """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='keyword_data' AND xtype='U')
+        CREATE TABLE keyword_data (
+            id CHAR(36) COLLATE Latin1_General_100_BIN2 PRIMARY KEY,
+            keyword NVARCHAR(255) NOT NULL,
+            match_type VARCHAR(20) NOT NULL,
+            avg_cpc FLOAT,
+            competition VARCHAR(20),
+            search_volume INT,
+            quality_score INT,
+            created_at DATETIME2 DEFAULT GETUTCDATE(),
+            updated_at DATETIME2 DEFAULT GETUTCDATE()
+        )
+    """,
+    
+    # Access Requests table
+    "access_requests": """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='access_requests' AND xtype='U')
+        CREATE TABLE access_requests (
+            id CHAR(36) COLLATE Latin1_General_100_BIN2 PRIMARY KEY,
+            email NVARCHAR(255) NOT NULL,
+            name NVARCHAR(255) NOT NULL,
+            company NVARCHAR(255),
+            role NVARCHAR(100),
+            reason NTEXT,
+            status VARCHAR(20) DEFAULT 'pending',
+            requested_at DATETIME2 DEFAULT GETUTCDATE(),
+            reviewed_at DATETIME2,
+            reviewed_by NVARCHAR(100),
+            notes NTEXT
+        )
+    """
+}
+
+# In-Memory OLTP variant of user_activities (DB_MEMORY_OPTIMIZED_ACTIVITIES=true):
+# latch-free inserts for the session-tracking write path. Memory-optimized tables
+# can't reference disk-based tables, so the users FK is dropped (the ORM still
+# cascades deletes) and the indexes are declared inline instead of by CREATE INDEX.
+# SCHEMA_ONLY durability skips the transaction log but empties the table on restart.
+MEMORY_OPTIMIZED_ACTIVITIES = os.getenv("DB_MEMORY_OPTIMIZED_ACTIVITIES", "false").lower() == "true"
+ACTIVITY_DURABILITY = os.getenv("DB_ACTIVITY_DURABILITY", "SCHEMA_ONLY").upper()
+
+_MEMORY_OPTIMIZED_ACTIVITIES_DDL = """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='user_activities' AND xtype='U')
+        CREATE TABLE user_activities (
+            id CHAR(36) COLLATE Latin1_General_100_BIN2 NOT NULL
+                PRIMARY KEY NONCLUSTERED HASH WITH (BUCKET_COUNT = 1048576),
+            user_id CHAR(36) COLLATE Latin1_General_100_BIN2 NOT NULL,
+            session_id NVARCHAR(100) NOT NULL,
+            login_time DATETIME2 NOT NULL,
+            logout_time DATETIME2,
+            status VARCHAR(20) DEFAULT 'active',
+            duration_mins INT DEFAULT 0,
+            page_views INT DEFAULT 0,
+            actions_taken NVARCHAR(MAX),
+            ip_address NVARCHAR(45),
+            last_activity DATETIME2,
+            idle_timeout INT DEFAULT 15,
+            INDEX idx_user_activities_session_id NONCLUSTERED (session_id),
+            INDEX idx_ua_user_login NONCLUSTERED (user_id, login_time DESC)
+        ) WITH (MEMORY_OPTIMIZED = ON, DURABILITY = {durability})
+    """
+
+# Memory-optimized tables need a MEMORY_OPTIMIZED_DATA filegroup (built in on Azure
+# SQL Database, engine edition 5); its container goes next to the primary data file.
+# Elevating to snapshot lets ORM transactions read the table under READ COMMITTED.
+_MEMORY_OPTIMIZED_FILEGROUP_DDL = r"""
+        IF SERVERPROPERTY('EngineEdition') <> 5 AND NOT EXISTS (SELECT 1 FROM sys.filegroups WHERE type = 'FX')
+        BEGIN
+            DECLARE @data_file NVARCHAR(260) = (SELECT TOP 1 physical_name FROM sys.database_files WHERE type = 0);
+            DECLARE @data_dir NVARCHAR(260) = LEFT(@data_file, LEN(@data_file) - PATINDEX('%[\/]%', REVERSE(@data_file)) + 1);
+            ALTER DATABASE CURRENT ADD FILEGROUP mod_data CONTAINS MEMORY_OPTIMIZED_DATA;
+            DECLARE @add_file NVARCHAR(MAX) = N'ALTER DATABASE CURRENT ADD FILE (NAME = ''mod_data'', FILENAME = '''
+                + @data_dir + DB_NAME() + N'_mod_data'') TO FILEGROUP mod_data';
+            EXEC (@add_file);
+        END;
+        ALTER DATABASE CURRENT SET MEMORY_OPTIMIZED_ELEVATE_TO_SNAPSHOT = ON
+    """
+
+def _table_statements():
+    """CREATE TABLE statements for the configured storage options"""
+    tables = dict(_TABLE_DDL)
+    if MEMORY_OPTIMIZED_ACTIVITIES:
+        if ACTIVITY_DURABILITY not in ("SCHEMA_ONLY", "SCHEMA_AND_DATA"):
+            raise ValueError(f"Invalid DB_ACTIVITY_DURABILITY: {ACTIVITY_DURABILITY!r}")
+        tables["user_activities"] = _MEMORY_OPTIMIZED_ACTIVITIES_DDL.format(durability=ACTIVITY_DURABILITY)
+    return list(tables.values())
+
+def _disk_indexes(indexes):
+    """Skip user_activities indexes when that table is memory-optimized (they are declared inline)"""
+    if not MEMORY_OPTIMIZED_ACTIVITIES:
+        return indexes
+    return [index for index in indexes if index[1] != "user_activities"]
+
+# (index name, table, column list) - created together with the tables
+_INDEX_DDL = [
+    ("idx_access_requests_email", "access_requests", "(email)"),
+]
+
+# Secondary indexes that can be built after startup (see create_secondary_indexes).
+# The composite indexes match the per-user listings (filter on user_id, newest
+# first) so they seek and read in order instead of sorting after key lookups.
+_SECONDARY_INDEX_DDL = [
+    ("idx_user_activities_session_id", "user_activities", "(session_id)"),
+    ("idx_campaigns_user_created", "campaigns", "(user_id, created_at DESC) INCLUDE (status, name, daily_budget)"),
+    ("idx_sim_user_created", "simulations", "(user_id, created_at DESC) INCLUDE (campaign_id, status)"),
+    ("idx_ua_user_login", "user_activities", "(user_id, login_time DESC) INCLUDE (session_id, status)"),
+    # Newest-first user listing; get_all_users keyset pages seek straight to the last row seen
+    ("idx_users_signup", "users", "(signup_timestamp DESC, id DESC)"),
+    # Filtered to live sessions: the per-user "online" probe in get_all_users is a narrow seek
+    ("idx_ua_online_lookup", "user_activities",
+     "(user_id, last_activity) INCLUDE (status, logout_time) WHERE status = 'active' AND logout_time IS NULL"),
+    ("idx_keyword_data_keyword", "keyword_data", "(keyword)"),
+    # Status-filtered request listings read in requested_at order straight from the index
+    ("idx_access_requests_status_requested", "access_requests", "(status, requested_at)"),
+]
+
+# Indexes superseded by the composite ones above, dropped from existing databases
+_OBSOLETE_INDEXES = [
+    ("idx_campaigns_user_id", "campaigns"),
+    ("idx_simulations_user_id", "simulations"),
+    ("idx_user_activities_user_id", "user_activities"),
+    # Duplicated the index behind users.email's UNIQUE constraint, which serves email lookups
+    ("idx_users_email", "users"),
+]
+
+def _index_ddl(name: str, table: str, columns: str) -> str:
+    """CREATE INDEX guarded by an existence check (SQL Server has no CREATE INDEX IF NOT EXISTS)"""
+    return (
+        f"IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = '{name}' AND object_id = OBJECT_ID('{table}'))\n"
+        f"    CREATE INDEX {name} ON {table}{columns}"
+    )
+
+def _drop_index_ddl(name: str, table: str) -> str:
+    """DROP INDEX guarded by an existence check"""
+    return (
+        f"IF EXISTS (SELECT 1 FROM sys.indexes WHERE name = '{name}' AND object_id = OBJECT_ID('{table}'))\n"
+        f"    DROP INDEX {name} ON {table}"
+    )
+
+def _secondary_index_statements():
+    """Statements that build the secondary indexes and retire the ones they replace"""
+    return (
+        [_index_ddl(*index) for index in _disk_indexes(_SECONDARY_INDEX_DDL)]
+        + [_drop_index_ddl(*index) for index in _OBSOLETE_INDEXES]
+    )
+
+def _execute_batch(cursor, statements):
+    """Run statements as one batch (a single round-trip) and surface errors from any of them"""
+    cursor.execute("SET NOCOUNT ON;\n" + ";\n".join(statements) + ";")
+    # pyodbc only raises errors from later statements in a batch while walking the result sets
+    while cursor.nextset():
+        pass
+
+def _create_schema(cursor, create_secondary_indexes: bool = True):
+    """Create all tables and indexes in a single batch on the current database"""
+    if MEMORY_OPTIMIZED_ACTIVITIES:
+        # Separate batch: the filegroup must exist before the table batch is compiled
+        _execute_batch(cursor, [_MEMORY_OPTIMIZED_FILEGROUP_DDL])
+    statements = _table_statements() + [_index_ddl(*index) for index in _disk_indexes(_INDEX_DDL)]
+    if create_secondary_indexes:
+        statements += _secondary_index_statements()
+    _execute_batch(cursor, statements)
+    logging.info("Database tables created successfully")
+
+def create_tables(create_secondary_indexes: bool = True):
+    """
+    Create all database tables and indexes in a single batch
+    
+    Args:
+        create_secondary_indexes: Also build the secondary indexes; pass False
+            to defer them to create_secondary_indexes()
+    """
     try:
         # Use pyodbc directly to create tables
-        conn_str = f"DRIVER={{{DATABASE_CONFIG['driver']}}};SERVER={DATABASE_CONFIG['server']},{DATABASE_CONFIG['port']};DATABASE={DATABASE_CONFIG['database']};UID={DATABASE_CONFIG['username']};PWD={DATABASE_CONFIG['password']}"
-        
-        conn = pyodbc.connect(conn_str, autocommit=True)
-        cursor = conn.cursor()
-        
-        # Create Users table
-        cursor.execute("""
-            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='users' AND xtype='U')
-            CREATE TABLE users (
-                id NVARCHAR(36) PRIMARY KEY,
-                email NVARCHAR(255) UNIQUE NOT NULL,
-                name NVARCHAR(255) NOT NULL,
-                provider NVARCHAR(50) NOT NULL,
-                profile_pic NVARCHAR(500),
-                status NVARCHAR(20) DEFAULT 'active',
-                signup_timestamp DATETIME2 DEFAULT GETUTCDATE(),
-                first_login DATETIME2,
-                last_login DATETIME2,
-                approval_date DATETIME2,
-                denial_reason NTEXT,
-                reapply_count INT DEFAULT 0,
-                added_by NVARCHAR(100) DEFAULT 'system',
-                notes NTEXT
-            )
-        """)
-        
-        # Create User Activities table
-        cursor.execute("""
-            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='user_activities' AND xtype='U')
-            CREATE TABLE user_activities (
-                id NVARCHAR(36) PRIMARY KEY,
-                user_id NVARCHAR(36) NOT NULL,
-                session_id NVARCHAR(100) NOT NULL,
-                login_time DATETIME2 NOT NULL,
-                logout_time DATETIME2,
-                status NVARCHAR(20) DEFAULT 'active',
-                duration_mins INT DEFAULT 0,
-                page_views INT DEFAULT 0,
-                actions_taken NVARCHAR(MAX),
-                ip_address NVARCHAR(45),
-                last_activity DATETIME2,
-                idle_timeout INT DEFAULT 15,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-            )
-        """)
-        
-        # Create Campaigns table
-        cursor.execute("""
-            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='campaigns' AND xtype='U')
-            CREATE TABLE campaigns (
-                id NVARCHAR(36) PRIMARY KEY,
-                user_id NVARCHAR(36) NOT NULL,
-                name NVARCHAR(255) NOT NULL,
-                type NVARCHAR(50) DEFAULT 'search',
-                daily_budget FLOAT NOT NULL,
-                bidding_strategy NVARCHAR(50) DEFAULT 'manual_cpc',
-                status NVARCHAR(20) DEFAULT 'draft',
-                created_at DATETIME2 DEFAULT GETUTCDATE(),
-                updated_at DATETIME2 DEFAULT GETUTCDATE(),
-                campaign_data NVARCHAR(MAX),
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-            )
-        """)
-        
-        # Create Simulations table
-        cursor.execute("""
-            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='simulations' AND xtype='U')
-            CREATE TABLE simulations (
-                id NVARCHAR(36) PRIMARY KEY,
-                user_id NVARCHAR(36) NOT NULL,
-                campaign_id NVARCHAR(36),
-                simulation_type NVARCHAR(50) DEFAULT 'auction',
-                settings NVARCHAR(MAX),
-                results NVARCHAR(MAX),
-                status NVARCHAR(20) DEFAULT 'running',
-                created_at DATETIME2 DEFAULT GETUTCDATE(),
-                completed_at DATETIME2,
-                execution_time_ms INT,
-                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE,
-                FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE NO ACTION
-            )
-        """)
-        
-        # Create Keyword Data table
-        cursor.execute("""
-            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='keyword_data' AND xtype='U')
-            CREATE TABLE keyword_data (
-                id NVARCHAR(36) PRIMARY KEY,
-                keyword NVARCHAR(255) NOT NULL,
-                match_type NVARCHAR(20) NOT NULL,
-                avg_cpc FLOAT,
-                competition NVARCHAR(20),
-                search_volume INT,
-                quality_score INT,
-                created_at DATETIME2 DEFAULT GETUTCDATE(),
-                updated_at DATETIME2 DEFAULT GETUTCDATE()
-            )
-        """)
-        
-        # Create Access Requests table
-        cursor.execute("""
-            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='access_requests' AND xtype='U')
-            CREATE TABLE access_requests (
-                id NVARCHAR(36) PRIMARY KEY,
-                email NVARCHAR(255) NOT NULL,
-                name NVARCHAR(255) NOT NULL,
-                company NVARCHAR(255),
-                role NVARCHAR(100),
-                reason NTEXT,
-                status NVARCHAR(20) DEFAULT 'pending',
-                requested_at DATETIME2 DEFAULT GETUTCDATE(),
-                reviewed_at DATETIME2,
-                reviewed_by NVARCHAR(100),
-                notes NTEXT
-            )
-        """)
-        
-        # Create indexes (SQL Server doesn't support IF NOT EXISTS for indexes)
-        try:
-            cursor.execute("CREATE INDEX idx_users_email ON users(email)")
-        except:
-            pass  # Index might already exist
-        
-        try:
-            cursor.execute("CREATE INDEX idx_user_activities_user_id ON user_activities(user_id)")
-        except:
-            pass
-        
-        try:
-            cursor.execute("CREATE INDEX idx_user_activities_session_id ON user_activities(session_id)")
-        except:
-            pass
-        
-        try:
-            cursor.execute("CREATE INDEX idx_campaigns_user_id ON campaigns(user_id)")
-        except:
-            pass
-        
-        try:
-            cursor.execute("CREATE INDEX idx_simulations_user_id ON simulations(user_id)")
-        except:
-            pass
-        
-        try:
-            cursor.execute("CREATE INDEX idx_keyword_data_keyword ON keyword_data(keyword)")
-        except:
-            pass
+        with _with_admin_conn(DATABASE_CONFIG['database']) as conn:
+            _create_schema(conn.cursor(), create_secondary_indexes)
+        return True
         
-        try:
-            cursor.execute("CREATE INDEX idx_access_requests_email ON access_requests(email)")
-        except:
-            pass
+    except Exception as e:
+        logging.error(f"Error creating tables: {str(e)}")
+        return False
+
+def create_secondary_indexes():
+    """Create the secondary indexes deferred by create_tables(create_secondary_indexes=False)"""
+    try:
+        with _with_admin_conn(DATABASE_CONFIG['database']) as conn:
+            _execute_batch(conn.cursor(), _secondary_index_statements())
         
-        conn.close()
-        logging.info("Database tables created successfully")
+        logging.info("Secondary indexes created successfully")
         return True
         
     except Exception as e:
-        logging.error(f"Error creating tables: {str(e)}")
+        logging.error(f"Error creating secondary indexes: {str(e)}")
         return False
 
-def initialize_database():
-    """Initialize database - create if needed and create tables"""
+@dataclass
+class DatabaseInitResult:
+    """Outcome of initialize_database(); truthy when initialization succeeded"""
+    ok: bool
+    connection_verified: bool  # The engine's connection test passed during initialization
+    
+    def __bool__(self) -> bool:
+        return self.ok
+
+def initialize_database(create_secondary_indexes: bool = True) -> DatabaseInitResult:
+    """
+    Initialize database - create if needed and create tables
+    
+    Args:
+        create_secondary_indexes: Build the secondary indexes as part of
+            initialization; pass False when the caller runs
+            create_secondary_indexes() later (e.g. after the API is serving)
+    
+    Returns:
+        DatabaseInitResult - callers only need to re-run test_connection()
+        when connection_verified is False (the database was just created)
+    """
     logging.info("Initializing database...")
     
     # Test connection first
-    if not test_connection():
-        # Try to create database if connection fails
+    connection_verified = test_connection()
+    if connection_verified:
+        # Create tables
+        if not create_tables(create_secondary_indexes=create_secondary_indexes):
+            logging.error("Failed to create tables")
+            return DatabaseInitResult(ok=False, connection_verified=True)
+    else:
+        # Try to create database if connection fails, then build the schema over
+        # the same master connection (one login instead of two)
         logging.info("Connection failed, attempting to create database...")
-        if not create_database_if_not_exists():
-            logging.error("Failed to create database")
-            return False
-    
-    # Create tables
-    if not create_tables():
-        logging.error("Failed to create tables")
-        return False
+        try:
+            with _with_admin_conn() as conn:
+                cursor = conn.cursor()
+                _ensure_database(cursor)
+                cursor.execute(f"USE [{DATABASE_CONFIG['database']}]")
+                _create_schema(cursor, create_secondary_indexes)
+        except Exception as e:
+            logging.error(f"Failed to create database and tables: {str(e)}")
+            return DatabaseInitResult(ok=False, connection_verified=False)
     
     logging.info("Database initialization completed successfully")
-    return True
+    return DatabaseInitResult(ok=True, connection_verified=connection_verified)
+
+# Lazy initialization: the API starts serving without waiting on SQL Server and
+# database-backed routes call ensure_initialized() before their first query
+_initialized = False
+_init_lock = threading.Lock()
+_last_init_failure = None
+INIT_RETRY_SECONDS = 30  # Minimum wait before retrying a failed initialization
+
+def ensure_initialized() -> bool:
+    """
+    Initialize the database once per process (cheap after the first success)
+    
+    The first success also starts building the secondary indexes in a
+    background thread.
+    
+    Returns:
+        True if the database is ready; failures are retried at most every
+        INIT_RETRY_SECONDS so an unavailable server isn't hit on every request
+    """
+    global _initialized, _last_init_failure
+    if _initialized:
+        return True
+    with _init_lock:
+        if _initialized:
+            return True
+        if _last_init_failure is not None and time.monotonic() - _last_init_failure < INIT_RETRY_SECONDS:
+            return False
+        try:
+            _initialized = bool(initialize_database(create_secondary_indexes=False))
+        except Exception as e:
+            logging.error(f"Database initialization error: {str(e)}")
+        _last_init_failure = None if _initialized else time.monotonic()
+        if _initialized:
+            # Whichever caller gets here first (startup task or a request), the
+            # deferred indexes are built once, without holding up that caller
+            threading.Thread(target=create_secondary_indexes, name="create-secondary-indexes", daemon=True).start()
+        return _initialized
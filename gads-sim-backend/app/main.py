@@ -3,21 +3,25 @@ Search Campaign Simulator - Main FastAPI Application
 """
 import sys
 import os
+import asyncio
+import importlib
 
 # Add the parent directory to the Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
-# Try to load environment variables
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    print("Warning: python-dotenv not installed. Using system environment variables.")
-    print("Install with: pip install python-dotenv")
-    # Continue without dotenv - will use system env vars
+# Try to load environment variables (set LOAD_DOTENV=false where the environment
+# is already provided, e.g. production containers)
+if os.getenv("LOAD_DOTENV", "true").lower() == "true":
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        print("Warning: python-dotenv not installed. Using system environment variables.")
+        print("Install with: pip install python-dotenv")
+        # Continue without dotenv - will use system env vars
 
 # Create FastAPI app
 app = FastAPI(
@@ -26,25 +30,61 @@ app = FastAPI(
     version="1.0.0"
 )
 
-# Database initialization
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database on startup"""
+def require_database():
+    """Dependency for database-backed routes: initialize on first use or fail with 503"""
+    from app.database import ensure_initialized
+    if not ensure_initialized():
+        raise HTTPException(status_code=503, detail="Database unavailable")
+
+# Routers for campaign wizard: (module, prefix, tags, needs_database). Imported at
+# startup rather than with this module so importing the app stays cheap.
+ROUTERS = [
+    ("app.api.simulate", "/api", ["Simulation"], False),
+    ("app.api.enhanced_simulate", "/api", ["Enhanced Simulation"], False),
+    ("app.api.cached_simulate", "/api", ["Cached Simulation"], False),
+    ("app.api.enhanced_visualization", "/api", ["Enhanced Visualization"], False),
+    ("app.api.keywords", "/api", ["Keywords"], False),
+    ("app.api.ai_max", "/api", ["AI Max"], False),
+    ("app.api.auth", "/api", ["Authentication"], False),
+    ("app.api.simple_auth", "/api", ["Simple Auth"], False),
+    ("app.api.access_requests", "/api", ["Access Requests"], True),
+    ("app.api.user_management", "/api", ["User Management"], True),
+    ("app.api.unified_user_tracking", "/api", ["Unified User Tracking"], True),
+]
+
+def register_routers():
+    """Import the API router modules and register their routes (campaign wizard only)"""
+    # Startup can run more than once per process (e.g. repeated test clients)
+    if getattr(app.state, "routers_registered", False):
+        return
+    for module_path, prefix, tags, needs_database in ROUTERS:
+        module = importlib.import_module(module_path)
+        dependencies = [Depends(require_database)] if needs_database else []
+        app.include_router(module.router, prefix=prefix, tags=tags, dependencies=dependencies)
+    app.state.routers_registered = True
+
+def initialize_database_in_background():
+    """Initialize the database off the request path (secondary indexes follow in the background)"""
     try:
-        from app.database import initialize_database, test_connection
+        from app.database import ensure_initialized
         print("Initializing database...")
-        if initialize_database():
+        if ensure_initialized():
             print("✅ Database initialized successfully")
-            if test_connection():
-                print("✅ Database connection verified")
-            else:
-                print("⚠️ Database connection test failed")
         else:
-            print("❌ Database initialization failed")
+            print("❌ Database initialization failed (will retry on the next database request)")
     except Exception as e:
         print(f"❌ Database initialization error: {str(e)}")
         print("Application will continue without database features")
 
+@app.on_event("startup")
+async def startup_event():
+    """Register routes and start database initialization without blocking startup"""
+    register_routers()
+    
+    # Serve traffic (including /health) while SQL Server is reached in a worker thread;
+    # keep a reference so the task isn't garbage collected mid-run
+    app.state.database_init_task = asyncio.create_task(asyncio.to_thread(initialize_database_in_background))
+
 # Configure CORS (update origins for production)
 app.add_middleware(
     CORSMiddleware,
@@ -54,22 +94,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Import routers for campaign wizard
-from app.api import simulate, keywords, ai_max, auth, simple_auth, access_requests, user_management, unified_user_tracking, enhanced_simulate, cached_simulate, enhanced_visualization
-
-# Register routes (campaign wizard only)
-app.include_router(simulate.router, prefix="/api", tags=["Simulation"])
-app.include_router(enhanced_simulate.router, prefix="/api", tags=["Enhanced Simulation"])
-app.include_router(cached_simulate.router, prefix="/api", tags=["Cached Simulation"])
-app.include_router(enhanced_visualization.router, prefix="/api", tags=["Enhanced Visualization"])
-app.include_router(keywords.router, prefix="/api", tags=["Keywords"])
-app.include_router(ai_max.router, prefix="/api", tags=["AI Max"])
-app.include_router(auth.router, prefix="/api", tags=["Authentication"])
-app.include_router(simple_auth.router, prefix="/api", tags=["Simple Auth"])
-app.include_router(access_requests.router, prefix="/api", tags=["Access Requests"])
-app.include_router(user_management.router, prefix="/api", tags=["User Management"])
-app.include_router(unified_user_tracking.router, prefix="/api", tags=["Unified User Tracking"])
-
 
 @app.get("/")
 async def root():
@@ -1,18 +1,73 @@
 """
 Database Models for Google Ads Simulator
 """
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, CHAR, DateTime, Float, Text, Boolean, ForeignKey
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
+from sqlalchemy.types import TypeDecorator, UnicodeText
 from datetime import datetime
+import json
+import os
+import time
 import uuid
 
+# orjson is optional - fall back to the standard library json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 Base = declarative_base()
 
+# UUID key columns: fixed-width ASCII with a binary collation (matches the DDL in app.database)
+ID_TYPE = CHAR(36, collation="Latin1_General_100_BIN2")
+
+def sequential_uuid() -> str:
+    """
+    Time-ordered UUID string (RFC 9562 version 7 layout)
+    
+    The millisecond timestamp leads, so new primary keys sort after existing
+    ones and inserts append to the clustered index instead of splitting pages
+    the way random uuid4 keys do.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (unix_ms & 0xFFFFFFFFFFFF) << 80   # 48-bit timestamp
+        | 0x7 << 76                        # version 7
+        | (rand >> 68) << 64               # 12 random bits
+        | 0b10 << 62                       # RFC 4122 variant
+        | (rand & 0x3FFFFFFFFFFFFFFF)      # 62 random bits
+    )
+    return str(uuid.UUID(int=value))
+
+class FastJSON(TypeDecorator):
+    """
+    JSON column stored as NVARCHAR(MAX), (de)serialized with orjson when installed
+    
+    Non-string dict keys and numpy values are accepted like the simulation
+    results produce them.
+    """
+    impl = UnicodeText
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+        return json.dumps(value)
+    
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return orjson.loads(value) if ORJSON_AVAILABLE else json.loads(value)
+
 class User(Base):
     __tablename__ = "users"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(ID_TYPE, primary_key=True, default=sequential_uuid)
     email = Column(String(255), unique=True, nullable=False, index=True)
     name = Column(String(255), nullable=False)
     provider = Column(String(50), nullable=False)  # google, microsoft, etc.
@@ -35,15 +90,15 @@ class User(Base):
 class UserActivity(Base):
     __tablename__ = "user_activities"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    id = Column(ID_TYPE, primary_key=True, default=sequential_uuid)
+    user_id = Column(ID_TYPE, ForeignKey("users.id"), nullable=False, index=True)
     session_id = Column(String(100), nullable=False, index=True)
     login_time = Column(DateTime, nullable=False)
     logout_time = Column(DateTime, nullable=True)
     status = Column(String(20), default="active")  # active, ended, timeout
     duration_mins = Column(Integer, default=0)
     page_views = Column(Integer, default=0)
-    actions_taken = Column(JSON, default=list)  # Store as JSON array
+    actions_taken = Column(FastJSON, nullable=True, default=None)  # JSON array; NULL when no actions (read as [])
     ip_address = Column(String(45), nullable=True)  # IPv6 compatible
     last_activity = Column(DateTime, nullable=True)
     idle_timeout = Column(Integer, default=15)
@@ -54,8 +109,8 @@ class UserActivity(Base):
 class Campaign(Base):
     __tablename__ = "campaigns"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    id = Column(ID_TYPE, primary_key=True, default=sequential_uuid)
+    user_id = Column(ID_TYPE, ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     type = Column(String(50), default="search")
     daily_budget = Column(Float, nullable=False)
@@ -63,7 +118,7 @@ class Campaign(Base):
     status = Column(String(20), default="draft")  # draft, active, paused, completed
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    campaign_data = Column(JSON, nullable=True)  # Store full campaign configuration
+    campaign_data = Column(FastJSON, nullable=True)  # Store full campaign configuration
     
     # Relationships
     user = relationship("User", back_populates="campaigns")
@@ -72,12 +127,12 @@ class Campaign(Base):
 class Simulation(Base):
     __tablename__ = "simulations"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False, index=True)
-    campaign_id = Column(String(36), ForeignKey("campaigns.id"), nullable=True, index=True)
+    id = Column(ID_TYPE, primary_key=True, default=sequential_uuid)
+    user_id = Column(ID_TYPE, ForeignKey("users.id"), nullable=False, index=True)
+    campaign_id = Column(ID_TYPE, ForeignKey("campaigns.id"), nullable=True, index=True)
     simulation_type = Column(String(50), default="auction")  # auction, keyword_planner, etc.
-    settings = Column(JSON, nullable=True)  # Simulation settings
-    results = Column(JSON, nullable=True)  # Simulation results
+    settings = Column(FastJSON, nullable=True)  # Simulation settings
+    results = Column(FastJSON, nullable=True)  # Simulation results
     status = Column(String(20), default="running")  # running, completed, failed
     created_at = Column(DateTime, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
@@ -90,7 +145,7 @@ class Simulation(Base):
 class KeywordData(Base):
     __tablename__ = "keyword_data"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(ID_TYPE, primary_key=True, default=sequential_uuid)
     keyword = Column(String(255), nullable=False, index=True)
     match_type = Column(String(20), nullable=False)  # exact, phrase, broad
     avg_cpc = Column(Float, nullable=True)
@@ -103,7 +158,7 @@ class KeywordData(Base):
 class AccessRequest(Base):
     __tablename__ = "access_requests"
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(ID_TYPE, primary_key=True, default=sequential_uuid)
     email = Column(String(255), nullable=False, index=True)
     name = Column(String(255), nullable=False)
     company = Column(String(255), nullable=True)
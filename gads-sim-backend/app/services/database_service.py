@@ -1,15 +1,170 @@
 """
 Database Service Layer for Google Ads Simulator
 """
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc, asc
-from typing import List, Optional, Dict, Any
+from sqlalchemy.orm import Session, object_session, raiseload, selectinload
+from sqlalchemy import and_, or_, desc, asc, event, func, insert, literal_column, select, update
+from typing import Iterator, List, Optional, Dict, Any
 from datetime import datetime, timedelta
-import uuid
-import json
 
-from app.models import User, UserActivity, Campaign, Simulation, KeywordData, AccessRequest
-from app.database import get_db_session
+from app.models import User, UserActivity, Campaign, Simulation, KeywordData, AccessRequest, sequential_uuid
+from app.database import get_db_session, pooled_cursor, use_session
+from app.utils.query_cache import cached_query, invalidate_table
+
+FETCH_BATCH_SIZE = 500
+# Minutes since last_activity before an open session no longer counts as online
+ONLINE_IDLE_MINUTES = 15
+
+def _iter_dicts(cursor, batch_size: int = FETCH_BATCH_SIZE) -> Iterator[dict]:
+    """Yield the remaining rows as dicts keyed by the SELECT's column names, one batch at a time"""
+    columns = [column[0] for column in cursor.description]
+    cursor.arraysize = batch_size
+    while True:
+        rows = cursor.fetchmany()
+        if not rows:
+            return
+        for row in rows:
+            yield dict(zip(columns, row))
+
+def _fetch_dicts(cursor) -> List[dict]:
+    """Fetch the remaining rows as dicts keyed by the SELECT's column names"""
+    return list(_iter_dicts(cursor))
+
+def _skip_to_rowset(cursor) -> bool:
+    """Advance past rowcount-only results to the next result set that has rows (False if none)"""
+    while cursor.description is None:
+        if not cursor.nextset():
+            return False
+    return True
+
+def _fetch_one_dict(cursor) -> Optional[dict]:
+    """Fetch the next row as a dict keyed by the SELECT's column names, or None"""
+    row = cursor.fetchone()
+    if row is None:
+        return None
+    return dict(zip([column[0] for column in cursor.description], row))
+
+# SQL for the raw pyodbc paths, built once at import so each call reuses the same
+# statement text (and the server's cached plan for it)
+# No SET NOCOUNT ON: a SET in an ad-hoc batch sticks to the pooled connection and
+# would break the ORM's rowcount checks for later UPDATEs on it
+_SQL_MERGE_USER = """
+    MERGE users WITH (HOLDLOCK) AS t
+    USING (SELECT ? AS email) AS s ON t.email = s.email
+    WHEN NOT MATCHED THEN
+        INSERT (id, email, name, provider, profile_pic, status, 
+                signup_timestamp, first_login, last_login, approval_date, 
+                reapply_count, added_by)
+        VALUES (?, s.email, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    OUTPUT inserted.id, inserted.email, inserted.name;
+    IF @@ROWCOUNT = 0
+        SELECT id, email, name FROM users WHERE email = ?;
+"""
+
+_SQL_USER_BY_EMAIL = "SELECT id, email, name, provider, profile_pic, status FROM users WHERE email = ?"
+
+_SQL_ALL_USERS_TEMPLATE = """
+    WITH online AS (
+        SELECT DISTINCT user_id FROM user_activities
+        WHERE status = 'active'
+        AND logout_time IS NULL
+        AND last_activity > DATEADD(MINUTE, ?, GETUTCDATE())
+    )
+    SELECT u.id, u.email, u.name, u.provider, u.profile_pic, 
+           CASE 
+               WHEN o.user_id IS NOT NULL THEN 'online'
+               ELSE u.status
+           END as status,
+           u.signup_timestamp, u.first_login, u.last_login, u.approval_date, 
+           u.denial_reason, u.reapply_count, u.added_by, u.notes
+    FROM users u
+    LEFT JOIN online o ON o.user_id = u.id
+    {page_filter}
+    ORDER BY u.signup_timestamp DESC, u.id DESC
+    OFFSET ? ROWS FETCH NEXT ? ROWS ONLY
+"""
+_SQL_ALL_USERS = _SQL_ALL_USERS_TEMPLATE.format(page_filter="")
+_SQL_ALL_USERS_AFTER = _SQL_ALL_USERS_TEMPLATE.format(
+    page_filter="WHERE u.signup_timestamp < ? OR (u.signup_timestamp = ? AND u.id < ?)"
+)
+
+_SQL_INSERT_ACTIVITY = """
+    INSERT INTO user_activities (id, user_id, session_id, login_time, 
+                                ip_address, last_activity, status, 
+                                duration_mins, page_views, idle_timeout)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_ALL_ACTIVITIES = """
+    SELECT 
+        ua.id,
+        ua.user_id,
+        u.email,
+        u.name,
+        ua.session_id,
+        ua.login_time,
+        ua.logout_time,
+        ua.ip_address,
+        ua.last_activity,
+        ua.status,
+        ua.duration_mins,
+        ua.page_views,
+        ua.idle_timeout
+    FROM user_activities ua
+    LEFT JOIN users u ON ua.user_id = u.id
+    ORDER BY ua.login_time DESC
+    OFFSET ? ROWS FETCH NEXT ? ROWS ONLY
+"""
+
+_SQL_MERGE_KEYWORD = """
+    MERGE keyword_data WITH (HOLDLOCK) AS T
+    USING (VALUES (?, ?, ?, ?, ?, ?, ?, ?))
+        AS S (id, keyword, match_type, avg_cpc, competition, search_volume, quality_score, updated_at)
+    ON T.keyword = S.keyword AND T.match_type = S.match_type
+    WHEN MATCHED THEN UPDATE SET
+        avg_cpc = S.avg_cpc,
+        competition = S.competition,
+        search_volume = S.search_volume,
+        quality_score = S.quality_score,
+        updated_at = S.updated_at
+    WHEN NOT MATCHED THEN
+        INSERT (id, keyword, match_type, avg_cpc, competition, search_volume, quality_score, created_at, updated_at)
+        VALUES (S.id, S.keyword, S.match_type, S.avg_cpc, S.competition, S.search_volume, S.quality_score, S.updated_at, S.updated_at);
+"""
+
+_SQL_INSERT_ACCESS_REQUEST = """
+    INSERT INTO access_requests (id, email, name, company, role, reason, status, requested_at, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_ALL_ACCESS_REQUESTS = """
+    SELECT id, email, name, company, role, reason, status, requested_at, reviewed_at, reviewed_by, notes
+    FROM access_requests
+    ORDER BY requested_at ASC, id ASC
+    OFFSET ? ROWS FETCH NEXT ? ROWS ONLY
+"""
+
+_SQL_ACCESS_REQUESTS_BY_STATUS = """
+    SELECT id, email, name, company, role, reason, status, requested_at, reviewed_at, reviewed_by, notes
+    FROM access_requests
+    WHERE status = ?
+    ORDER BY requested_at ASC
+"""
+
+_SQL_ACCESS_REQUEST_BY_ID = """
+    SELECT id, email, name, company, role, reason, status, requested_at, reviewed_at, reviewed_by, notes
+    FROM access_requests
+    WHERE id = ?
+"""
+
+_SQL_UPDATE_ACCESS_REQUEST_STATUS = """
+    UPDATE access_requests
+    SET status = ?, reviewed_at = GETUTCDATE(), reviewed_by = ?,
+        notes = COALESCE(?, notes)
+    OUTPUT inserted.id, inserted.email, inserted.name, inserted.company, inserted.role,
+           inserted.reason, inserted.status, inserted.requested_at, inserted.reviewed_at,
+           inserted.reviewed_by, inserted.notes
+    WHERE id = ?
+"""
 
 class UserService:
     """Service for user-related database operations"""
@@ -22,96 +177,59 @@ class UserService:
         profile_pic: Optional[str] = None,
         db: Session = None
     ) -> dict:
-        """Create a new user"""
-        import pyodbc
-        from app.database import DATABASE_CONFIG
-        
-        # Use pyodbc directly to avoid SQLAlchemy issues
-        conn_str = f"DRIVER={{{DATABASE_CONFIG['driver']}}};SERVER={DATABASE_CONFIG['server']},{DATABASE_CONFIG['port']};DATABASE={DATABASE_CONFIG['database']};UID={DATABASE_CONFIG['username']};PWD={DATABASE_CONFIG['password']}"
+        """Create a new user (returns the existing user if the email is taken)"""
+        user_id = sequential_uuid()
+        current_time = datetime.utcnow()
         
-        conn = pyodbc.connect(conn_str, autocommit=True)
-        cursor = conn.cursor()
-        
-        try:
-            # Check if user already exists
-            cursor.execute("SELECT id, email, name FROM users WHERE email = ?", email)
-            existing_user = cursor.fetchone()
-            
-            if existing_user:
-                conn.close()
+        with pooled_cursor() as cursor:
+            # Insert-if-missing and fetch in one round-trip; HOLDLOCK closes the
+            # check-then-insert race between concurrent signups for the same email
+            cursor.execute(_SQL_MERGE_USER, email, user_id, name, provider, profile_pic, 'active',
+                current_time, current_time, current_time, current_time, 0, 'system', email)
+            
+            _skip_to_rowset(cursor)
+            created_user = cursor.fetchone()
+            if not created_user:
+                # Email already registered: the next result set holds the existing user
+                cursor.nextset()
+                _skip_to_rowset(cursor)
+                existing_user = cursor.fetchone()
                 return {
                     "id": existing_user[0],
                     "email": existing_user[1],
                     "name": existing_user[2]
                 }
-            
-            # Create new user
-            user_id = str(uuid.uuid4())
-            current_time = datetime.utcnow()
-            
-            cursor.execute("""
-                INSERT INTO users (id, email, name, provider, profile_pic, status, 
-                                 signup_timestamp, first_login, last_login, approval_date, 
-                                 reapply_count, added_by)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, user_id, email, name, provider, profile_pic, 'active',
-                current_time, current_time, current_time, current_time, 0, 'system')
-            
-            conn.close()
-            
-            return {
-                "id": user_id,
-                "email": email,
-                "name": name,
-                "provider": provider,
-                "profile_pic": profile_pic
-            }
-            
-        except Exception as e:
-            conn.close()
-            raise e
+        
+        # After the insert has committed, drop any cached "no such user" lookup
+        invalidate_table("users")
+        
+        return {
+            "id": created_user[0],
+            "email": created_user[1],
+            "name": created_user[2],
+            "provider": provider,
+            "profile_pic": profile_pic
+        }
     
     @staticmethod
+    @cached_query("users")
     def get_user_by_email(email: str) -> Optional[dict]:
         """Get user by email"""
-        import pyodbc
-        from app.database import DATABASE_CONFIG
-        
-        conn_str = f"DRIVER={{{DATABASE_CONFIG['driver']}}};SERVER={DATABASE_CONFIG['server']},{DATABASE_CONFIG['port']};DATABASE={DATABASE_CONFIG['database']};UID={DATABASE_CONFIG['username']};PWD={DATABASE_CONFIG['password']}"
-        
-        conn = pyodbc.connect(conn_str, autocommit=True)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("SELECT id, email, name, provider, profile_pic, status FROM users WHERE email = ?", email)
-            user = cursor.fetchone()
-            
-            if user:
-                return {
-                    "id": user[0],
-                    "email": user[1],
-                    "name": user[2],
-                    "provider": user[3],
-                    "profile_pic": user[4],
-                    "status": user[5]
-                }
-            return None
-            
-        except Exception as e:
-            raise e
-        finally:
-            conn.close()
+        with pooled_cursor() as cursor:
+            cursor.execute(_SQL_USER_BY_EMAIL, email)
+            return _fetch_one_dict(cursor)
     
     @staticmethod
+    @cached_query("users")
     def get_user_by_id(user_id: str) -> Optional[User]:
         """Get user by ID"""
         with get_db_session() as db:
             return db.query(User).filter(User.id == user_id).first()
     
     @staticmethod
-    def update_user_login(user_id: str) -> Optional[User]:
+    def update_user_login(user_id: str, db: Session = None) -> Optional[User]:
         """Update user's last login time"""
-        with get_db_session() as db:
+        with use_session(db) as db:
             user = db.query(User).filter(User.id == user_id).first()
             if user:
                 if not user.first_login:
@@ -122,71 +240,42 @@ class UserService:
             return user
     
     @staticmethod
-    def get_all_users(limit: int = 100, offset: int = 0) -> List[dict]:
-        """Get all users with pagination and real-time status"""
-        import pyodbc
-        from app.database import DATABASE_CONFIG
-        
-        conn_str = f"DRIVER={{{DATABASE_CONFIG['driver']}}};SERVER={DATABASE_CONFIG['server']},{DATABASE_CONFIG['port']};DATABASE={DATABASE_CONFIG['database']};UID={DATABASE_CONFIG['username']};PWD={DATABASE_CONFIG['password']}"
+    def get_all_users(
+        limit: int = 100,
+        offset: int = 0,
+        after_signup_timestamp: Optional[datetime] = None,
+        after_id: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Get all users with pagination and real-time status, newest first
         
-        conn = pyodbc.connect(conn_str, autocommit=True)
-        cursor = conn.cursor()
+        Pass the signup_timestamp and id of the last user on the previous page as
+        after_signup_timestamp/after_id to page by key instead of offset; deep pages
+        then seek in idx_users_signup rather than skipping offset rows.
+        """
+        if after_signup_timestamp is not None and after_id is not None:
+            sql = _SQL_ALL_USERS_AFTER
+            page_params = (after_signup_timestamp, after_signup_timestamp, after_id, 0, limit)
+        else:
+            sql = _SQL_ALL_USERS
+            page_params = (offset, limit)
         
-        try:
+        with pooled_cursor() as cursor:
             # Get users with real-time status based on active sessions
             # A user is "online" ONLY if:
             # 1. They have a session with status = 'active' (not logged_out or expired)
-            # 2. The session's last_activity was within the last 15 minutes
+            # 2. The session's last_activity was within the last ONLINE_IDLE_MINUTES
             # 3. The session has no logout_time (still logged in)
-            cursor.execute("""
-                SELECT u.id, u.email, u.name, u.provider, u.profile_pic, 
-                       CASE 
-                           WHEN EXISTS (
-                               SELECT 1 FROM user_activities ua 
-                               WHERE ua.user_id = u.id 
-                               AND ua.status = 'active'
-                               AND ua.logout_time IS NULL
-                               AND ua.last_activity > DATEADD(MINUTE, -15, GETUTCDATE())
-                           ) THEN 'online'
-                           ELSE u.status
-                       END as status,
-                       u.signup_timestamp, u.first_login, u.last_login, u.approval_date, 
-                       u.denial_reason, u.reapply_count, u.added_by, u.notes
-                FROM users u
-                ORDER BY u.signup_timestamp DESC
-                OFFSET ? ROWS FETCH NEXT ? ROWS ONLY
-            """, offset, limit)
-            
-            users = []
-            for row in cursor.fetchall():
-                users.append({
-                    "id": row[0],
-                    "email": row[1],
-                    "name": row[2],
-                    "provider": row[3],
-                    "profile_pic": row[4],
-                    "status": row[5],
-                    "signup_timestamp": row[6],
-                    "first_login": row[7],
-                    "last_login": row[8],
-                    "approval_date": row[9],
-                    "denial_reason": row[10],
-                    "reapply_count": row[11],
-                    "added_by": row[12],
-                    "notes": row[13]
-                })
+            # Online users are collected once in a CTE and joined, rather than probed
+            # with a correlated EXISTS per user row
+            cursor.execute(sql, -ONLINE_IDLE_MINUTES, *page_params)
             
-            return users
-            
-        except Exception as e:
-            raise e
-        finally:
-            conn.close()
+            return _fetch_dicts(cursor)
     
     @staticmethod
-    def update_user_status(user_id: str, status: str, notes: Optional[str] = None) -> Optional[User]:
+    def update_user_status(user_id: str, status: str, notes: Optional[str] = None, db: Session = None) -> Optional[User]:
         """Update user status"""
-        with get_db_session() as db:
+        with use_session(db) as db:
             user = db.query(User).filter(User.id == user_id).first()
             if user:
                 user.status = status
@@ -207,97 +296,56 @@ class UserActivityService:
         ip_address: Optional[str] = None
     ) -> dict:
         """Create a new user activity record"""
-        import pyodbc
-        from app.database import DATABASE_CONFIG
-        
-        conn_str = f"DRIVER={{{DATABASE_CONFIG['driver']}}};SERVER={DATABASE_CONFIG['server']},{DATABASE_CONFIG['port']};DATABASE={DATABASE_CONFIG['database']};UID={DATABASE_CONFIG['username']};PWD={DATABASE_CONFIG['password']}"
+        return UserActivityService.create_activities_bulk([{
+            "user_id": user_id,
+            "session_id": session_id,
+            "login_time": login_time,
+            "ip_address": ip_address
+        }])[0]
+    
+    @staticmethod
+    def create_activities_bulk(records: List[Dict[str, Any]], chunk_size: int = 1000) -> List[dict]:
+        """
+        Create user activity records in batches
         
-        conn = pyodbc.connect(conn_str, autocommit=True)
-        cursor = conn.cursor()
+        Args:
+            records: Dicts with user_id, session_id, login_time and optional ip_address
+            chunk_size: Rows sent per executemany() call
         
-        try:
-            activity_id = str(uuid.uuid4())
-            
-            cursor.execute("""
-                INSERT INTO user_activities (id, user_id, session_id, login_time, 
-                                            ip_address, last_activity, status, 
-                                            duration_mins, page_views, idle_timeout)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, activity_id, user_id, session_id, login_time, ip_address, 
-                login_time, 'active', 0, 1, 15)
-            
-            conn.close()
-            
-            return {
-                "id": activity_id,
-                "user_id": user_id,
-                "session_id": session_id,
-                "login_time": login_time,
-                "ip_address": ip_address,
-                "last_activity": login_time
+        Returns:
+            The created activities, in the same order as records
+        """
+        activities = [
+            {
+                "id": sequential_uuid(),
+                "user_id": record["user_id"],
+                "session_id": record["session_id"],
+                "login_time": record["login_time"],
+                "ip_address": record.get("ip_address"),
+                "last_activity": record["login_time"]
             }
-            
-        except Exception as e:
-            conn.close()
-            raise e
+            for record in records
+        ]
+        rows = [
+            (activity["id"], activity["user_id"], activity["session_id"], activity["login_time"],
+             activity["ip_address"], activity["last_activity"], 'active', 0, 1, 15)
+            for activity in activities
+        ]
+        
+        # pooled_cursor() enables fast_executemany, so each chunk is one round-trip
+        with pooled_cursor() as cursor:
+            for start in range(0, len(rows), chunk_size):
+                cursor.executemany(_SQL_INSERT_ACTIVITY, rows[start:start + chunk_size])
+        
+        return activities
     
     @staticmethod
     def get_all_activities(limit: int = 100, offset: int = 0) -> List[dict]:
         """Get all user activities with pagination"""
-        import pyodbc
-        from app.database import DATABASE_CONFIG
-        
-        conn_str = f"DRIVER={{{DATABASE_CONFIG['driver']}}};SERVER={DATABASE_CONFIG['server']},{DATABASE_CONFIG['port']};DATABASE={DATABASE_CONFIG['database']};UID={DATABASE_CONFIG['username']};PWD={DATABASE_CONFIG['password']}"
-        
-        conn = pyodbc.connect(conn_str, autocommit=True)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
-                SELECT 
-                    ua.id,
-                    ua.user_id,
-                    u.email,
-                    u.name,
-                    ua.session_id,
-                    ua.login_time,
-                    ua.logout_time,
-                    ua.ip_address,
-                    ua.last_activity,
-                    ua.status,
-                    ua.duration_mins,
-                    ua.page_views,
-                    ua.idle_timeout
-                FROM user_activities ua
-                LEFT JOIN users u ON ua.user_id = u.id
-                ORDER BY ua.login_time DESC
-                OFFSET ? ROWS FETCH NEXT ? ROWS ONLY
-            """, offset, limit)
-            
-            activities = []
-            for row in cursor.fetchall():
-                activities.append({
-                    "id": row[0],
-                    "user_id": row[1],
-                    "email": row[2],
-                    "name": row[3],
-                    "session_id": row[4],
-                    "login_time": row[5],
-                    "logout_time": row[6],
-                    "ip_address": row[7],
-                    "last_activity": row[8],
-                    "status": row[9],
-                    "duration_mins": row[10],
-                    "page_views": row[11],
-                    "idle_timeout": row[12]
-                })
+        with pooled_cursor() as cursor:
+            cursor.execute(_SQL_ALL_ACTIVITIES, offset, limit)
             
-            return activities
-            
-        except Exception as e:
-            raise e
-        finally:
-            conn.close()
+            return _fetch_dicts(cursor)
     
     @staticmethod
     def update_activity(
@@ -305,45 +353,93 @@ class UserActivityService:
         page_views: Optional[int] = None,
         actions_taken: Optional[List[str]] = None,
         status: Optional[str] = None,
-        logout_time: Optional[datetime] = None
+        logout_time: Optional[datetime] = None,
+        db: Session = None
     ) -> Optional[UserActivity]:
         """Update user activity"""
-        with get_db_session() as db:
-            activity = db.query(UserActivity).filter(UserActivity.session_id == session_id).first()
-            if activity:
-                if page_views is not None:
-                    activity.page_views = page_views
-                if actions_taken is not None:
-                    activity.actions_taken = actions_taken
-                if status is not None:
-                    activity.status = status
-                if logout_time is not None:
-                    activity.logout_time = logout_time
-                    # Calculate duration
-                    duration = logout_time - activity.login_time
-                    activity.duration_mins = int(duration.total_seconds() / 60)
-                
-                activity.last_activity = datetime.utcnow()
-                db.commit()
-                db.refresh(activity)
+        values = {"last_activity": func.getutcdate()}
+        if page_views is not None:
+            values["page_views"] = page_views
+        if actions_taken is not None:
+            values["actions_taken"] = actions_taken
+        if status is not None:
+            values["status"] = status
+        if logout_time is not None:
+            values["logout_time"] = logout_time
+            # Duration computed server-side from the stored login_time
+            values["duration_mins"] = func.datediff(
+                literal_column("SECOND"), UserActivity.login_time, logout_time
+            ) // 60
+        
+        # session_id is not unique (a session can be logged more than once), so
+        # only its most recent row is updated, as the old first() lookup did
+        latest_id = (
+            select(UserActivity.id)
+            .where(UserActivity.session_id == session_id)
+            .order_by(desc(UserActivity.login_time))
+            .limit(1)
+            .scalar_subquery()
+        )
+        
+        # Single UPDATE ... OUTPUT round-trip instead of SELECT, modify, flush
+        with use_session(db) as db:
+            activity = db.scalars(
+                update(UserActivity)
+                .where(UserActivity.id == latest_id)
+                .values(**values)
+                .returning(UserActivity)
+                .execution_options(synchronize_session=False)
+            ).first()
+            db.commit()
             return activity
     
     @staticmethod
-    def get_user_activities(user_id: str, limit: int = 50) -> List[UserActivity]:
+    def get_user_activities(user_id: str, limit: int = 50, db: Session = None) -> List[UserActivity]:
         """Get user activities"""
-        with get_db_session() as db:
-            return db.query(UserActivity).filter(
-                UserActivity.user_id == user_id
-            ).order_by(desc(UserActivity.login_time)).limit(limit).all()
+        with use_session(db) as db:
+            return db.scalars(
+                select(UserActivity)
+                .where(UserActivity.user_id == user_id)
+                .options(selectinload(UserActivity.user), raiseload("*"))
+                .order_by(desc(UserActivity.login_time))
+                .limit(limit)
+            ).all()
     
     @staticmethod
-    def get_active_sessions() -> List[UserActivity]:
+    def get_active_sessions(db: Session = None) -> List[UserActivity]:
         """Get all active sessions"""
-        with get_db_session() as db:
-            return db.query(UserActivity).filter(
+        with use_session(db) as db:
+            return db.query(UserActivity).options(selectinload(UserActivity.user)).filter(
                 UserActivity.status == "active"
             ).all()
 
+    @staticmethod
+    def _online_criteria():
+        """Live-session predicate; matches the filtered idx_ua_online_lookup index"""
+        # 'active' is inlined rather than bound: SQL Server only matches a filtered
+        # index against literal predicates, never against a parameter
+        return (
+            UserActivity.status == literal_column("'active'"),
+            UserActivity.logout_time.is_(None),
+            UserActivity.last_activity > func.dateadd(literal_column("MINUTE"), -ONLINE_IDLE_MINUTES, func.getutcdate()),
+        )
+
+    @staticmethod
+    def count_active_sessions(db: Session = None) -> int:
+        """Count sessions active within the idle window"""
+        with use_session(db) as db:
+            return db.scalar(
+                select(func.count()).select_from(UserActivity).where(*UserActivityService._online_criteria())
+            )
+
+    @staticmethod
+    def get_online_user_ids(db: Session = None) -> List[str]:
+        """IDs of users with a session active within the idle window"""
+        with use_session(db) as db:
+            return db.scalars(
+                select(UserActivity.user_id).distinct().where(*UserActivityService._online_criteria())
+            ).all()
+
 class CampaignService:
     """Service for campaign-related database operations"""
     
@@ -354,10 +450,11 @@ class CampaignService:
         daily_budget: float,
         campaign_type: str = "search",
         bidding_strategy: str = "manual_cpc",
-        campaign_data: Optional[Dict[str, Any]] = None
+        campaign_data: Optional[Dict[str, Any]] = None,
+        db: Session = None
     ) -> Campaign:
         """Create a new campaign"""
-        with get_db_session() as db:
+        with use_session(db) as db:
             campaign = Campaign(
                 user_id=user_id,
                 name=name,
@@ -373,23 +470,26 @@ class CampaignService:
             return campaign
     
     @staticmethod
-    def get_user_campaigns(user_id: str) -> List[Campaign]:
+    def get_user_campaigns(user_id: str, db: Session = None) -> List[Campaign]:
         """Get all campaigns for a user"""
-        with get_db_session() as db:
-            return db.query(Campaign).filter(Campaign.user_id == user_id).order_by(
-                desc(Campaign.created_at)
+        with use_session(db) as db:
+            return db.scalars(
+                select(Campaign)
+                .where(Campaign.user_id == user_id)
+                .options(raiseload("*"))
+                .order_by(desc(Campaign.created_at))
             ).all()
     
     @staticmethod
-    def get_campaign_by_id(campaign_id: str) -> Optional[Campaign]:
+    def get_campaign_by_id(campaign_id: str, db: Session = None) -> Optional[Campaign]:
         """Get campaign by ID"""
-        with get_db_session() as db:
+        with use_session(db) as db:
             return db.query(Campaign).filter(Campaign.id == campaign_id).first()
     
     @staticmethod
-    def update_campaign_status(campaign_id: str, status: str) -> Optional[Campaign]:
+    def update_campaign_status(campaign_id: str, status: str, db: Session = None) -> Optional[Campaign]:
         """Update campaign status"""
-        with get_db_session() as db:
+        with use_session(db) as db:
             campaign = db.query(Campaign).filter(Campaign.id == campaign_id).first()
             if campaign:
                 campaign.status = status
@@ -406,10 +506,11 @@ class SimulationService:
         user_id: str,
         simulation_type: str = "auction",
         settings: Optional[Dict[str, Any]] = None,
-        campaign_id: Optional[str] = None
+        campaign_id: Optional[str] = None,
+        db: Session = None
     ) -> Simulation:
         """Create a new simulation"""
-        with get_db_session() as db:
+        with use_session(db) as db:
             simulation = Simulation(
                 user_id=user_id,
                 simulation_type=simulation_type,
@@ -427,10 +528,11 @@ class SimulationService:
         simulation_id: str,
         results: Dict[str, Any],
         status: str = "completed",
-        execution_time_ms: Optional[int] = None
+        execution_time_ms: Optional[int] = None,
+        db: Session = None
     ) -> Optional[Simulation]:
         """Update simulation with results"""
-        with get_db_session() as db:
+        with use_session(db) as db:
             simulation = db.query(Simulation).filter(Simulation.id == simulation_id).first()
             if simulation:
                 simulation.results = results
@@ -443,17 +545,21 @@ class SimulationService:
             return simulation
     
     @staticmethod
-    def get_user_simulations(user_id: str, limit: int = 20) -> List[Simulation]:
+    def get_user_simulations(user_id: str, limit: int = 20, db: Session = None) -> List[Simulation]:
         """Get user simulations"""
-        with get_db_session() as db:
-            return db.query(Simulation).filter(
-                Simulation.user_id == user_id
-            ).order_by(desc(Simulation.created_at)).limit(limit).all()
+        with use_session(db) as db:
+            return db.scalars(
+                select(Simulation)
+                .where(Simulation.user_id == user_id)
+                .options(raiseload("*"))
+                .order_by(desc(Simulation.created_at))
+                .limit(limit)
+            ).all()
     
     @staticmethod
-    def get_simulation_by_id(simulation_id: str) -> Optional[Simulation]:
+    def get_simulation_by_id(simulation_id: str, db: Session = None) -> Optional[Simulation]:
         """Get simulation by ID"""
-        with get_db_session() as db:
+        with use_session(db) as db:
             return db.query(Simulation).filter(Simulation.id == simulation_id).first()
 
 class KeywordDataService:
@@ -466,10 +572,11 @@ class KeywordDataService:
         avg_cpc: Optional[float] = None,
         competition: Optional[str] = None,
         search_volume: Optional[int] = None,
-        quality_score: Optional[int] = None
+        quality_score: Optional[int] = None,
+        db: Session = None
     ) -> KeywordData:
         """Create keyword data"""
-        with get_db_session() as db:
+        with use_session(db) as db:
             keyword_data = KeywordData(
                 keyword=keyword,
                 match_type=match_type,
@@ -483,8 +590,69 @@ class KeywordDataService:
             db.commit()
             db.refresh(keyword_data)
             return keyword_data
+
+    @staticmethod
+    def bulk_insert(rows: List[Dict[str, Any]], db: Session = None) -> int:
+        """
+        Insert keyword data rows in one transaction
+
+        Rows are dicts of KeywordData column values; id and timestamps default as
+        in create_keyword_data. SQLAlchemy sends them as multi-row INSERTs of up to
+        insertmanyvalues_page_size rows each instead of one statement per row.
+        """
+        if not rows:
+            return 0
+
+        with use_session(db) as db:
+            db.execute(insert(KeywordData), rows)
+            db.commit()
+
+        # ORM bulk INSERTs skip the mapper events that normally invalidate the cache
+        invalidate_table("keyword_data")
+        return len(rows)
+
+    @staticmethod
+    def bulk_upsert_keywords(rows: List[Dict[str, Any]]) -> int:
+        """Insert or update keyword data rows keyed on (keyword, match_type) in one batch"""
+        if not rows:
+            return 0
+
+        current_time = datetime.utcnow()
+        params = [
+            (
+                sequential_uuid(),
+                row["keyword"],
+                row["match_type"],
+                row.get("avg_cpc"),
+                row.get("competition"),
+                row.get("search_volume"),
+                row.get("quality_score"),
+                current_time
+            )
+            for row in rows
+        ]
+
+        with get_db_session() as db:
+            # Raw pyodbc cursor so the whole batch goes out as one parameter array
+            cursor = db.connection().connection.cursor()
+            try:
+                cursor.fast_executemany = True
+                cursor.executemany(_SQL_MERGE_KEYWORD, params)
+            finally:
+                cursor.close()
+
+        invalidate_table("keyword_data")
+        return len(params)
+
+    @staticmethod
+    @cached_query("keyword_data")
+    def get_keyword_data(keyword: str, match_type: str) -> Optional[KeywordData]:
+        """Get keyword data for a keyword and match type"""
+        with get_db_session() as db:
+            return db.query(KeywordData).filter_by(keyword=keyword, match_type=match_type).first()
     
     @staticmethod
+    @cached_query("keyword_data")
     def search_keywords(keyword: str, limit: int = 50) -> List[KeywordData]:
         """Search for keywords"""
         with get_db_session() as db:
@@ -505,171 +673,64 @@ class AccessRequestService:
         notes: Optional[str] = None
     ) -> dict:
         """Create access request"""
-        import pyodbc
-        from app.database import DATABASE_CONFIG
+        request_id = sequential_uuid()
+        current_time = datetime.utcnow()
         
-        conn_str = f"DRIVER={{{DATABASE_CONFIG['driver']}}};SERVER={DATABASE_CONFIG['server']},{DATABASE_CONFIG['port']};DATABASE={DATABASE_CONFIG['database']};UID={DATABASE_CONFIG['username']};PWD={DATABASE_CONFIG['password']}"
+        with pooled_cursor() as cursor:
+            cursor.execute(_SQL_INSERT_ACCESS_REQUEST, request_id, email, name, company, role, reason, 'pending', current_time, notes)
         
-        conn = pyodbc.connect(conn_str, autocommit=True)
-        cursor = conn.cursor()
+        # After the insert has committed
+        invalidate_table("access_requests")
         
-        try:
-            request_id = str(uuid.uuid4())
-            current_time = datetime.utcnow()
-            
-            cursor.execute("""
-                INSERT INTO access_requests (id, email, name, company, role, reason, status, requested_at, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, request_id, email, name, company, role, reason, 'pending', current_time, notes)
-            
-            conn.close()
-            
-            return {
-                "id": request_id,
-                "email": email,
-                "name": name,
-                "company": company,
-                "role": role,
-                "reason": reason,
-                "status": "pending",
-                "requested_at": current_time,
-                "notes": notes
-            }
-            
-        except Exception as e:
-            conn.close()
-            raise e
+        return {
+            "id": request_id,
+            "email": email,
+            "name": name,
+            "company": company,
+            "role": role,
+            "reason": reason,
+            "status": "pending",
+            "requested_at": current_time,
+            "notes": notes
+        }
     
     @staticmethod
+    @cached_query("access_requests")
     def get_pending_requests() -> List[AccessRequest]:
         """Get pending access requests"""
         with get_db_session() as db:
-            return db.query(AccessRequest).filter(
-                AccessRequest.status == "pending"
-            ).order_by(asc(AccessRequest.requested_at)).all()
+            return db.scalars(
+                select(AccessRequest)
+                .where(AccessRequest.status == "pending")
+                .order_by(asc(AccessRequest.requested_at))
+            ).all()
     
     @staticmethod
-    def get_all_requests() -> List[dict]:
-        """Get all access requests"""
-        import pyodbc
-        from app.database import DATABASE_CONFIG
-        
-        conn_str = f"DRIVER={{{DATABASE_CONFIG['driver']}}};SERVER={DATABASE_CONFIG['server']},{DATABASE_CONFIG['port']};DATABASE={DATABASE_CONFIG['database']};UID={DATABASE_CONFIG['username']};PWD={DATABASE_CONFIG['password']}"
-        
-        conn = pyodbc.connect(conn_str, autocommit=True)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
-                SELECT id, email, name, company, role, reason, status, requested_at, reviewed_at, reviewed_by, notes
-                FROM access_requests
-                ORDER BY requested_at ASC
-            """)
-            
-            requests = []
-            for row in cursor.fetchall():
-                requests.append({
-                    "id": row[0],
-                    "email": row[1],
-                    "name": row[2],
-                    "company": row[3],
-                    "role": row[4],
-                    "reason": row[5],
-                    "status": row[6],
-                    "requested_at": row[7],
-                    "reviewed_at": row[8],
-                    "reviewed_by": row[9],
-                    "notes": row[10]
-                })
+    @cached_query("access_requests")
+    def get_all_requests(limit: int = 100, offset: int = 0) -> List[dict]:
+        """Get access requests with pagination, oldest first"""
+        with pooled_cursor() as cursor:
+            cursor.execute(_SQL_ALL_ACCESS_REQUESTS, offset, limit)
             
-            return requests
-            
-        except Exception as e:
-            raise e
-        finally:
-            conn.close()
+            return _fetch_dicts(cursor)
     
     @staticmethod
+    @cached_query("access_requests")
     def get_requests_by_status(status: str) -> List[dict]:
         """Get access requests filtered by status"""
-        import pyodbc
-        from app.database import DATABASE_CONFIG
-        
-        conn_str = f"DRIVER={{{DATABASE_CONFIG['driver']}}};SERVER={DATABASE_CONFIG['server']},{DATABASE_CONFIG['port']};DATABASE={DATABASE_CONFIG['database']};UID={DATABASE_CONFIG['username']};PWD={DATABASE_CONFIG['password']}"
-        
-        conn = pyodbc.connect(conn_str, autocommit=True)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
-                SELECT id, email, name, company, role, reason, status, requested_at, reviewed_at, reviewed_by, notes
-                FROM access_requests
-                WHERE status = ?
-                ORDER BY requested_at ASC
-            """, status)
+        with pooled_cursor() as cursor:
+            cursor.execute(_SQL_ACCESS_REQUESTS_BY_STATUS, status)
             
-            requests = []
-            for row in cursor.fetchall():
-                requests.append({
-                    "id": row[0],
-                    "email": row[1],
-                    "name": row[2],
-                    "company": row[3],
-                    "role": row[4],
-                    "reason": row[5],
-                    "status": row[6],
-                    "requested_at": row[7],
-                    "reviewed_at": row[8],
-                    "reviewed_by": row[9],
-                    "notes": row[10]
-                })
-            
-            return requests
-            
-        except Exception as e:
-            raise e
-        finally:
-            conn.close()
+            return _fetch_dicts(cursor)
     
     @staticmethod
+    @cached_query("access_requests")
     def get_request_by_id(request_id: str) -> Optional[dict]:
         """Get a specific access request by id"""
-        import pyodbc
-        from app.database import DATABASE_CONFIG
-        
-        conn_str = f"DRIVER={{{DATABASE_CONFIG['driver']}}};SERVER={DATABASE_CONFIG['server']},{DATABASE_CONFIG['port']};DATABASE={DATABASE_CONFIG['database']};UID={DATABASE_CONFIG['username']};PWD={DATABASE_CONFIG['password']}"
-        
-        conn = pyodbc.connect(conn_str, autocommit=True)
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
-                SELECT id, email, name, company, role, reason, status, requested_at, reviewed_at, reviewed_by, notes
-                FROM access_requests
-                WHERE id = ?
-            """, request_id)
+        with pooled_cursor() as cursor:
+            cursor.execute(_SQL_ACCESS_REQUEST_BY_ID, request_id)
             
-            row = cursor.fetchone()
-            if row:
-                return {
-                    "id": row[0],
-                    "email": row[1],
-                    "name": row[2],
-                    "company": row[3],
-                    "role": row[4],
-                    "reason": row[5],
-                    "status": row[6],
-                    "requested_at": row[7],
-                    "reviewed_at": row[8],
-                    "reviewed_by": row[9],
-                    "notes": row[10]
-                }
-            return None
-            
-        except Exception as e:
-            raise e
-        finally:
-            conn.close()
+            return _fetch_one_dict(cursor)
     
     @staticmethod
     def update_request_status(
@@ -677,16 +738,38 @@ class AccessRequestService:
         status: str,
         reviewed_by: str,
         notes: Optional[str] = None
-    ) -> Optional[AccessRequest]:
-        """Update request status"""
-        with get_db_session() as db:
-            request = db.query(AccessRequest).filter(AccessRequest.id == request_id).first()
-            if request:
-                request.status = status
-                request.reviewed_at = datetime.utcnow()
-                request.reviewed_by = reviewed_by
-                if notes:
-                    request.notes = notes
-                db.commit()
-                db.refresh(request)
-            return request
+    ) -> Optional[dict]:
+        """Update request status and return the updated request (None if not found)"""
+        with pooled_cursor() as cursor:
+            # OUTPUT returns the updated row from the UPDATE itself, so there is no
+            # separate SELECT before or after the write
+            cursor.execute(_SQL_UPDATE_ACCESS_REQUEST_STATUS, status, reviewed_by, notes or None, request_id)
+            request = _fetch_one_dict(cursor)
+        
+        if request:
+            invalidate_table("access_requests")
+        return request
+
+# Keep the query cache coherent with ORM writes (raw pyodbc writes invalidate explicitly).
+# Mapper events fire at flush time, before the write is visible to other connections,
+# so they only record the table; the cache is invalidated once the session commits.
+_CACHED_MODELS = (KeywordData, AccessRequest, User)
+_PENDING_INVALIDATIONS = "pending_cache_invalidations"
+
+def _record_write(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(mapper.local_table.name)
+
+def _invalidate_after_commit(session):
+    for table in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        invalidate_table(table)
+
+def _discard_pending_invalidations(session):
+    session.info.pop(_PENDING_INVALIDATIONS, None)
+
+for _model in _CACHED_MODELS:
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, _record_write)
+event.listen(Session, "after_commit", _invalidate_after_commit)
+event.listen(Session, "after_rollback", _discard_pending_invalidations)
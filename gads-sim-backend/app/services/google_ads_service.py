@@ -14,16 +14,24 @@ Key Features:
 Dependencies:
     google-ads>=24.1.0
     pyyaml>=6.0
+    diskcache>=5.6.0
 """
 
+import asyncio
 import os
 import yaml
 import hashlib
-import json
-from typing import List, Dict, Optional, Any
-from datetime import datetime, timedelta
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from diskcache import Cache
+from functools import lru_cache
+from typing import List, Dict, Optional, Any, Tuple
 from pathlib import Path
 import logging
+import numpy as np
+
+from app.utils.query_cache import ttl_cache
 
 # Configure logging
 logging.basicConfig(
@@ -33,6 +41,78 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# In-process tier in front of the disk cache: repeat requests skip the SQLite read
+# and unpickling. Kept short so it never serves much past a disk entry's expiry.
+MEMORY_CACHE_SIZE = 1024
+MEMORY_CACHE_TTL_SECONDS = 3600
+
+# Concurrent Google Ads API requests per batch call (generate_keywords_batch, get_many_historical)
+GOOGLE_ADS_FETCH_WORKERS = 8
+
+# Unit separator between key fields; unlike "|" it cannot appear in keyword text
+_KEY_SEPARATOR = "\x1f"
+
+
+def _digest_key(*parts: str) -> bytes:
+    """Cache key for a request: 16-byte BLAKE2b digest of its fields (used raw, no hex)"""
+    return hashlib.blake2b(_KEY_SEPARATOR.join(parts).encode("utf-8"), digest_size=16).digest()
+
+
+@lru_cache(maxsize=1)
+def _get_cache_dir() -> Path:
+    """Cache directory for keyword results, created once per process."""
+    backend_dir = Path(__file__).parent.parent.parent
+    cache_dir = backend_dir / "cache" / "google_ads"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+@lru_cache(maxsize=1)
+def _env_config() -> Dict[str, Any]:
+    """Google Ads configuration from GOOGLE_ADS_* environment variables, read once."""
+    logger.info("Loading configuration from environment variables")
+    return {
+        'developer_token': os.getenv('GOOGLE_ADS_DEVELOPER_TOKEN'),
+        'client_id': os.getenv('GOOGLE_ADS_CLIENT_ID'),
+        'client_secret': os.getenv('GOOGLE_ADS_CLIENT_SECRET'),
+        'refresh_token': os.getenv('GOOGLE_ADS_REFRESH_TOKEN'),
+        'customer_id': os.getenv('GOOGLE_ADS_CUSTOMER_ID'),
+        'login_customer_id': os.getenv('GOOGLE_ADS_LOGIN_CUSTOMER_ID'),
+        'use_proto_plus': os.getenv('GOOGLE_ADS_USE_PROTO_PLUS', 'True').lower() == 'true'
+    }
+
+
+@lru_cache(maxsize=4)
+def _load_yaml_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse config.yaml; keyed on its mtime so an edited file is re-read."""
+    try:
+        with open(config_path, 'r') as f:
+            config = yaml.safe_load(f)
+        logger.warning(f"Configuration loaded from {config_path} (deprecated - please use environment variables)")
+        return config
+    except yaml.YAMLError as e:
+        logger.error(f"Error parsing config.yaml: {e}")
+        raise
+
+
+def _load_config(config_path: Optional[str]) -> Dict[str, Any]:
+    """Load configuration from environment variables or config.yaml (fallback)."""
+    # Try to load from environment variables first (recommended)
+    if os.getenv('GOOGLE_ADS_DEVELOPER_TOKEN'):
+        return _env_config()
+    
+    # Fallback to config.yaml if provided (deprecated)
+    if config_path:
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except FileNotFoundError:
+            logger.error(f"Config file not found at {config_path}")
+            raise
+        return _load_yaml_config(config_path, mtime_ns)
+    
+    logger.error("No configuration found. Please set GOOGLE_ADS_* environment variables.")
+    raise ValueError("Missing Google Ads API configuration")
+
 
 class GoogleAdsKeywordService:
     """
@@ -62,6 +142,15 @@ class GoogleAdsKeywordService:
         self.client = None
         self.cache_dir = self._get_cache_dir()
         
+        # Single SQLite-backed store for all cached API results (None if it cannot be opened)
+        try:
+            self._cache = Cache(str(self.cache_dir))
+        except Exception as e:
+            logger.warning(f"Failed to open Google Ads result cache: {e}")
+            self._cache = None
+        self._memory_cache = ttl_cache(MEMORY_CACHE_SIZE, MEMORY_CACHE_TTL_SECONDS)
+        self._memory_lock = threading.Lock()
+        
         # Initialize Google Ads client
         try:
             self._init_google_ads_client()
@@ -77,42 +166,11 @@ class GoogleAdsKeywordService:
     
     def _get_cache_dir(self) -> Path:
         """Get cache directory for keyword results."""
-        backend_dir = Path(__file__).parent.parent.parent
-        cache_dir = backend_dir / "cache" / "google_ads"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir
+        return _get_cache_dir()
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from environment variables or config.yaml (fallback)."""
-        # Try to load from environment variables first (recommended)
-        if os.getenv('GOOGLE_ADS_DEVELOPER_TOKEN'):
-            logger.info("Loading configuration from environment variables")
-            return {
-                'developer_token': os.getenv('GOOGLE_ADS_DEVELOPER_TOKEN'),
-                'client_id': os.getenv('GOOGLE_ADS_CLIENT_ID'),
-                'client_secret': os.getenv('GOOGLE_ADS_CLIENT_SECRET'),
-                'refresh_token': os.getenv('GOOGLE_ADS_REFRESH_TOKEN'),
-                'customer_id': os.getenv('GOOGLE_ADS_CUSTOMER_ID'),
-                'login_customer_id': os.getenv('GOOGLE_ADS_LOGIN_CUSTOMER_ID'),
-                'use_proto_plus': os.getenv('GOOGLE_ADS_USE_PROTO_PLUS', 'True').lower() == 'true'
-            }
-        
-        # Fallback to config.yaml if provided (deprecated)
-        if self.config_path:
-            try:
-                with open(self.config_path, 'r') as f:
-                    config = yaml.safe_load(f)
-                logger.warning(f"Configuration loaded from {self.config_path} (deprecated - please use environment variables)")
-                return config
-            except FileNotFoundError:
-                logger.error(f"Config file not found at {self.config_path}")
-                raise
-            except yaml.YAMLError as e:
-                logger.error(f"Error parsing config.yaml: {e}")
-                raise
-        else:
-            logger.error("No configuration found. Please set GOOGLE_ADS_* environment variables.")
-            raise ValueError("Missing Google Ads API configuration")
+        return _load_config(self.config_path)
     
     def _init_google_ads_client(self):
         """Initialize Google Ads API client."""
@@ -149,7 +207,7 @@ class GoogleAdsKeywordService:
             raise
     
     def _generate_cache_key(self, url: str, product_description: str, 
-                           language: str, location: str) -> str:
+                           language: str, location: str) -> bytes:
         """
         Generate cache key for keyword request.
         
@@ -160,72 +218,69 @@ class GoogleAdsKeywordService:
             location: Location code
             
         Returns:
-            SHA-256 hash of input parameters
+            16-byte BLAKE2b digest of input parameters
         """
-        cache_input = f"{url}|{product_description}|{language}|{location}|v2"
-        return hashlib.sha256(cache_input.encode()).hexdigest()
+        return _digest_key("keywords", url, product_description, language, location, "v3")
     
-    def _get_cached_result(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
+    def _get_cached_result(self, cache_key: bytes) -> Optional[List[Dict[str, Any]]]:
         """
         Retrieve cached keyword results if available and not expired.
         
         Args:
-            cache_key: Cache key hash
+            cache_key: Cache key digest
             
         Returns:
             Cached keyword list or None if not found/expired
         """
-        if not self.config.get('caching', {}).get('enabled', True):
-            return None
-        
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        keywords = self._get_memory_cached(cache_key)
+        if keywords is not None:
+            return keywords
         
-        if not cache_file.exists():
+        if self._cache is None or not self.config.get('caching', {}).get('enabled', True):
             return None
         
         try:
-            with open(cache_file, 'r') as f:
-                cached_data = json.load(f)
-            
-            # Check if cache is expired
-            ttl_hours = self.config.get('caching', {}).get('ttl_hours', 48)
-            cached_time = datetime.fromisoformat(cached_data['timestamp'])
-            
-            if datetime.now() - cached_time > timedelta(hours=ttl_hours):
-                logger.info(f"Cache expired for key {cache_key}")
-                cache_file.unlink()  # Delete expired cache
-                return None
-            
-            logger.info(f"Cache hit for key {cache_key}")
-            return cached_data['keywords']
-            
+            # Expired entries are dropped by the cache itself (see _save_to_cache)
+            keywords = self._cache.get(cache_key)
         except Exception as e:
             logger.warning(f"Error reading cache: {e}")
             return None
+        
+        if keywords is not None:
+            logger.info(f"Cache hit for key {cache_key.hex()}")
+            with self._memory_lock:
+                self._memory_cache[cache_key] = keywords
+        return keywords
+    
+    def _get_memory_cached(self, cache_key: bytes) -> Optional[Any]:
+        """In-process cache lookup only (no disk I/O), safe to call on the event loop."""
+        if not self.config.get('caching', {}).get('enabled', True):
+            return None
+        with self._memory_lock:
+            return self._memory_cache.get(cache_key)
     
-    def _save_to_cache(self, cache_key: str, keywords: List[Dict[str, Any]]):
+    def _save_to_cache(self, cache_key: bytes, keywords: List[Dict[str, Any]]):
         """
         Save keyword results to cache.
         
         Args:
-            cache_key: Cache key hash
+            cache_key: Cache key digest
             keywords: List of keyword dictionaries
         """
         if not self.config.get('caching', {}).get('enabled', True):
             return
         
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        with self._memory_lock:
+            self._memory_cache[cache_key] = keywords
+        
+        if self._cache is None:
+            return
         
         try:
-            cache_data = {
-                'timestamp': datetime.now().isoformat(),
-                'keywords': keywords
-            }
-            
-            with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+            ttl_hours = self.config.get('caching', {}).get('ttl_hours', 48)
+            self._cache.set(cache_key, keywords, expire=ttl_hours * 3600)
             
-            logger.info(f"Results cached with key {cache_key}")
+            logger.info(f"Results cached with key {cache_key.hex()}")
             
         except Exception as e:
             logger.warning(f"Error saving to cache: {e}")
@@ -295,7 +350,65 @@ class GoogleAdsKeywordService:
         except Exception as e:
             logger.error(f"Error generating keywords from Google Ads API: {e}")
             raise
-    
+
+    def generate_keywords_batch(
+        self,
+        items: List[Tuple[str, str]],
+        language: str = "en",
+        location: str = "2840",  # US by default
+        max_keywords: int = 25
+    ) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+        """
+        Generate keyword ideas for many (url, product_description) pairs.
+
+        Duplicate pairs are requested once, cached pairs are answered without an
+        API call, and the remaining requests run concurrently.
+
+        Args:
+            items: (url, product_description) pairs; either may be empty
+            language: Language code (ISO 639-1, e.g., 'en', 'es', 'fr')
+            location: Geo target constant ID (e.g., 2840 for US)
+            max_keywords: Maximum number of keywords per pair (default: 25)
+
+        Returns:
+            Dictionary of (url, product_description) -> keyword list, in the
+            format returned by generate_keywords_from_url
+        """
+        unique_items = list(dict.fromkeys((url or "", description or "") for url, description in items))
+
+        results = {}
+        misses = []
+        for item in unique_items:
+            cached_result = self._get_cached_result(self._generate_cache_key(*item, language, location))
+            if cached_result:
+                results[item] = cached_result[:max_keywords]
+            else:
+                misses.append(item)
+
+        if not misses:
+            return results
+
+        if not self.client:
+            logger.error("No Google Ads client available")
+            raise ValueError("Google Ads API client is not available. Please check configuration.")
+
+        def generate(item: Tuple[str, str]) -> List[Dict[str, Any]]:
+            url, description = item
+            return self.generate_keywords_from_url(
+                url=url,
+                product_description=description,
+                language=language,
+                location=location,
+                max_keywords=max_keywords
+            )
+
+        # Each idea request is a network round-trip, so overlap them
+        max_workers = min(GOOGLE_ADS_FETCH_WORKERS, len(misses))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results.update(zip(misses, executor.map(generate, misses)))
+
+        return results
+
     def _fetch_keyword_ideas(
         self,
         url: Optional[str] = None,
@@ -453,39 +566,35 @@ class GoogleAdsKeywordService:
             'provider', 'dealer', 'retailer'
         ]
         
-        # Generate combinations
-        keyword_set = set()
-        
-        for base in base_terms[:3]:  # Use first 3 base terms
-            for modifier in modifiers[:8]:
-                for suffix in suffixes[:3]:
-                    parts = [p for p in [modifier, base, suffix] if p]
-                    keyword = ' '.join(parts)
-                    
-                    if keyword and keyword not in keyword_set:
-                        keyword_set.add(keyword)
-                        
-                        # Generate mock metrics
-                        import random
-                        random.seed(hash(keyword) % (2**32))  # Deterministic based on keyword
-                        
-                        competition_levels = ['LOW', 'MEDIUM', 'HIGH']
-                        
-                        mock_keywords.append({
-                            'text': keyword,
-                            'avg_monthly_searches': random.randint(100, 50000),
-                            'competition': random.choice(competition_levels),
-                            'competition_index': random.randint(0, 100),
-                            'low_top_of_page_bid_micros': random.randint(500000, 2000000),
-                            'high_top_of_page_bid_micros': random.randint(2000000, 10000000),
-                        })
-                        
-                        if len(mock_keywords) >= max_keywords:
-                            break
-                if len(mock_keywords) >= max_keywords:
-                    break
-            if len(mock_keywords) >= max_keywords:
-                break
+        # All modifier/base/suffix combinations in one pass, first occurrence wins
+        combos = (
+            ' '.join(part for part in (modifier, base, suffix) if part)
+            for base, modifier, suffix in itertools.product(base_terms[:3], modifiers[:8], suffixes[:3])
+        )
+        texts = [text for text in dict.fromkeys(combos) if text][:max_keywords]
+        
+        if texts:
+            # One generator seeded from the keyword set (stable across processes,
+            # unlike hash()) draws every metric at once
+            rng = np.random.default_rng(int.from_bytes(_digest_key(*texts)[:8], 'little'))
+            n = len(texts)
+            searches = rng.integers(100, 50000, size=n, endpoint=True)
+            competition = rng.choice(['LOW', 'MEDIUM', 'HIGH'], size=n)
+            competition_index = rng.integers(0, 100, size=n, endpoint=True)
+            low_bids = rng.integers(500000, 2000000, size=n, endpoint=True)
+            high_bids = rng.integers(2000000, 10000000, size=n, endpoint=True)
+            
+            mock_keywords = [
+                {
+                    'text': text,
+                    'avg_monthly_searches': int(searches[i]),
+                    'competition': str(competition[i]),
+                    'competition_index': int(competition_index[i]),
+                    'low_top_of_page_bid_micros': int(low_bids[i]),
+                    'high_top_of_page_bid_micros': int(high_bids[i]),
+                }
+                for i, text in enumerate(texts)
+            ]
         
         # Ensure we have at least max_keywords
         while len(mock_keywords) < max_keywords:
@@ -556,7 +665,39 @@ class GoogleAdsKeywordService:
             logger.error(f"Error getting historical metrics from Google Ads API: {e}")
             logger.info("Falling back to mock data")
             return self._generate_mock_historical_metrics(keywords)
-    
+
+    def get_many_historical(
+        self,
+        batches: List[List[str]],
+        language: str = "en",
+        location: str = "2840",  # US by default
+        date_range: Optional[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Get historical metrics for several keyword groups concurrently.
+
+        Each group is handled as a get_historical_metrics call (cached per group,
+        with the same mock fallback), so N uncached groups take about one API
+        round-trip instead of N.
+
+        Returns:
+            One metrics list per group, in the order of batches
+        """
+        if not batches:
+            return []
+
+        def fetch(keywords: List[str]) -> List[Dict[str, Any]]:
+            return self.get_historical_metrics(
+                keywords=keywords,
+                language=language,
+                location=location,
+                date_range=date_range
+            )
+
+        max_workers = min(GOOGLE_ADS_FETCH_WORKERS, len(batches))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(fetch, batches))
+
     def get_forecast_metrics(
         self,
         keywords: List[str],
@@ -613,17 +754,13 @@ class GoogleAdsKeywordService:
             logger.info("Falling back to mock data")
             return self._generate_mock_forecast_metrics(keywords, campaign_budget)
     
-    def _generate_historical_cache_key(self, keywords: List[str], language: str, location: str, date_range: Optional[str]) -> str:
+    def _generate_historical_cache_key(self, keywords: List[str], language: str, location: str, date_range: Optional[str]) -> bytes:
         """Generate cache key for historical metrics request."""
-        keywords_str = "|".join(sorted(keywords))
-        cache_input = f"historical|{keywords_str}|{language}|{location}|{date_range or 'default'}|v1"
-        return hashlib.sha256(cache_input.encode()).hexdigest()
+        return _digest_key("historical", *sorted(keywords), language, location, date_range or "default", "v2")
     
-    def _generate_forecast_cache_key(self, keywords: List[str], budget: float, language: str, location: str, strategy: str) -> str:
+    def _generate_forecast_cache_key(self, keywords: List[str], budget: float, language: str, location: str, strategy: str) -> bytes:
         """Generate cache key for forecast metrics request."""
-        keywords_str = "|".join(sorted(keywords))
-        cache_input = f"forecast|{keywords_str}|{budget}|{language}|{location}|{strategy}|v1"
-        return hashlib.sha256(cache_input.encode()).hexdigest()
+        return _digest_key("forecast", *sorted(keywords), str(budget), language, location, strategy, "v2")
     
     def _fetch_historical_metrics(
         self,
@@ -842,6 +979,62 @@ class GoogleAdsKeywordService:
             'budget_utilization': total_cost_micros / (campaign_budget * 1_000_000)
         }
 
+    async def agenerate_keywords_from_url(
+        self,
+        url: str,
+        product_description: Optional[str] = None,
+        language: str = "en",
+        location: str = "2840",  # US by default
+        max_keywords: int = 25
+    ) -> List[Dict[str, Any]]:
+        """
+        Async generate_keywords_from_url for request handlers.
+        
+        In-memory cache hits return without leaving the event loop; anything else
+        (disk cache read, blocking API call) runs in a worker thread.
+        """
+        cached_result = self._get_memory_cached(
+            self._generate_cache_key(url, product_description or "", language, location)
+        )
+        if cached_result:
+            return cached_result[:max_keywords]
+        return await asyncio.to_thread(
+            self.generate_keywords_from_url, url, product_description, language, location, max_keywords
+        )
+    
+    async def aget_historical_metrics(
+        self,
+        keywords: List[str],
+        language: str = "en",
+        location: str = "2840",  # US by default
+        date_range: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Async get_historical_metrics (see agenerate_keywords_from_url)."""
+        cached_result = self._get_memory_cached(
+            self._generate_historical_cache_key(keywords, language, location, date_range)
+        )
+        if cached_result:
+            return cached_result
+        return await asyncio.to_thread(self.get_historical_metrics, keywords, language, location, date_range)
+    
+    async def aget_forecast_metrics(
+        self,
+        keywords: List[str],
+        campaign_budget: float,
+        language: str = "en",
+        location: str = "2840",  # US by default
+        bidding_strategy: str = "manual_cpc"
+    ) -> Dict[str, Any]:
+        """Async get_forecast_metrics (see agenerate_keywords_from_url)."""
+        cached_result = self._get_memory_cached(
+            self._generate_forecast_cache_key(keywords, campaign_budget, language, location, bidding_strategy)
+        )
+        if cached_result:
+            return cached_result
+        return await asyncio.to_thread(
+            self.get_forecast_metrics, keywords, campaign_budget, language, location, bidding_strategy
+        )
+    
     def format_keywords_for_display(
         self,
         keywords: List[Dict[str, Any]]
@@ -0,0 +1,152 @@
+"""
+Query Result Caching
+
+In-process TTL cache for read-mostly tables (users, keyword data, access requests).
+pyodbc does not cache result sets, so repeat lookups are served from here and
+entries are invalidated by the service layer whenever the underlying rows change.
+"""
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Hashable
+
+try:
+    from cachetools import TTLCache
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+
+QUERY_CACHE_SIZE = 10_000
+QUERY_CACHE_TTL_SECONDS = 300
+# User rows sit on the auth path and can change status at any time, so they get a short TTL
+USER_CACHE_TTL_SECONDS = 30
+
+_MISSING = object()
+
+
+class _SimpleTTLCache:
+    """Minimal TTLCache stand-in used when cachetools is not installed"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        return value
+
+    def __setitem__(self, key, value):
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            self._data.popitem(last=False)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def keys(self):
+        return self._data.keys()
+
+    def pop(self, key, default=None):
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+def ttl_cache(maxsize: int, ttl: float):
+    """A TTL-bounded mapping: cachetools.TTLCache when installed, else a minimal stand-in (not thread-safe)"""
+    cache_cls = TTLCache if CACHETOOLS_AVAILABLE else _SimpleTTLCache
+    return cache_cls(maxsize=maxsize, ttl=ttl)
+
+
+class QueryCache:
+    """Thread-safe TTL cache for query results, grouped by table"""
+
+    def __init__(self, maxsize: int = QUERY_CACHE_SIZE, ttl: float = QUERY_CACHE_TTL_SECONDS):
+        self._cache = ttl_cache(maxsize, ttl)
+        self._lock = threading.RLock()
+        # Bumped on invalidation so results computed before a write are not stored
+        self._generations = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, table: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached result for (table, key), calling loader on a miss"""
+        cache_key = (table, key)
+        with self._lock:
+            value = self._cache.get(cache_key, _MISSING)
+            if value is not _MISSING:
+                self.hits += 1
+                return value
+            self.misses += 1
+            generation = self._generations.get(table, 0)
+
+        # Run the query outside the lock so slow reads don't serialize other tables
+        value = loader()
+
+        with self._lock:
+            if self._generations.get(table, 0) == generation:
+                self._cache[cache_key] = value
+        return value
+
+    def invalidate(self, table: str) -> None:
+        """Drop every cached result for a table"""
+        with self._lock:
+            self._generations[table] = self._generations.get(table, 0) + 1
+            for cache_key in [k for k in list(self._cache.keys()) if k[0] == table]:
+                self._cache.pop(cache_key, None)
+
+    def clear(self) -> None:
+        """Drop all cached results"""
+        with self._lock:
+            for table in list(self._generations):
+                self._generations[table] += 1
+            self._cache.clear()
+
+    def stats(self) -> dict:
+        """Cache statistics"""
+        with self._lock:
+            return {"size": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+
+query_cache = QueryCache()
+
+# Tables that need their own TTL; everything else shares query_cache
+_TABLE_CACHES = {
+    "users": QueryCache(ttl=USER_CACHE_TTL_SECONDS),
+}
+
+
+def _cache_for(table: str) -> QueryCache:
+    return _TABLE_CACHES.get(table, query_cache)
+
+
+def cached_query(table: str) -> Callable:
+    """
+    Decorator that caches a read function's result per table
+
+    The cache key is built from the call arguments, so decorated functions
+    must take hashable arguments and return values that callers don't mutate.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+            return _cache_for(table).get_or_load(table, key, lambda: func(*args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def invalidate_table(table: str) -> None:
+    """Invalidate cached results for a table after it has been written"""
+    _cache_for(table).invalidate(table)
@@ -0,0 +1,77 @@
+"""
+Quantized ONNX Sentence Model Build Script
+
+Exports the quality score engine's sentence-transformers model to ONNX and
+applies dynamic int8 quantization into QS_ONNX_MODEL_DIR (default
+models/minilm-int8 next to this script). Requires optimum[onnxruntime].
+
+The quantization config is chosen for the CPU this script runs on, so build
+on (or for) the same CPU family as the servers that load the model.
+"""
+import sys
+import logging
+import platform
+from pathlib import Path
+
+# Add the app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.core.quality_score_engine import ONNX_MODEL_DIR, ONNX_QUANTIZED_FILE, SENTENCE_MODEL_NAME
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def _cpu_flags() -> set:
+    """CPU feature flags of this host (Linux only; empty elsewhere)"""
+    try:
+        with open("/proc/cpuinfo") as cpuinfo:
+            for line in cpuinfo:
+                if line.startswith("flags"):
+                    return set(line.split(":", 1)[1].split())
+    except OSError:
+        pass
+    return set()
+
+def _quantization_config():
+    """Dynamic int8 quantization config matching this host's CPU"""
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+
+    if platform.machine().lower() in ("arm64", "aarch64"):
+        return "arm64", AutoQuantizationConfig.arm64(is_static=False, per_channel=False)
+
+    flags = _cpu_flags()
+    if "avx512_vnni" in flags:
+        return "avx512_vnni", AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+    if "avx512f" in flags:
+        return "avx512", AutoQuantizationConfig.avx512(is_static=False, per_channel=False)
+    # AVX2 kernels run on every x86-64 server CPU of the last decade
+    return "avx2", AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+
+def main():
+    """Export and quantize the sentence model"""
+    try:
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from transformers import AutoTokenizer
+    except ImportError:
+        logger.error("optimum[onnxruntime] is required: pip install optimum[onnxruntime]")
+        sys.exit(1)
+
+    model_path = Path(ONNX_MODEL_DIR)
+    model_id = f"sentence-transformers/{SENTENCE_MODEL_NAME}"
+
+    logger.info(f"Exporting {model_id} to ONNX at {model_path}")
+    model = ORTModelForFeatureExtraction.from_pretrained(model_id, export=True)
+    model.save_pretrained(model_path)
+    AutoTokenizer.from_pretrained(model_id).save_pretrained(model_path)
+
+    target, quantization_config = _quantization_config()
+    logger.info(f"Quantizing to int8 for {target}")
+    ORTQuantizer.from_pretrained(model_path).quantize(save_dir=model_path, quantization_config=quantization_config)
+    logger.info(f"Wrote {model_path / ONNX_QUANTIZED_FILE}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Static Volume Database Build Script
+
+Writes the static keyword volume database used by VolumeEstimationEngine to
+app/core/data/volume_db.npz as parallel arrays. Re-run after editing
+STATIC_VOLUME_ROWS.
+"""
+import sys
+import logging
+from pathlib import Path
+
+import numpy as np
+
+# Add the app directory to Python path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app.core.constants import COMPETITION_LEVELS
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+OUTPUT_PATH = Path(__file__).parent / "app" / "core" / "data" / "volume_db.npz"
+
+# (keyword, monthly_searches, competition, competition_index, avg_cpc, cpc_low, cpc_high)
+STATIC_VOLUME_ROWS = [
+    # Business Services
+    ('plumber', 450000, 'High', 0.8, 8.50, 5.20, 12.80),
+    ('electrician', 320000, 'High', 0.75, 12.30, 8.50, 18.20),
+    ('hvac repair', 180000, 'Medium', 0.65, 15.80, 10.20, 22.50),
+    ('roofing contractor', 95000, 'Medium', 0.60, 18.90, 12.50, 28.40),
+    ('landscaping services', 120000, 'Medium', 0.55, 14.20, 9.80, 20.10),
+
+    # Technology
+    ('web design', 280000, 'High', 0.85, 12.50, 8.20, 18.90),
+    ('seo services', 150000, 'High', 0.80, 25.40, 18.50, 35.20),
+    ('digital marketing', 220000, 'High', 0.75, 18.90, 12.80, 28.50),
+    ('software development', 180000, 'Medium', 0.70, 22.10, 15.60, 31.80),
+    ('mobile app development', 85000, 'Medium', 0.65, 28.90, 20.50, 40.20),
+
+    # Healthcare
+    ('dentist', 380000, 'High', 0.75, 9.80, 6.50, 15.20),
+    ('chiropractor', 120000, 'Medium', 0.60, 11.20, 7.80, 16.90),
+    ('physical therapy', 95000, 'Medium', 0.55, 13.50, 9.20, 19.80),
+    ('mental health counseling', 65000, 'Low', 0.45, 16.80, 11.50, 24.20),
+    ('veterinarian', 150000, 'Medium', 0.65, 8.90, 5.80, 13.50),
+
+    # Legal Services
+    ('personal injury lawyer', 280000, 'High', 0.90, 45.20, 32.80, 68.50),
+    ('divorce lawyer', 180000, 'High', 0.85, 38.90, 28.50, 55.20),
+    ('criminal defense attorney', 120000, 'High', 0.80, 42.10, 30.80, 58.90),
+    ('estate planning lawyer', 85000, 'Medium', 0.70, 35.60, 25.20, 48.90),
+    ('business lawyer', 95000, 'Medium', 0.65, 28.90, 20.50, 40.20),
+
+    # Real Estate
+    ('real estate agent', 320000, 'High', 0.80, 12.50, 8.90, 18.20),
+    ('home inspector', 45000, 'Medium', 0.55, 18.90, 12.80, 28.50),
+    ('property management', 38000, 'Low', 0.50, 15.20, 10.50, 22.80),
+    ('commercial real estate', 25000, 'Medium', 0.60, 22.80, 16.20, 32.50),
+    ('real estate investment', 18000, 'Low', 0.45, 19.50, 13.80, 28.20),
+
+    # Automotive
+    ('auto repair', 280000, 'High', 0.75, 8.90, 6.20, 13.50),
+    ('car insurance', 450000, 'High', 0.85, 12.50, 8.90, 18.20),
+    ('used cars', 680000, 'High', 0.90, 6.80, 4.50, 10.20),
+    ('auto parts', 180000, 'Medium', 0.65, 4.20, 2.80, 6.90),
+    ('car detailing', 65000, 'Medium', 0.55, 9.80, 6.50, 15.20),
+
+    # Food & Restaurant
+    ('restaurant', 520000, 'High', 0.80, 3.20, 2.10, 5.80),
+    ('pizza delivery', 180000, 'High', 0.75, 2.80, 1.90, 4.50),
+    ('catering services', 85000, 'Medium', 0.60, 8.90, 6.20, 13.50),
+    ('food truck', 45000, 'Medium', 0.55, 5.20, 3.50, 8.90),
+    ('bakery', 65000, 'Medium', 0.50, 4.80, 3.20, 7.50),
+
+    # Fitness & Wellness
+    ('gym', 280000, 'High', 0.75, 4.20, 2.80, 6.90),
+    ('personal trainer', 120000, 'Medium', 0.60, 8.90, 6.20, 13.50),
+    ('yoga classes', 85000, 'Medium', 0.55, 6.80, 4.50, 10.20),
+    ('massage therapy', 95000, 'Medium', 0.60, 9.80, 6.50, 15.20),
+    ('nutritionist', 45000, 'Low', 0.45, 12.50, 8.90, 18.20),
+
+    # Education & Training
+    ('online courses', 180000, 'High', 0.80, 8.90, 6.20, 13.50),
+    ('language learning', 150000, 'High', 0.75, 6.80, 4.50, 10.20),
+    ('coding bootcamp', 65000, 'Medium', 0.65, 15.20, 10.50, 22.80),
+    ('music lessons', 85000, 'Medium', 0.55, 9.80, 6.50, 15.20),
+    ('tutoring services', 120000, 'Medium', 0.60, 8.90, 6.20, 13.50),
+
+    # E-commerce
+    ('online shopping', 1200000, 'High', 0.90, 2.10, 1.40, 3.20),
+    ('free shipping', 450000, 'High', 0.85, 1.80, 1.20, 2.80),
+    ('discount codes', 280000, 'High', 0.80, 2.50, 1.70, 3.80),
+    ('product reviews', 180000, 'Medium', 0.70, 1.90, 1.30, 2.90),
+    ('compare prices', 95000, 'Medium', 0.65, 2.20, 1.50, 3.20),
+
+    # Travel & Tourism
+    ('hotel booking', 380000, 'High', 0.85, 3.20, 2.10, 5.80),
+    ('flight deals', 280000, 'High', 0.80, 4.50, 3.00, 6.80),
+    ('vacation rental', 120000, 'Medium', 0.70, 2.80, 1.90, 4.50),
+    ('travel insurance', 65000, 'Medium', 0.60, 5.20, 3.50, 8.90),
+    ('tourist attractions', 85000, 'Low', 0.50, 1.90, 1.30, 2.90),
+
+    # Financial Services
+    ('credit card', 450000, 'High', 0.90, 8.90, 6.20, 13.50),
+    ('mortgage rates', 280000, 'High', 0.85, 12.50, 8.90, 18.20),
+    ('investment advice', 120000, 'High', 0.80, 18.90, 12.80, 28.50),
+    ('tax preparation', 180000, 'High', 0.75, 15.20, 10.50, 22.80),
+    ('insurance quotes', 220000, 'High', 0.80, 8.90, 6.20, 13.50),
+
+    # Home & Garden
+    ('home improvement', 320000, 'High', 0.75, 6.80, 4.50, 10.20),
+    ('furniture', 280000, 'High', 0.80, 4.20, 2.80, 6.90),
+    ('home decor', 180000, 'Medium', 0.70, 3.20, 2.10, 5.80),
+    ('garden supplies', 95000, 'Medium', 0.60, 2.80, 1.90, 4.50),
+    ('cleaning services', 120000, 'Medium', 0.65, 8.90, 6.20, 13.50),
+
+    # Fashion & Beauty
+    ('clothing', 680000, 'High', 0.85, 2.10, 1.40, 3.20),
+    ('shoes', 450000, 'High', 0.80, 2.50, 1.70, 3.80),
+    ('makeup', 280000, 'High', 0.75, 3.20, 2.10, 5.80),
+    ('hair salon', 150000, 'Medium', 0.60, 6.80, 4.50, 10.20),
+    ('nail salon', 85000, 'Medium', 0.55, 5.20, 3.50, 8.90),
+
+    # Generic Business Terms
+    ('near me', 1200000, 'High', 0.90, 1.20, 0.80, 1.80),
+    ('best', 2800000, 'High', 0.95, 0.80, 0.50, 1.20),
+    ('cheap', 1800000, 'High', 0.90, 0.90, 0.60, 1.40),
+    ('affordable', 1200000, 'High', 0.85, 1.10, 0.70, 1.60),
+    ('professional', 850000, 'Medium', 0.70, 2.20, 1.50, 3.20),
+    ('local', 2200000, 'High', 0.90, 0.70, 0.50, 1.00),
+    ('reviews', 1500000, 'High', 0.85, 1.50, 1.00, 2.20),
+    ('services', 3200000, 'High', 0.90, 0.60, 0.40, 0.90),
+    ('company', 2800000, 'High', 0.85, 0.80, 0.50, 1.20),
+    ('business', 2500000, 'High', 0.80, 0.90, 0.60, 1.40),
+]
+
+def main():
+    """Build the static volume database"""
+    competition_code = {level: code for code, level in enumerate(COMPETITION_LEVELS)}
+    keywords, monthly, competition, comp_idx, avg_cpc, cpc_low, cpc_high = zip(*STATIC_VOLUME_ROWS)
+    
+    if len(set(keywords)) != len(keywords):
+        logger.error("Duplicate keywords in STATIC_VOLUME_ROWS")
+        sys.exit(1)
+    
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(
+        OUTPUT_PATH,
+        keywords=np.array(keywords, dtype=np.str_),
+        monthly=np.array(monthly, dtype=np.int64),
+        competition_code=np.array([competition_code[c] for c in competition], dtype=np.uint8),
+        # float64 so reconstructed VolumeData and CPC estimates keep the exact source values
+        comp_idx=np.array(comp_idx, dtype=np.float64),
+        avg_cpc=np.array(avg_cpc, dtype=np.float64),
+        cpc_low=np.array(cpc_low, dtype=np.float64),
+        cpc_high=np.array(cpc_high, dtype=np.float64)
+    )
+    logger.info(f"Wrote {len(keywords)} keywords to {OUTPUT_PATH}")
+
+if __name__ == "__main__":
+    main()
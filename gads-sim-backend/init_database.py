@@ -43,11 +43,12 @@ def main():
     
     try:
         # Initialize database
-        if initialize_database():
+        init_result = initialize_database()
+        if init_result:
             logger.info("Database initialization completed successfully!")
             
-            # Test connection
-            if test_connection():
+            # Test connection (already done by initialize_database unless it created the database)
+            if init_result.connection_verified or test_connection():
                 logger.info("Database connection test passed!")
             else:
                 logger.error("Database connection test failed!")